@@ -0,0 +1,3 @@
+from src.aio import create_async_app
+
+app = create_async_app()
@@ -0,0 +1,183 @@
+"""
+Benchmark sync (gunicorn, workers sync) vs async (uvicorn + app ASGI) con
+la misma cantidad de workers/procesos.
+
+    pip install -r requirements-async.txt
+    python benchmarks/async_vs_sync.py --workers 1 --concurrency 32 --seconds 10
+
+Levanta cada servidor contra una base temporal sembrada (o --db-url, p.ej.
+un Postgres: ahi es donde el round trip de red hace valer el modo async),
+le pega con N conexiones concurrentes a GET /me/watchlist y
+GET /movies/<id>, y reporta requests/s, p50 y p99.
+Con SQLite local el costo es casi todo CPU, asi que la diferencia es chica;
+lo interesante es medirlo contra la base real.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "sync": lambda port, workers: [
+        sys.executable, "-m", "gunicorn", "wsgi:app",
+        "-k", "sync", "-w", str(workers), "-b", f"127.0.0.1:{port}",
+    ],
+    "async": lambda port, workers: [
+        sys.executable, "-m", "uvicorn", "asgi:app",
+        "--workers", str(workers), "--port", str(port), "--log-level", "warning",
+    ],
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _env(db_url: str, bootstrap: bool) -> dict:
+    env = dict(os.environ)
+    env.update(
+        FLASK_ENV="production",
+        DATABASE_URL=db_url,
+        BOOTSTRAP_DB="1" if bootstrap else "0",
+        CATALOG_CACHE_ENABLED="0",  # medir la base, no la cache del catalogo
+        GUNICORN_PRELOAD="0",
+    )
+    return env
+
+
+SEED = """
+from src import create_app
+app = create_app()
+client = app.test_client()
+body = "\\n".join('{"title": "Movie %%d", "genre": "drama", "release_year": 2000}' %% i for i in range(%(movies)d))
+assert client.post("/movies/bulk", data=body).status_code == 200
+for movie_id in range(1, %(entries)d + 1):
+    client.post(f"/watchlist/movies/{movie_id}", headers={"X-User-Id": "1"})
+"""
+
+
+def seed(db_url: str, movies: int, entries: int) -> None:
+    subprocess.run(
+        [sys.executable, "-c", SEED % {"movies": movies, "entries": entries}],
+        cwd=ROOT,
+        env=_env(db_url, bootstrap=True),
+        check=True,
+    )
+
+
+async def _request(port: int, path: str) -> bool:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: bench\r\nX-User-Id: 1\r\nConnection: close\r\n\r\n".encode()
+    )
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    return data.startswith(b"HTTP/1.1 200")
+
+
+async def load(port: int, concurrency: int, seconds: float, movies: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def client(seed_value: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed_value)
+        while time.perf_counter() < deadline:
+            if rng.random() < 0.5:
+                path = "/me/watchlist?limit=20"
+            else:
+                path = f"/movies/{rng.randint(1, movies)}"
+            started = time.perf_counter()
+            try:
+                ok = await _request(port, path)
+            except OSError:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": pick(0.50),
+        "p99_ms": pick(0.99),
+        "errors": errors,
+    }
+
+
+def _wait_ready(port: int, timeout: float = 20.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"el servidor no levanto en el puerto {port}")
+
+
+def run(stack: str, db_url: str, args) -> dict:
+    port = _free_port()
+    proc = subprocess.Popen(
+        SERVERS[stack](port, args.workers),
+        cwd=ROOT,
+        env=_env(db_url, bootstrap=False),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready(port)
+        time.sleep(1)  # que terminen de arrancar todos los workers
+        asyncio.run(load(port, args.concurrency, 1, args.movies))  # calentamiento
+        return asyncio.run(load(port, args.concurrency, args.seconds, args.movies))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=1, help="procesos por servidor (= cores)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--movies", type=int, default=1000)
+    parser.add_argument("--entries", type=int, default=200, help="entradas en la watchlist del usuario 1")
+    parser.add_argument("--db-url", help="base ya creada (se siembra igual); por defecto SQLite temporal")
+    parser.add_argument("--stacks", default="sync,async")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = args.db_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        seed(db_url, args.movies, args.entries)
+
+        print(f"{'stack':<8}{'workers':>8}{'conc':>6}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for stack in args.stacks.split(","):
+            r = run(stack, db_url, args)
+            print(
+                f"{stack:<8}{args.workers:>8}{args.concurrency:>6}{r['rps']:>10.1f}"
+                f"{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Memoria y latencia del indice de autocompletado (PrefixIndex), sin base.
+
+    python benchmarks/autocomplete_memory.py --titles 1000000
+
+Arma el indice con titulos sinteticos de 2 a 4 palabras, reporta los bytes
+del bloque compacto (y el pico de memoria durante el armado, con
+tracemalloc) escalados a un millon de titulos, y mide p50/p99 de busquedas
+por prefijos de 1 a 6 caracteres.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+WORDS = [
+    "star", "wars", "noche", "ciudad", "amor", "guerra", "perdido", "rojo", "mar", "sombra",
+    "último", "viaje", "casa", "tiempo", "fuego", "hielo", "reino", "corazón", "lluvia", "camino",
+]
+
+
+def titles(count: int, rng: random.Random):
+    for i in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(2, 4))]
+        yield ("movie" if i % 4 else "series"), i + 1, " ".join(words).title() + f" {i}"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(ROOT))
+    from src.api.services.autocomplete_service import PrefixIndex, normalize
+
+    rng = random.Random(7)
+    rows = list(titles(args.titles, rng))
+    avg_len = statistics.mean(len(title) for _, _, title in rows)
+
+    started = time.perf_counter()
+    index = PrefixIndex()
+    index.build(rows)
+    build_seconds = time.perf_counter() - started
+
+    # el pico se mide en un segundo armado (tracemalloc lo hace mucho mas lento)
+    tracemalloc.start()
+    PrefixIndex().build(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    block_bytes = index.stats()["block_bytes"]
+    scale = 1_000_000 / args.titles
+    print(f"titulos: {args.titles}  largo medio: {avg_len:.1f} caracteres  armado: {build_seconds:.2f} s")
+    print(f"bloque compacto: {block_bytes / 2**20:.1f} MiB  ({block_bytes / args.titles:.1f} B/titulo)")
+    print(f"por millon de titulos: {block_bytes * scale / 2**20:.1f} MiB residentes, "
+          f"pico durante el armado {peak * scale / 2**20:.1f} MiB")
+
+    print(f"{'prefijo':>8}{'p50 us':>10}{'p99 us':>10}")
+    for length in range(1, 7):
+        timings = []
+        for _ in range(args.queries):
+            _, _, title = rows[rng.randrange(len(rows))]
+            prefix = normalize(title)[:length]
+            t0 = time.perf_counter()
+            index.search(prefix, 10)
+            timings.append((time.perf_counter() - t0) * 1e6)
+        timings.sort()
+        print(f"{length:>8}{statistics.median(timings):>10.1f}{timings[int(0.99 * len(timings))]:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Suite de benchmarks de todas las rutas de movies.py, series.py y progress.py.
+
+    python benchmarks/endpoints.py --output benchmarks/baseline.json
+    python benchmarks/endpoints.py --compare benchmarks/baseline.json
+
+1. Siembra un dataset sintetico en una base temporal (o --db-url vacia, p.ej.
+   un Postgres local): usuarios, peliculas, series con temporadas y entradas
+   de watchlist con popularidad sesgada (Zipf: pocas peliculas/series y pocos
+   usuarios concentran la mayoria de las entradas).
+2. Modo "client": cada escenario --requests veces con el test client de
+   Flask, en serie. Mide req/s, p50/p95/p99 y queries SQL por request.
+3. Modo "http": el mismo mix de escenarios contra un servidor WSGI con hilos
+   (werkzeug) y --threads clientes HTTP concurrentes durante --seconds.
+4. --output guarda los resultados en JSON; --compare los compara contra un
+   baseline y sale con codigo 1 si algo empeoro mas que --tolerance (o si
+   un escenario hace mas queries por request que antes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+# ---------- dataset ----------
+# (src se importa adentro de las funciones: la config lee el entorno al
+# importarse y main() lo arma antes)
+
+def seed(args) -> None:
+    """Carga el dataset con el mismo generador que `flask seed` (src/seed.py)."""
+    from src.seed import seed_dataset
+
+    seed_dataset(
+        users=args.users, movies=args.movies, series=args.series, max_seasons=args.max_seasons,
+        entries=args.entries, series_share=args.series_share, skew=args.skew, seed=args.seed,
+    )
+
+
+class Picker:
+    """Ids existentes (con el mismo sesgo que el dataset) para armar los requests."""
+
+    def __init__(self, db, skew: float, rng: random.Random):
+        from src.models.movie import Movie
+        from src.models.series import Series
+        from src.models.user import User
+        from src.models.watch_entry import WatchEntry
+        from src.seed import Zipf
+
+        ids = lambda model: db.session.scalars(db.select(model.id)).all()  # noqa: E731
+        self.rng = rng
+        self.users = Zipf(ids(User), skew, rng)
+        self.movies = Zipf(ids(Movie), skew, rng)
+        self.series = Zipf(ids(Series), skew, rng)
+        self.series_entries = db.session.execute(
+            db.select(WatchEntry.user_id, WatchEntry.content_id)
+            .where(WatchEntry.content_type == "series")
+            .limit(10_000)
+        ).all()
+        self.created = itertools.count()
+
+    def user(self) -> dict:
+        return {"X-User-Id": str(self.users.pick(self.rng))}
+
+
+# ---------- escenarios ----------
+
+def ndjson(rows: list[dict]) -> bytes:
+    return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+def scenarios(p: Picker, bulk_rows: int) -> list[tuple]:
+    """
+    (nombre, metodo, path(), body(), headers(), statuses esperados, peso en el mix HTTP).
+    Cada callable se evalua por request.
+    """
+    from src.seed import GENRES, title
+
+    rng = p.rng
+    no_headers = lambda: {}  # noqa: E731
+    no_body = lambda: None  # noqa: E731
+
+    def series_progress():
+        user_id, series_id = rng.choice(p.series_entries)
+        body = {"current_season": rng.randint(1, 3), "current_episode": rng.randint(1, 12),
+                "watched_episodes": rng.randint(0, 40), "status": "watching"}
+        return f"/progress/series/{series_id}", body, {"X-User-Id": str(user_id)}
+
+    progress_cases = {}
+
+    def patch_path():
+        progress_cases["next"] = series_progress()
+        return progress_cases["next"][0]
+
+    return [
+        # movies.py
+        ("GET /movies/", "GET", lambda: "/movies/?limit=50", no_body, no_headers, {200}, 10),
+        ("GET /movies/?genre=&sort=", "GET",
+         lambda: f"/movies/?limit=50&genre={rng.choice(GENRES)}&sort=-release_year", no_body, no_headers, {200}, 5),
+        ("GET /movies/<id>", "GET", lambda: f"/movies/{p.movies.pick(rng)}", no_body, no_headers, {200}, 20),
+        ("POST /movies/", "POST", lambda: "/movies/",
+         lambda: {"title": f"bench movie {next(p.created)}", "genre": rng.choice(GENRES), "release_year": 2024},
+         no_headers, {201}, 2),
+        ("POST /movies/bulk", "POST", lambda: "/movies/bulk",
+         lambda: ndjson([{"title": title(rng), "genre": rng.choice(GENRES)} for _ in range(bulk_rows)]),
+         no_headers, {200}, 0),
+        ("GET /movies/export", "GET", lambda: "/movies/export", no_body, no_headers, {200}, 0),
+        # series.py
+        ("GET /series/", "GET", lambda: "/series/?limit=50", no_body, no_headers, {200}, 5),
+        ("GET /series/?include=seasons", "GET", lambda: "/series/?limit=50&include=seasons",
+         no_body, no_headers, {200}, 5),
+        ("GET /series/<id>", "GET", lambda: f"/series/{p.series.pick(rng)}", no_body, no_headers, {200}, 15),
+        ("POST /series/", "POST", lambda: "/series/",
+         lambda: {"title": f"bench series {next(p.created)}", "total_seasons": 1}, no_headers, {201}, 1),
+        ("POST /series/<id>/seasons", "POST", lambda: f"/series/{p.series.pick(rng)}/seasons",
+         lambda: {"number": rng.randint(1, 12), "episodes_count": rng.randint(6, 24)}, no_headers, {201}, 1),
+        ("POST /series/bulk", "POST", lambda: "/series/bulk",
+         lambda: ndjson([{"title": title(rng), "total_seasons": 1} for _ in range(bulk_rows)]),
+         no_headers, {200}, 0),
+        ("GET /series/export", "GET", lambda: "/series/export", no_body, no_headers, {200}, 0),
+        # progress.py
+        ("GET /me/watchlist", "GET", lambda: "/me/watchlist?limit=50", no_body, p.user, {200}, 15),
+        ("GET /me/watchlist?expand=content", "GET", lambda: "/me/watchlist?limit=50&expand=content",
+         no_body, p.user, {200}, 5),
+        ("GET /me/watchlist/export", "GET", lambda: "/me/watchlist/export", no_body, p.user, {200}, 1),
+        # ya estar en la watchlist (400) es un resultado valido
+        ("POST /watchlist/movies/<id>", "POST", lambda: f"/watchlist/movies/{p.movies.pick(rng)}",
+         no_body, p.user, {201, 400}, 3),
+        ("POST /watchlist/series/<id>", "POST", lambda: f"/watchlist/series/{p.series.pick(rng)}",
+         no_body, p.user, {201, 400}, 2),
+        ("PATCH /progress/series/<id>", "PATCH", patch_path,
+         lambda: progress_cases["next"][1], lambda: progress_cases["next"][2], {200}, 5),
+    ]
+
+
+# ---------- medicion ----------
+
+class QueryCounter:
+    """Cuenta los statements SQL de todos los engines de la app."""
+
+    def __init__(self, engines):
+        from sqlalchemy import event
+
+        self.count = 0
+        self._lock = threading.Lock()
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        with self._lock:
+            self.count += 1
+
+
+def summarize(latencies: list[float], elapsed: float, queries: int, errors: int) -> dict:
+    """Metricas de un escenario; latencias en segundos -> ms."""
+    ordered = sorted(latencies)
+    if len(ordered) >= 2:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ordered[0] if ordered else 0.0
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "queries_per_request": round(queries / len(ordered), 2) if ordered else 0.0,
+        "errors": errors,
+    }
+
+
+def run_client(app, cases, counter: QueryCounter, requests: int, export_requests: int, warmup: int) -> dict:
+    """Cada escenario en serie con el test client (incluye leer todo el cuerpo)."""
+    client = app.test_client()
+    results = {}
+    for name, method, path, body, headers, expected, _weight in cases:
+        iterations = export_requests if name.endswith(("export", "bulk")) else requests
+        for _ in range(min(warmup, iterations)):
+            client.open(path(), method=method, **_payload(body()), headers=headers()).get_data()
+
+        latencies, errors, queries = [], 0, 0
+        started = time.perf_counter()
+        for _ in range(iterations):
+            url, payload, extra = path(), _payload(body()), headers()
+            before = counter.count
+            t0 = time.perf_counter()
+            response = client.open(url, method=method, **payload, headers=extra)
+            response.get_data()
+            latencies.append(time.perf_counter() - t0)
+            queries += counter.count - before
+            errors += response.status_code not in expected
+        results[name] = summarize(latencies, time.perf_counter() - started, queries, errors)
+        print(f"  {name:34} {results[name]['rps']:>8} req/s  p50 {results[name]['p50_ms']:>8} ms  "
+              f"p99 {results[name]['p99_ms']:>8} ms  {results[name]['queries_per_request']:>5} q/req"
+              + (f"  {errors} errores" if errors else ""))
+    return results
+
+
+def _payload(body) -> dict:
+    if body is None:
+        return {}
+    if isinstance(body, bytes):
+        return {"data": body, "content_type": "application/x-ndjson"}
+    return {"json": body}
+
+
+def run_http(app, cases, counter: QueryCounter, threads: int, seconds: float) -> dict:
+    """Mix ponderado de escenarios contra un servidor WSGI con hilos, con `threads` clientes."""
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)  # sin una linea por request
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    port = server.server_port
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    weighted = [case for case in cases if case[6]]
+    weights = [case[6] for case in weighted]
+    lock = threading.Lock()  # los callables de los escenarios comparten el rng
+    latencies: dict[str, list[float]] = {case[0]: [] for case in weighted}
+    errors: dict[str, int] = {case[0]: 0 for case in weighted}
+    deadline = time.perf_counter() + seconds
+
+    def worker() -> None:
+        while time.perf_counter() < deadline:
+            with lock:
+                name, method, path, body, headers, expected, _weight = random.choices(weighted, weights)[0]
+                url, payload, extra = path(), body(), headers()
+            data = None
+            if payload is not None:
+                data = json.dumps(payload).encode()
+                extra = {**extra, "Content-Type": "application/json"}
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            t0 = time.perf_counter()
+            try:
+                conn.request(method, url, body=data, headers=extra)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status in expected
+            except OSError:
+                ok = False
+            finally:
+                conn.close()
+            elapsed = time.perf_counter() - t0
+            with lock:
+                latencies[name].append(elapsed)
+                errors[name] += not ok
+
+    before = counter.count
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    result = summarize(all_latencies, elapsed, counter.count - before, sum(errors.values()))
+    result.update(threads=threads, seconds=round(elapsed, 2))
+    # por escenario no hay queries/request: con requests concurrentes no se pueden atribuir
+    result["scenarios"] = {
+        name: {k: v for k, v in summarize(values, elapsed, 0, errors[name]).items() if k != "queries_per_request"}
+        for name, values in latencies.items()
+    }
+    print(f"  {threads} hilos, {result['requests']} requests en {result['seconds']} s: {result['rps']} req/s  "
+          f"p50 {result['p50_ms']} ms  p95 {result['p95_ms']} ms  p99 {result['p99_ms']} ms  "
+          f"{result['queries_per_request']} q/req" + (f"  {result['errors']} errores" if result["errors"] else ""))
+    return result
+
+
+# ---------- comparacion ----------
+
+def compare(current: dict, baseline: dict, tolerance: float, min_ms: float) -> list[str]:
+    """
+    Regresiones de `current` respecto de `baseline`:
+    - p95 mas alto que baseline * (1 + tolerance) y por mas de min_ms (ruido)
+    - req/s mas bajo que baseline * (1 - tolerance)
+    - mas queries SQL por request (esto no es ruido: suele ser un N+1)
+    - errores donde antes no habia
+    """
+    regressions = []
+
+    def check(label: str, now: dict, before: dict) -> None:
+        if now["p95_ms"] > before["p95_ms"] * (1 + tolerance) and now["p95_ms"] - before["p95_ms"] > min_ms:
+            regressions.append(f"{label}: p95 {before['p95_ms']} -> {now['p95_ms']} ms")
+        if before["rps"] and now["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(f"{label}: {before['rps']} -> {now['rps']} req/s")
+        if "queries_per_request" in before and now["queries_per_request"] > before["queries_per_request"] + 0.01:
+            regressions.append(
+                f"{label}: queries/request {before['queries_per_request']} -> {now['queries_per_request']}"
+            )
+        if now["errors"] and not before["errors"]:
+            regressions.append(f"{label}: {now['errors']} errores")
+
+    for name, before in baseline.get("client", {}).items():
+        if name in current.get("client", {}):
+            check(f"client {name}", current["client"][name], before)
+    if baseline.get("http") and current.get("http"):
+        check("http (mix)", current["http"], baseline["http"])
+    return regressions
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    data = parser.add_argument_group("dataset")
+    data.add_argument("--users", type=int, default=2_000)
+    data.add_argument("--movies", type=int, default=20_000)
+    data.add_argument("--series", type=int, default=2_000)
+    data.add_argument("--max-seasons", type=int, default=8, help="temporadas por serie: 1..N")
+    data.add_argument("--entries", type=int, default=50_000, help="entradas de watchlist")
+    data.add_argument("--series-share", type=float, default=0.3, help="fraccion de entradas que son series")
+    data.add_argument("--skew", type=float, default=1.1, help="exponente Zipf de la popularidad")
+    data.add_argument("--seed", type=int, default=42)
+    data.add_argument("--db-url", help="por defecto SQLite temporal (tiene que estar vacia salvo con --reuse)")
+    data.add_argument("--reuse", action="store_true", help="no sembrar: la base de --db-url ya tiene datos")
+
+    run = parser.add_argument_group("corrida")
+    run.add_argument("--mode", choices=["client", "http", "both"], default="both")
+    run.add_argument("--requests", type=int, default=200, help="requests por escenario (modo client)")
+    run.add_argument("--export-requests", type=int, default=5, help="requests de export y bulk (modo client)")
+    run.add_argument("--bulk-rows", type=int, default=100, help="filas por request de bulk")
+    run.add_argument("--warmup", type=int, default=5)
+    run.add_argument("--threads", type=int, default=8, help="clientes concurrentes (modo http)")
+    run.add_argument("--seconds", type=float, default=10.0, help="duracion del modo http")
+    run.add_argument("--no-cache", action="store_true", help="CATALOG_CACHE_ENABLED=0: medir la base")
+
+    out = parser.add_argument_group("resultados")
+    out.add_argument("--output", help="guardar los resultados en este JSON")
+    out.add_argument("--compare", help="baseline JSON contra el que comparar")
+    out.add_argument("--tolerance", type=float, default=0.15, help="cambio relativo tolerado (0.15 = 15%%)")
+    out.add_argument("--min-ms", type=float, default=0.5, help="diferencia de p95 que se considera ruido")
+    args = parser.parse_args(argv)
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ.update(
+        FLASK_ENV="production",
+        DATABASE_URL=args.db_url or f"sqlite:///{os.path.join(tmp.name, 'bench.db')}",
+        BOOTSTRAP_DB="1",
+        AUTOCOMPLETE_PRELOAD="0",
+    )
+    if args.no_cache:
+        os.environ["CATALOG_CACHE_ENABLED"] = "0"
+    sys.path.insert(0, str(ROOT))
+    from src import create_app
+    from src.extensions import db
+
+    app = create_app()
+    rng = random.Random(args.seed)
+    with app.app_context():
+        if not args.reuse:
+            started = time.perf_counter()
+            seed(args)
+            print(f"dataset sembrado en {time.perf_counter() - started:.1f} s")
+        picker = Picker(db, args.skew, rng)
+        counter = QueryCounter(db.engines.values())
+        dialect = db.engine.dialect.name
+
+    cases = scenarios(picker, args.bulk_rows)
+    results = {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "dialect": dialect,
+            "python": platform.python_version(),
+            "dataset": {k: getattr(args, k) for k in
+                        ("users", "movies", "series", "max_seasons", "entries", "series_share", "skew", "seed")},
+            "cache": not args.no_cache,
+        }
+    }
+    if args.mode in ("client", "both"):
+        print("\nmodo client (test client, en serie)")
+        results["client"] = run_client(app, cases, counter, args.requests, args.export_requests, args.warmup)
+    if args.mode in ("http", "both"):
+        print("\nmodo http (servidor WSGI con hilos)")
+        results["http"] = run_http(app, cases, counter, args.threads, args.seconds)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n")
+        print(f"\nresultados en {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get("meta", {}).get("dataset") != results["meta"]["dataset"]:
+            print("\nOJO: el baseline se midio con otro dataset; la comparacion no es confiable")
+        regressions = compare(results, baseline, args.tolerance, args.min_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regresiones contra {args.compare}:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\nsin regresiones contra {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Chequeo de planes: cada filtro/orden de GET /movies/ y GET /series/ tiene
+que resolverse con un indice, no con un recorrido completo de la tabla.
+
+    python benchmarks/explain_filters.py                       # SQLite temporal
+    python benchmarks/explain_filters.py --db-url postgresql://...
+
+Arma la base con create_all (los mismos indices que la migracion
+4e8a1c7d2b90), carga --rows peliculas y series para que el planner tenga
+estadisticas (ANALYZE) y corre EXPLAIN QUERY PLAN (SQLite) / EXPLAIN
+(Postgres) sobre el SQL que generan MovieService/SeriesService. Sale con
+codigo 1 si algun plan no usa el indice esperado o recorre la tabla entera.
+
+Los mismos escenarios corren como tests en tests/test_filters_explain.py
+(SQLite siempre; Postgres con EXPLAIN_TEST_DATABASE_URL).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (nombre, servicio, query args, indice esperado en SQLite, indice esperado en Postgres)
+SCENARIOS = [
+    ("movies ?genre=", "movies", {"genre": "drama"},
+     "ix_movies_genre_created_at_id", "ix_movies_genre_created_at_id"),
+    ("movies ?release_year_min/max=", "movies", {"release_year_min": "1990", "release_year_max": "1991"},
+     "ix_movies_release_year_id", "ix_movies_release_year_id"),
+    ("movies ?title_prefix=", "movies", {"title_prefix": "kalo"},
+     "ix_movies_title_key_id", "ix_movies_title_key_prefix"),
+    ("movies ?sort=title", "movies", {"sort": "title"},
+     "ix_movies_title_key_id", "ix_movies_title_key_id"),
+    ("movies ?sort=-release_year", "movies", {"sort": "-release_year"},
+     "ix_movies_release_year_id", "ix_movies_release_year_id"),
+    ("movies ?sort=-release_year, fase NULL", "movies", {"sort": "-release_year", "cursor": "null"},
+     "ix_movies_release_year_id", "ix_movies_release_year_id"),
+    ("movies ?genre=&sort=-created_at + cursor", "movies", {"genre": "terror", "cursor": True},
+     "ix_movies_genre_created_at_id", "ix_movies_genre_created_at_id"),
+    ("series ?title_prefix=", "series", {"title_prefix": "kalo"},
+     "ix_series_title_key_id", "ix_series_title_key_prefix"),
+    ("series ?sort=title + cursor", "series", {"sort": "title", "cursor": True},
+     "ix_series_title_key_id", "ix_series_title_key_id"),
+]
+
+
+def load(db, Movie, Series, rows: int, rng: random.Random) -> None:
+    from src.seed import GENRES, title
+
+    started = datetime(2020, 1, 1)
+    movies, series = [], []
+    for i in range(rows):
+        created_at = started + timedelta(minutes=i)
+        movies.append({
+            "title": title(rng),
+            "genre": rng.choice(GENRES),
+            "release_year": None if rng.random() < 0.05 else rng.randint(1920, 2024),
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+        series.append({"title": title(rng), "created_at": created_at, "updated_at": created_at})
+        if len(movies) == 10_000:
+            db.session.execute(Movie.__table__.insert(), movies)
+            db.session.execute(Series.__table__.insert(), series)
+            movies.clear()
+            series.clear()
+    if movies:
+        db.session.execute(Movie.__table__.insert(), movies)
+        db.session.execute(Series.__table__.insert(), series)
+    db.session.commit()
+    db.session.execute(db.text("ANALYZE"))
+    db.session.commit()
+
+
+def listing_sql(db, service, model, args: dict) -> str:
+    """SQL (con los valores ya puestos) de una pagina de 20 del listado."""
+    from src.api.pagination import keyset_query
+
+    args = dict(args)
+    wants_cursor = args.pop("cursor", False)
+    filters, sort = service.parse_list_args(args)
+    query = service.filter_query(db.select(model), filters, db.engine.dialect.name)
+
+    cursor = None
+    if wants_cursor == "null":
+        # cursor de la segunda fase (filas sin valor, por id)
+        cursor = (None, 2**31 - 1 if sort.descending else 0)
+    elif wants_cursor:
+        # cursor real: el de la primera pagina
+        rows = db.session.execute(keyset_query(query, model, 20, None, sort)).all()
+        cursor = (rows[-1][1], rows[-1][0].id)
+
+    stmt = keyset_query(query, model, 20, cursor, sort)
+    return str(stmt.compile(dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def explain(db, sql: str) -> str:
+    if db.engine.dialect.name == "sqlite":
+        rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(row[-1] for row in rows)
+    rows = db.session.execute(db.text(f"EXPLAIN {sql}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def full_scan(plan: str, table: str, dialect_name: str) -> bool:
+    if dialect_name == "sqlite":
+        # "SCAN movies" sin indice; "SCAN movies USING INDEX ..." recorre el indice en orden
+        return any(line.strip() == f"SCAN {table}" for line in plan.splitlines())
+    return f"Seq Scan on {table}" in plan
+
+
+def check_plan(db, service, model, table: str, query_args: dict, sqlite_index: str, postgres_index: str):
+    """Devuelve (ok, indice esperado, sql, plan) de un escenario."""
+    dialect_name = db.engine.dialect.name
+    sql = listing_sql(db, service, model, query_args)
+    plan = explain(db, sql)
+    expected = sqlite_index if dialect_name == "sqlite" else postgres_index
+    ok = expected in plan and not full_scan(plan, table, dialect_name)
+    if query_args.get("cursor") and dialect_name == "sqlite":
+        # con cursor tiene que buscar (SEARCH), no recorrer el indice desde el principio
+        ok = ok and f"SEARCH {table} USING INDEX {expected}" in plan
+    return ok, expected, sql, plan
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="peliculas y series a cargar")
+    parser.add_argument("--db-url", help="por defecto SQLite temporal (la base tiene que estar vacia)")
+    parser.add_argument("--verbose", action="store_true", help="mostrar el SQL ademas del plan")
+    args = parser.parse_args(argv)
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ.update(
+        FLASK_ENV="production",
+        DATABASE_URL=args.db_url or f"sqlite:///{os.path.join(tmp.name, 'explain.db')}",
+        BOOTSTRAP_DB="1",
+    )
+    sys.path.insert(0, str(ROOT))
+    from src import create_app
+    from src.api.services import MovieService, SeriesService
+    from src.extensions import db
+    from src.models.movie import Movie
+    from src.models.series import Series
+
+    app = create_app()
+    services = {"movies": (MovieService, Movie), "series": (SeriesService, Series)}
+    failures = 0
+    with app.app_context():
+        load(db, Movie, Series, args.rows, random.Random(42))
+        dialect_name = db.engine.dialect.name
+        print(f"{dialect_name}: {args.rows} filas por tabla\n")
+
+        for name, table, query_args, sqlite_index, postgres_index in SCENARIOS:
+            service, model = services[table]
+            ok, expected, sql, plan = check_plan(db, service, model, table, query_args, sqlite_index, postgres_index)
+            failures += not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {name}  (esperado: {expected})")
+            if args.verbose:
+                print(f"     {sql}")
+            for line in plan.splitlines():
+                print(f"     {line}")
+
+    print(f"\n{len(SCENARIOS) - failures}/{len(SCENARIOS)} planes usan el indice esperado")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Latencia de GET /search sobre un catalogo grande (SQLite + FTS5 por defecto).
+
+    python benchmarks/search_latency.py --titles 1000000
+
+Arma una base temporal con create_all (tablas FTS5 + triggers), inserta
+--titles peliculas con titulos de 2 a 4 palabras tomadas de un vocabulario
+sintetico, y mide p50/p99 de distintas formas de busqueda a traves del
+endpoint (test client: incluye routing, serializacion y JSON).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "da", "fi", "go", "pa", "re", "su"]
+
+
+def vocabulary(size: int, rng: random.Random) -> list[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=200, help="busquedas por escenario")
+    parser.add_argument("--db-url", help="por defecto SQLite temporal")
+    parser.add_argument("--reuse", action="store_true", help="no cargar titulos (la base de --db-url ya los tiene)")
+    args = parser.parse_args(argv)
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ.update(
+        FLASK_ENV="production",
+        DATABASE_URL=args.db_url or f"sqlite:///{os.path.join(tmp.name, 'search.db')}",
+        BOOTSTRAP_DB="1",
+    )
+    sys.path.insert(0, str(ROOT))
+    from src import create_app
+    from src.extensions import db
+    from src.models.movie import Movie
+
+    app = create_app()
+    rng = random.Random(42)
+    words = vocabulary(args.vocabulary, rng)
+
+    started = time.perf_counter()
+    with app.app_context():
+        if args.reuse:
+            args.titles = 0
+        batch = []
+        for i in range(args.titles):
+            title = " ".join(rng.choice(words) for _ in range(rng.randint(2, 4)))
+            batch.append({"title": title, "genre": rng.choice(["drama", "comedia", "terror", "sci-fi"])})
+            if len(batch) == 10_000:
+                db.session.execute(Movie.__table__.insert(), batch)
+                batch.clear()
+        if batch:
+            db.session.execute(Movie.__table__.insert(), batch)
+        db.session.commit()
+    print(f"{args.titles} titulos cargados en {time.perf_counter() - started:.1f} s")
+
+    scenarios = {
+        "1 palabra": lambda: rng.choice(words),
+        "2 palabras": lambda: f"{rng.choice(words)} {rng.choice(words)}",
+        "prefijo 3": lambda: rng.choice(words)[:3],
+        "palabra + prefijo": lambda: f"{rng.choice(words)} {rng.choice(words)[:3]}",
+        "genero + palabra": lambda: f"drama {rng.choice(words)}",
+    }
+    client = app.test_client()
+    print(f"{'escenario':<20}{'p50 ms':>10}{'p99 ms':>10}{'hits/pag':>10}")
+    for name, make_query in scenarios.items():
+        timings, hits = [], []
+        for _ in range(args.queries):
+            q = make_query()
+            t0 = time.perf_counter()
+            response = client.get("/search/", query_string={"q": q, "limit": 20})
+            timings.append((time.perf_counter() - t0) * 1000)
+            hits.append(len(response.get_json()["items"]))
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(0.99 * len(timings)))]
+        print(f"{name:<20}{statistics.median(timings):>10.2f}{p99:>10.2f}{statistics.mean(hits):>10.1f}")
+
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark de concurrencia sobre SQLite: N procesos (como N workers de
+gunicorn) leyendo y escribiendo el mismo archivo, con cada SQLITE_PROFILE.
+
+    python benchmarks/sqlite_concurrency.py --workers 4 --seconds 5
+
+Cada worker arma su propia app con create_app() y usa el test client:
+lecturas = GET /movies/?limit=50 (cache del catalogo apagada),
+escrituras = POST /movies/. Cuenta operaciones por segundo y errores
+("database is locked" y similares) por perfil.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _app_env(db_path: str, profile: str, bootstrap: bool) -> None:
+    # la config se lee del entorno al importar src: hay que fijarlo antes
+    os.environ.update(
+        FLASK_ENV="production",
+        DATABASE_URL=f"sqlite:///{db_path}",
+        SQLITE_PROFILE=profile,
+        CATALOG_CACHE_ENABLED="0",
+        BOOTSTRAP_DB="1" if bootstrap else "0",
+        DB_POOL_PREWARM="0",
+    )
+    sys.path.insert(0, str(ROOT))
+
+
+def _setup(db_path: str, profile: str, rows: int) -> None:
+    _app_env(db_path, profile, bootstrap=True)
+    from src import create_app
+
+    app = create_app()
+    body = "\n".join(f'{{"title": "Movie {i}", "genre": "drama", "release_year": 2000}}' for i in range(rows))
+    response = app.test_client().post("/movies/bulk", data=body)
+    assert response.status_code == 200, response.data
+
+
+def _worker(db_path, profile, seconds, write_ratio, start, results):
+    _app_env(db_path, profile, bootstrap=False)
+    from src import create_app
+
+    app = create_app()
+    client = app.test_client()
+    rng = random.Random(os.getpid())
+    reads = writes = errors = 0
+
+    start.wait()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            if rng.random() < write_ratio:
+                ok = client.post("/movies/", json={"title": "bench"}).status_code == 201
+                writes += ok
+            else:
+                ok = client.get("/movies/?limit=50").status_code == 200
+                reads += ok
+            errors += not ok
+        except Exception:  # noqa: BLE001 - "database is locked" sale como excepcion
+            errors += 1
+    results.put((reads, writes, errors))
+
+
+def run(profile: str, workers: int, seconds: float, write_ratio: float, rows: int) -> dict:
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        setup = ctx.Process(target=_setup, args=(db_path, profile, rows))
+        setup.start()
+        setup.join()
+        if setup.exitcode != 0:
+            raise RuntimeError("fallo el setup del benchmark")
+
+        start = ctx.Event()
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=_worker, args=(db_path, profile, seconds, write_ratio, start, results))
+            for _ in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        time.sleep(2)  # que todos terminen de importar antes de medir
+        start.set()
+        totals = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+    reads, writes, errors = (sum(col) for col in zip(*totals))
+    return {
+        "profile": profile,
+        "workers": workers,
+        "reads_per_s": reads / seconds,
+        "writes_per_s": writes / seconds,
+        "errors": errors,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--rows", type=int, default=2000, help="peliculas precargadas")
+    parser.add_argument("--profiles", default="default,concurrent")
+    args = parser.parse_args(argv)
+
+    print(f"{'profile':<12}{'workers':>8}{'reads/s':>12}{'writes/s':>12}{'errors':>8}")
+    for profile in args.profiles.split(","):
+        r = run(profile, args.workers, args.seconds, args.write_ratio, args.rows)
+        print(
+            f"{r['profile']:<12}{r['workers']:>8}{r['reads_per_s']:>12.1f}"
+            f"{r['writes_per_s']:>12.1f}{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Configuracion de gunicorn (se carga sola desde el directorio de trabajo).
+
+GUNICORN_PRELOAD=1 carga la app una sola vez en el master (preload_app)
+y los workers la heredan por fork: arrancan casi al instante.
+Con METRICS_DIR los workers comparten las metricas de /metrics en ese
+directorio (ver src/metrics.py).
+"""
+
+import glob
+import os
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "0") == "1"
+metrics_dir = os.getenv("METRICS_DIR", "")
+
+
+# los hooks del master no importan `src`: sin preload, el master no carga
+# la app (y un HUP romperia el import en los workers nuevos)
+
+
+def on_starting(server):
+    # metricas de una corrida anterior: los contadores arrancan de cero
+    for path in glob.glob(os.path.join(metrics_dir, "*.json")) if metrics_dir else ():
+        os.remove(path)
+
+
+def when_ready(server):
+    # con preload, el indice de autocompletado se arma una vez en el master:
+    # los workers lo heredan y comparten sus paginas (copy-on-write)
+    if server.cfg.preload_app:
+        from src.bootstrap import warm_autocomplete
+
+        warm_autocomplete(server.app.wsgi())
+
+
+def post_fork(server, worker):
+    # con preload, el engine vino del master: descartamos su pool
+    if server.cfg.preload_app:
+        from src.bootstrap import after_fork
+
+        after_fork(server.app.wsgi())
+
+
+def post_worker_init(worker):
+    from src.bootstrap import prewarm_pool, warm_autocomplete
+
+    app = worker.wsgi
+    opened = prewarm_pool(app)
+    warm_autocomplete(app)  # no hace nada si ya vino del master
+    timings = app.extensions.get("boot_timings", {})
+    worker.log.info(
+        "Worker %s listo: imports %.0f ms, create_app %.0f ms, %s conexiones precalentadas",
+        worker.pid,
+        timings.get("import_seconds", 0) * 1000,
+        timings.get("create_app_seconds", 0) * 1000,
+        opened,
+    )
+
+
+def child_exit(server, worker):
+    # worker muerto: su archivo sale de /metrics (Prometheus ve un reset)
+    if not metrics_dir:
+        return
+    path = os.path.join(metrics_dir, f"{worker.pid}.json")
+    for stale in (path, f"{path}.tmp"):  # .tmp si murio a mitad de un volcado
+        try:
+            os.remove(stale)
+        except FileNotFoundError:
+            pass
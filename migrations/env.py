@@ -45,6 +45,17 @@ target_db = current_app.extensions['migrate'].db
 # ... etc.
 
 
+# indices de busqueda que no estan en los modelos (ver src/models/search.py):
+# tablas FTS5 de SQLite (y sus tablas internas _data, _idx, ...) e indices GIN
+SEARCH_OBJECT_PREFIXES = ('movies_fts', 'series_fts', 'ix_movies_search', 'ix_series_search')
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if reflected and compare_to is None and name and name.startswith(SEARCH_OBJECT_PREFIXES):
+        return False
+    return True
+
+
 def get_metadata():
     if hasattr(target_db, 'metadatas'):
         return target_db.metadatas[None]
@@ -65,7 +76,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -93,6 +105,7 @@ def run_migrations_online():
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
+    conf_args.setdefault("include_object", include_object)
 
     connectable = get_engine()
 
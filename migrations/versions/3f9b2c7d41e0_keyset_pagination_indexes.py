@@ -0,0 +1,38 @@
+"""keyset pagination indexes
+
+Revision ID: 3f9b2c7d41e0
+Revises: a1a8c94b2f13
+Create Date: 2026-10-18 10:12:41.305118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9b2c7d41e0'
+down_revision = 'a1a8c94b2f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.create_index('ix_movies_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('series', schema=None) as batch_op:
+        batch_op.create_index('ix_series_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('watch_entries', schema=None) as batch_op:
+        batch_op.create_index('ix_watch_entries_user_created_id', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('watch_entries', schema=None) as batch_op:
+        batch_op.drop_index('ix_watch_entries_user_created_id')
+
+    with op.batch_alter_table('series', schema=None) as batch_op:
+        batch_op.drop_index('ix_series_created_at_id')
+
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.drop_index('ix_movies_created_at_id')
@@ -0,0 +1,50 @@
+"""listing filter indexes
+
+Indices para los filtros y ordenes de GET /movies/ y GET /series/
+(?genre=, ?release_year_min/max=, ?title_prefix=, ?sort=).
+Solo crea indices: en SQLite el batch no recrea las tablas, asi que los
+triggers de FTS5 de 9b3e5d71c2a4 siguen en su lugar.
+
+Revision ID: 4e8a1c7d2b90
+Revises: 9b3e5d71c2a4
+Create Date: 2026-10-18 21:37:52.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e8a1c7d2b90'
+down_revision = '9b3e5d71c2a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.create_index('ix_movies_genre_created_at_id', ['genre', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_movies_release_year_id', ['release_year', 'id'], unique=False)
+        batch_op.create_index('ix_movies_title_key_id', [sa.text('lower(title)'), 'id'], unique=False)
+
+    with op.batch_alter_table('series', schema=None) as batch_op:
+        batch_op.create_index('ix_series_title_key_id', [sa.text('lower(title)'), 'id'], unique=False)
+
+    # LIKE 'abc%' en Postgres necesita text_pattern_ops (ver src/api/filters.py)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_movies_title_key_prefix', 'movies', [sa.text('lower(title) text_pattern_ops')])
+        op.create_index('ix_series_title_key_prefix', 'series', [sa.text('lower(title) text_pattern_ops')])
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_series_title_key_prefix', table_name='series')
+        op.drop_index('ix_movies_title_key_prefix', table_name='movies')
+
+    with op.batch_alter_table('series', schema=None) as batch_op:
+        batch_op.drop_index('ix_series_title_key_id')
+
+    with op.batch_alter_table('movies', schema=None) as batch_op:
+        batch_op.drop_index('ix_movies_title_key_id')
+        batch_op.drop_index('ix_movies_release_year_id')
+        batch_op.drop_index('ix_movies_genre_created_at_id')
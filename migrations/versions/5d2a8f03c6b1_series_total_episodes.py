@@ -0,0 +1,54 @@
+"""series total_episodes
+
+Revision ID: 5d2a8f03c6b1
+Revises: 8c4e6a1b9d27
+Create Date: 2026-10-18 11:40:52.907134
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2a8f03c6b1'
+down_revision = '8c4e6a1b9d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('series', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_episodes', sa.Integer(), server_default='0', nullable=False))
+
+    # backfill: suma de episodios declarados en las seasons de cada serie
+    op.execute(
+        """
+        UPDATE series
+        SET total_episodes = (
+            SELECT COALESCE(SUM(seasons.episodes_count), 0)
+            FROM seasons
+            WHERE seasons.series_id = series.id
+        )
+        """
+    )
+
+    # las watch_entries de series quedaban con el total del momento del alta
+    op.execute(
+        """
+        UPDATE watch_entries
+        SET total_episodes = (
+            SELECT series.total_episodes
+            FROM series
+            WHERE series.id = watch_entries.content_id
+        )
+        WHERE content_type = 'series'
+          AND EXISTS (
+            SELECT 1 FROM series WHERE series.id = watch_entries.content_id
+          )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('series', schema=None) as batch_op:
+        batch_op.drop_column('total_episodes')
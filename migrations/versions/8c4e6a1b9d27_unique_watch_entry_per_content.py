@@ -0,0 +1,42 @@
+"""unique watch entry per user and content
+
+Revision ID: 8c4e6a1b9d27
+Revises: 3f9b2c7d41e0
+Create Date: 2026-10-18 11:02:17.418260
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e6a1b9d27'
+down_revision = '3f9b2c7d41e0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # El check-then-insert anterior podia dejar duplicados con clicks
+    # concurrentes. Nos quedamos con la entrada mas nueva de cada grupo
+    # (la misma que devolvia _find_watch_entry) antes de crear el indice.
+    op.execute(
+        """
+        DELETE FROM watch_entries
+        WHERE id NOT IN (
+            SELECT max_id FROM (
+                SELECT MAX(id) AS max_id
+                FROM watch_entries
+                GROUP BY user_id, content_type, content_id
+            ) AS keep
+        )
+        """
+    )
+
+    with op.batch_alter_table('watch_entries', schema=None) as batch_op:
+        batch_op.create_index('uq_watch_entries_user_content', ['user_id', 'content_type', 'content_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('watch_entries', schema=None) as batch_op:
+        batch_op.drop_index('uq_watch_entries_user_content')
@@ -0,0 +1,80 @@
+"""title search indexes
+
+FTS5 (SQLite) / GIN tsvector (Postgres) para GET /search.
+Ojo en SQLite: un batch_alter_table que recree movies o series borra sus
+triggers; esa migracion tiene que volver a crearlos.
+
+Revision ID: 9b3e5d71c2a4
+Revises: e2f7a3c85b19
+Create Date: 2026-10-18 20:02:11.418305
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3e5d71c2a4'
+down_revision = 'e2f7a3c85b19'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE movies_fts USING fts5(title, genre, content='movies', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER movies_fts_ai AFTER INSERT ON movies BEGIN "
+    "INSERT INTO movies_fts(rowid, title, genre) VALUES (new.id, new.title, new.genre); END",
+    "CREATE TRIGGER movies_fts_ad AFTER DELETE ON movies BEGIN "
+    "INSERT INTO movies_fts(movies_fts, rowid, title, genre) VALUES ('delete', old.id, old.title, old.genre); END",
+    "CREATE TRIGGER movies_fts_au AFTER UPDATE OF title, genre ON movies BEGIN "
+    "INSERT INTO movies_fts(movies_fts, rowid, title, genre) VALUES ('delete', old.id, old.title, old.genre); "
+    "INSERT INTO movies_fts(rowid, title, genre) VALUES (new.id, new.title, new.genre); END",
+    "INSERT INTO movies_fts(movies_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE series_fts USING fts5(title, content='series', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER series_fts_ai AFTER INSERT ON series BEGIN "
+    "INSERT INTO series_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER series_fts_ad AFTER DELETE ON series BEGIN "
+    "INSERT INTO series_fts(series_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER series_fts_au AFTER UPDATE OF title ON series BEGIN "
+    "INSERT INTO series_fts(series_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO series_fts(rowid, title) VALUES (new.id, new.title); END",
+    "INSERT INTO series_fts(series_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS series_fts_au",
+    "DROP TRIGGER IF EXISTS series_fts_ad",
+    "DROP TRIGGER IF EXISTS series_fts_ai",
+    "DROP TABLE IF EXISTS series_fts",
+    "DROP TRIGGER IF EXISTS movies_fts_au",
+    "DROP TRIGGER IF EXISTS movies_fts_ad",
+    "DROP TRIGGER IF EXISTS movies_fts_ai",
+    "DROP TABLE IF EXISTS movies_fts",
+]
+
+POSTGRES_UPGRADE = [
+    "CREATE INDEX ix_movies_search ON movies USING gin (("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(genre, '')), 'B')))",
+    "CREATE INDEX ix_series_search ON series USING gin (("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A')))",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_series_search",
+    "DROP INDEX IF EXISTS ix_movies_search",
+]
+
+
+def _run(statements_by_dialect):
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade():
+    _run({"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE})
+
+
+def downgrade():
+    _run({"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRES_DOWNGRADE})
@@ -0,0 +1,26 @@
+"""seasons series_id index
+
+Revision ID: c71e5b94a0d8
+Revises: 5d2a8f03c6b1
+Create Date: 2026-10-18 12:15:06.772419
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71e5b94a0d8'
+down_revision = '5d2a8f03c6b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('seasons', schema=None) as batch_op:
+        batch_op.create_index('ix_seasons_series_id_number', ['series_id', 'number'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('seasons', schema=None) as batch_op:
+        batch_op.drop_index('ix_seasons_series_id_number')
@@ -0,0 +1,41 @@
+"""updated_at for conditional gets
+
+Revision ID: e2f7a3c85b19
+Revises: c71e5b94a0d8
+Create Date: 2026-10-18 13:05:33.120947
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f7a3c85b19'
+down_revision = 'c71e5b94a0d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ('movies', 'series'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+        op.execute(f"UPDATE {table} SET updated_at = created_at")
+
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+            batch_op.create_index(f'ix_{table}_updated_at', ['updated_at'], unique=False)
+
+    with op.batch_alter_table('watch_entries', schema=None) as batch_op:
+        batch_op.create_index('ix_watch_entries_user_updated_at', ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('watch_entries', schema=None) as batch_op:
+        batch_op.drop_index('ix_watch_entries_user_updated_at')
+
+    for table in ('series', 'movies'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{table}_updated_at')
+            batch_op.drop_column('updated_at')
@@ -1,18 +1,25 @@
 """Application Factory principal de WatchLog API."""
 
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import os
 from flask import Flask
 from src.config import config_by_name  # seguimos usando tu config_by_name
 from src.extensions import db, migrate
+from src.engine import build_engine_options, install_engine_events
+from src.metrics import init_metrics
+from src.profiling import init_profiling
+from src.query_guard import init_query_guard
+from src.routing import configure_replica, init_replica_routing
+from src.json_provider import init_json_provider
 from src.api import register_api_blueprints
+from src.bootstrap import bootstrap_database
+from src.cli import register_cli
 
-# Importa los modelos para que SQLAlchemy conozca las tablas
-# (si no los importamos aquí, db.create_all() no las ve)
-from src.models.user import User
-from src.models.movie import Movie
-from src.models.series import Series
-from src.models.seasons import Season
-from src.models.watch_entry import WatchEntry
+# tiempo de importar flask, sqlalchemy y los modulos base de la app
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
 
 
 def create_app() -> Flask:
@@ -23,6 +30,7 @@ def create_app() -> Flask:
     - flask db (migraciones)
     - gunicorn en Render (wsgi.py)
     """
+    started = time.perf_counter()
 
     app = Flask(__name__)
 
@@ -31,28 +39,43 @@ def create_app() -> Flask:
     env_name = os.getenv("FLASK_ENV", "development")
     app.config.from_object(config_by_name[env_name])
 
-    # 2. Inicializar extensiones compartidas
+    # 2. Inicializar extensiones compartidas.
+    #    Las opciones del pool salen de las variables DB_* salvo que la
+    #    config ya traiga SQLALCHEMY_ENGINE_OPTIONS propias.
+    #    DATABASE_REPLICA_URL agrega el bind "replica" para los GET.
+    if "SQLALCHEMY_ENGINE_OPTIONS" not in app.config:
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = build_engine_options(app.config)
+    configure_replica(app)
     db.init_app(app)
+    install_engine_events(app)
+    init_query_guard(app)  # solo con DEBUG/TESTING (QUERY_GUARD)
+    init_metrics(app)  # antes que otros hooks: mide el request entero
+    init_profiling(app)  # solo con PROFILING_ENABLED
+    init_replica_routing(app)
     migrate.init_app(app, db)
+    init_json_provider(app)  # orjson si esta instalado
 
     # 3. Registrar blueprints (/movies, /series, /progress, /health...)
+    #    y comandos del CLI (flask seed-demo-user, ...)
     register_api_blueprints(app)
+    register_cli(app)
+
+    # 4. Crear tablas + sembrar usuario demo (BOOTSTRAP_DB).
+    #    Cómodo en local y en tests; en producción queda apagado: el esquema
+    #    lo aplica `flask db upgrade`, la semilla `flask seed-demo-user`, y
+    #    los workers arrancan sin tocar la base.
+    if app.config["BOOTSTRAP_DB"]:
+        bootstrap_database(app)
 
-    # 4. (Render-friendly) Crear tablas + sembrar usuario demo
-    #    Esto corre en cada arranque. En local no molesta,
-    #    y en Render nos garantiza que exista app.db y user id=1.
-    with app.app_context():
-        db.create_all()
-
-        # Semilla mínima: usuario con id=1 para usar X-User-Id: 1
-        if db.session.get(User, 1) is None:
-            demo_user = User(
-                id=1,
-                name="Demo",
-                email="demo@example.com",
-            )
-            db.session.add(demo_user)
-            db.session.commit()
+    app.extensions["boot_timings"] = {
+        "import_seconds": round(IMPORT_SECONDS, 4),
+        "create_app_seconds": round(time.perf_counter() - started, 4),
+    }
+    app.logger.info(
+        "WatchLog lista: imports %.1f ms, create_app %.1f ms",
+        IMPORT_SECONDS * 1000,
+        app.extensions["boot_timings"]["create_app_seconds"] * 1000,
+    )
 
     return app
 
@@ -0,0 +1,58 @@
+"""
+App ASGI (Quart + SQLAlchemy asyncio) para el catalogo y la watchlist.
+
+Misma config que la app Flask (FLASK_ENV / variables de entorno); el punto
+de entrada es asgi.py (dependencias en requirements-async.txt):
+
+    uvicorn asgi:app --workers 2
+"""
+
+from __future__ import annotations
+
+import os
+
+from quart import Quart
+
+from src.aio.database import async_db
+from src.config import config_by_name
+from src.json_provider import init_json_provider
+
+
+def create_async_app() -> Quart:
+    app = Quart(__name__)
+
+    env_name = os.getenv("FLASK_ENV", "development")
+    app.config.from_object(config_by_name[env_name])
+
+    async_db.init_app(app)
+    init_json_provider(app)
+
+    from src.aio.api import health_bp, movies_bp, progress_bp, series_bp
+
+    app.register_blueprint(health_bp)
+    app.register_blueprint(movies_bp)
+    app.register_blueprint(progress_bp)
+    app.register_blueprint(series_bp)
+
+    if app.config["BOOTSTRAP_DB"]:
+        app.before_serving(_bootstrap_database)
+
+    return app
+
+
+async def _bootstrap_database() -> None:
+    """create_all + usuario demo, como bootstrap_database en la app sync."""
+    import src.models  # noqa: F401
+    from src.extensions import db
+    from src.models.user import User
+
+    async with async_db.engine.begin() as conn:
+        await conn.run_sync(db.metadata.create_all)
+
+    async with async_db.sessionmaker() as session:
+        if await session.get(User, 1) is None:
+            session.add(User(id=1, name="Demo", email="demo@example.com"))
+            await session.commit()
+
+
+__all__ = ["create_async_app"]
@@ -0,0 +1,219 @@
+"""
+Rutas async (Quart) del catalogo y la watchlist.
+
+Mismos paths, validaciones, ETags y forma de respuesta que los blueprints
+sync de src/api. Las cargas masivas, exportaciones y temporadas siguen
+solo en la app WSGI.
+"""
+
+from __future__ import annotations
+
+from quart import Blueprint, Response, current_app, jsonify, request
+
+from src.aio.database import async_db
+from src.aio.services import AsyncMovieService, AsyncProgressService, AsyncSeriesService
+from src.api.conditional import Validators
+from src.api.pagination import page_payload, parse_page_args
+from src.api.progress import parse_user_id
+from src.api.services import MovieService, SeriesService
+
+health_bp = Blueprint("health", __name__, url_prefix="/health")
+movies_bp = Blueprint("movies", __name__, url_prefix="/movies")
+series_bp = Blueprint("series", __name__, url_prefix="/series")
+progress_bp = Blueprint("progress", __name__)
+
+
+def _conditional(resource: str, *versions):
+    """(validators, respuesta 304 o None) para el request actual."""
+    validators = Validators.build(resource, *versions, req=request)
+    return validators, validators.not_modified(request, Response)
+
+
+def _split_param(name: str) -> set[str]:
+    return {part.strip() for part in request.args.get(name, "").split(",")}
+
+
+@health_bp.get("/")
+async def healthcheck():
+    """Readiness: SELECT 1 contra la base, como GET /health/ de la app sync (503 si falla)."""
+    database = await async_db.ping(current_app.config["HEALTH_CACHE_SECONDS"])
+    problems = [] if database["ok"] else [f"base default: {database['error']}"]
+    report = {"status": "fail" if problems else "ok", "problems": problems, "database": {"default": database}}
+    return jsonify(report), 503 if problems else 200
+
+
+#
+# PELÍCULAS
+#
+@movies_bp.get("/")
+async def list_movies():
+    try:
+        filters, sort = MovieService.parse_list_args(request.args)
+        limit, cursor = parse_page_args(request.args, current_app.config, sort.decode_cursor)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    validators, not_modified = _conditional("movies", await AsyncMovieService.collection_version())
+    if not_modified is not None:
+        return not_modified
+
+    movies, next_cursor = await AsyncMovieService.list_page(limit, cursor, filters, sort)
+    payload = page_payload([m.to_dict() for m in movies], next_cursor)
+    return validators.apply(jsonify(payload)), 200
+
+
+@movies_bp.post("/")
+async def create_movie():
+    data = await request.get_json(silent=True) or {}
+    try:
+        movie = await AsyncMovieService.create(data)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+    return jsonify(movie.to_dict()), 201
+
+
+@movies_bp.get("/<int:movie_id>")
+async def retrieve_movie(movie_id: int):
+    movie = await AsyncMovieService.get(movie_id)
+    if movie is None:
+        return jsonify({"detail": f"Movie {movie_id} not found"}), 404
+
+    validators, not_modified = _conditional(f"movie:{movie_id}", movie.updated_at)
+    if not_modified is not None:
+        return not_modified
+    return validators.apply(jsonify(movie.to_dict())), 200
+
+
+#
+# SERIES
+#
+@series_bp.get("/")
+async def list_series():
+    try:
+        filters, sort = SeriesService.parse_list_args(request.args)
+        limit, cursor = parse_page_args(request.args, current_app.config, sort.decode_cursor)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    validators, not_modified = _conditional("series", await AsyncSeriesService.collection_version())
+    if not_modified is not None:
+        return not_modified
+
+    series_list, next_cursor = await AsyncSeriesService.list_page(limit, cursor, filters, sort)
+    if "seasons" in _split_param("include"):
+        seasons = await AsyncSeriesService.load_seasons(series_list)
+        items = [s.to_dict(include_seasons=True, seasons=seasons[s.id]) for s in series_list]
+    else:
+        items = [s.to_dict(include_seasons=False) for s in series_list]
+
+    return validators.apply(jsonify(page_payload(items, next_cursor))), 200
+
+
+@series_bp.post("/")
+async def create_series():
+    data = await request.get_json(silent=True) or {}
+    try:
+        series = await AsyncSeriesService.create(data)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+    return jsonify(series.to_dict(include_seasons=False)), 201
+
+
+@series_bp.get("/<int:series_id>")
+async def get_series(series_id: int):
+    found = await AsyncSeriesService.get_with_seasons(series_id)
+    if found is None:
+        return jsonify({"detail": f"Series {series_id} not found"}), 404
+
+    series, seasons = found
+    validators, not_modified = _conditional(f"series:{series_id}", series.updated_at)
+    if not_modified is not None:
+        return not_modified
+    return validators.apply(jsonify(series.to_dict(include_seasons=True, seasons=seasons))), 200
+
+
+#
+# WATCHLIST / PROGRESO
+#
+@progress_bp.get("/me/watchlist")
+async def get_my_watchlist():
+    try:
+        user_id = parse_user_id(request.headers.get("X-User-Id"))
+        limit, cursor = parse_page_args(request.args, current_app.config)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    expand = _split_param("expand")
+    versions = [await AsyncProgressService.watchlist_version(user_id)]
+    if "content" in expand:
+        versions += [
+            await AsyncMovieService.collection_version(),
+            await AsyncSeriesService.collection_version(),
+        ]
+    validators, not_modified = _conditional(f"watchlist:{user_id}", *versions)
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        entries, next_cursor = await AsyncProgressService.list_user_watchlist_page(
+            user_id, limit, cursor
+        )
+    except LookupError as e:
+        return jsonify({"detail": str(e)}), 404
+
+    if "content" in expand:
+        contents = await AsyncProgressService.load_contents(entries)
+        payload = [
+            entry.to_dict(
+                include_user=False,
+                include_content=True,
+                content=contents.get((entry.content_type, entry.content_id)),
+            )
+            for entry in entries
+        ]
+    else:
+        payload = [entry.to_dict(include_user=False) for entry in entries]
+
+    return validators.apply(jsonify(page_payload(payload, next_cursor))), 200
+
+
+async def _add_to_watchlist(add, content_id: int):
+    try:
+        user_id = parse_user_id(request.headers.get("X-User-Id"))
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    try:
+        entry = await add(user_id, content_id)
+        return jsonify(entry.to_dict(include_user=False)), 201
+    except LookupError as e:
+        return jsonify({"detail": str(e)}), 404
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+
+@progress_bp.post("/watchlist/movies/<int:movie_id>")
+async def add_movie_to_watchlist(movie_id: int):
+    return await _add_to_watchlist(AsyncProgressService.add_movie, movie_id)
+
+
+@progress_bp.post("/watchlist/series/<int:series_id>")
+async def add_series_to_watchlist(series_id: int):
+    return await _add_to_watchlist(AsyncProgressService.add_series, series_id)
+
+
+@progress_bp.patch("/progress/series/<int:series_id>")
+async def update_series_progress(series_id: int):
+    try:
+        user_id = parse_user_id(request.headers.get("X-User-Id"))
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    data = await request.get_json(silent=True) or {}
+    try:
+        entry = await AsyncProgressService.update_series_progress(user_id, series_id, data)
+        return jsonify(entry.to_dict(include_user=False)), 200
+    except LookupError as e:
+        return jsonify({"detail": str(e)}), 404
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
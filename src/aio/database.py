@@ -0,0 +1,124 @@
+"""
+Engine asyncio de SQLAlchemy para la app ASGI.
+
+Usa la misma DATABASE_URL que la app sync, cambiando el driver por uno
+async (aiosqlite / asyncpg), y las mismas variables DB_* / SQLITE_*.
+Cada request tiene su AsyncSession (async_db.session), que se cierra al
+terminar el contexto de la app.
+"""
+
+from __future__ import annotations
+
+import time
+
+from quart import Quart, g
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.engine import (
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    build_engine_options,
+    configure_engine,
+)
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str):
+    """sqlite:///... -> sqlite+aiosqlite:///..., postgresql://... -> postgresql+asyncpg://..."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No hay driver async configurado para {backend!r}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def async_engine_options(config) -> dict:
+    """
+    build_engine_options traducido al engine async:
+    - el pool de colas pasa a TimedAsyncQueuePool
+    - statement_timeout via server_settings de asyncpg (no hay "-c options")
+    - con PgBouncer se apaga la cache de prepared statements de asyncpg
+    - SQLite en memoria comparte una unica conexion (StaticPool)
+    """
+    url = to_async_url(config["SQLALCHEMY_DATABASE_URI"])
+    options = build_engine_options(config)
+    options.pop("connect_args", None)
+
+    if url.get_backend_name() == "sqlite":
+        if not url.database or url.database == ":memory:":
+            options["poolclass"] = StaticPool
+        return options
+
+    if options.get("poolclass") is TimedQueuePool:
+        options["poolclass"] = TimedAsyncQueuePool
+
+    timeout_ms = config["DB_STATEMENT_TIMEOUT_MS"]
+    if config["DB_PGBOUNCER"]:
+        options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    elif timeout_ms:
+        options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout_ms)}}
+    return options
+
+
+class AsyncDatabase:
+    """Equivalente minimo de `db` (Flask-SQLAlchemy) para la app ASGI."""
+
+    def __init__(self):
+        self.engine = None
+        self.sessionmaker: async_sessionmaker[AsyncSession] | None = None
+        self._ping_result: dict | None = None
+        self._ping_at = 0.0
+
+    def init_app(self, app: Quart) -> None:
+        self.engine = create_async_engine(
+            to_async_url(app.config["SQLALCHEMY_DATABASE_URI"]),
+            **async_engine_options(app.config),
+        )
+        configure_engine(self.engine.sync_engine, app.config)
+        # expire_on_commit=False: los objetos se serializan despues del commit
+        self.sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+        self._ping_result = None
+
+        app.extensions["async_db"] = self
+        app.teardown_appcontext(self._close_session)
+        app.after_serving(self.dispose)
+
+    @property
+    def session(self) -> AsyncSession:
+        """AsyncSession del request actual (se crea la primera vez)."""
+        session = g.get("async_session")
+        if session is None:
+            session = g.async_session = self.sessionmaker()
+        return session
+
+    async def ping(self, max_age: float = 0) -> dict:
+        """SELECT 1 como _ping de src/health.py, cacheado max_age segundos."""
+        if self._ping_result is not None and time.monotonic() - self._ping_at < max_age:
+            return self._ping_result
+        started = time.perf_counter()
+        try:
+            async with self.engine.connect() as connection:
+                await connection.exec_driver_sql("SELECT 1")
+            result = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+        except Exception as exc:  # cualquier falla del driver es "no responde"
+            result = {"ok": False, "error": f"{type(exc).__name__}: {exc}"[:200]}
+        self._ping_result, self._ping_at = result, time.monotonic()
+        return result
+
+    async def _close_session(self, exc=None) -> None:
+        session = g.pop("async_session", None)
+        if session is not None:
+            await session.close()
+
+    async def dispose(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+
+
+async_db = AsyncDatabase()
@@ -0,0 +1,222 @@
+"""
+Version async de los servicios, para la app ASGI.
+
+Mismas reglas y mismo SQL que src/api/services (validate, keyset, el
+INSERT ... SELECT ... ON CONFLICT de la watchlist); lo unico que cambia es
+que los queries se esperan con la AsyncSession del request.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from src.aio.database import async_db
+from src.api.pagination import keyset_query, null_fill_query, split_page
+from src.api.services.movie_service import MovieService
+from src.api.services.progress_service import (
+    CONTENT_MODELS,
+    NEW_MOVIE_ENTRY,
+    NEW_SERIES_ENTRY,
+    PROGRESS_FIELDS,
+    ProgressService,
+)
+from src.api.services.series_service import SeriesService
+from src.models.movie import Movie
+from src.models.seasons import Season
+from src.models.series import Series
+from src.models.user import User
+from src.models.watch_entry import WatchEntry
+
+
+async def _version(model, *where) -> tuple:
+    """(max(updated_at), count) de `model`, igual que los collection_version sync."""
+    result = await async_db.session.execute(
+        select(func.max(model.updated_at), func.count(model.id)).where(*where)
+    )
+    return tuple(result.one())
+
+
+class AsyncMovieService:
+    @staticmethod
+    async def list_page(limit: int, cursor=None, filters=None, sort=None):
+        """Pagina de peliculas, filtrada y ordenada como MovieService.list_page."""
+        dialect_name = async_db.engine.dialect.name
+        stmt = MovieService.filter_query(select(Movie), filters or {}, dialect_name)
+        rows = (await async_db.session.execute(keyset_query(stmt, Movie, limit, cursor, sort))).all()
+        fill = null_fill_query(stmt, Movie, limit, cursor, sort, len(rows))
+        if fill is not None:
+            rows += (await async_db.session.execute(fill)).all()
+        return split_page(rows, limit, sort)
+
+    @staticmethod
+    async def collection_version() -> tuple:
+        return await _version(Movie)
+
+    @staticmethod
+    async def get(movie_id: int) -> Optional[Movie]:
+        return await async_db.session.get(Movie, movie_id)
+
+    @staticmethod
+    async def create(data: dict) -> Movie:
+        movie = Movie(**MovieService.validate(data))
+        async_db.session.add(movie)
+        await async_db.session.commit()
+        return movie
+
+
+class AsyncSeriesService:
+    @staticmethod
+    async def list_page(limit: int, cursor=None, filters=None, sort=None):
+        """Pagina de series, filtrada y ordenada como SeriesService.list_page."""
+        dialect_name = async_db.engine.dialect.name
+        stmt = SeriesService.filter_query(select(Series), filters or {}, dialect_name)
+        rows = await async_db.session.execute(keyset_query(stmt, Series, limit, cursor, sort))
+        return split_page(rows.all(), limit, sort)
+
+    @staticmethod
+    async def collection_version() -> tuple:
+        return await _version(Series)
+
+    @staticmethod
+    async def load_seasons(series_list: list[Series]) -> dict[int, list[Season]]:
+        """Seasons de varias series con UN query (IN), agrupadas por series_id."""
+        seasons_by_series: dict[int, list[Season]] = defaultdict(list)
+        ids = [series.id for series in series_list]
+        if not ids:
+            return seasons_by_series
+
+        seasons = await async_db.session.scalars(
+            select(Season)
+            .where(Season.series_id.in_(ids))
+            .order_by(Season.series_id, Season.number)
+        )
+        for season in seasons:
+            seasons_by_series[season.series_id].append(season)
+        return seasons_by_series
+
+    @staticmethod
+    async def get_with_seasons(series_id: int) -> Optional[tuple[Series, list[Season]]]:
+        """Serie + sus seasons en 2 queries. None si la serie no existe."""
+        series = await async_db.session.get(Series, series_id)
+        if series is None:
+            return None
+        return series, (await AsyncSeriesService.load_seasons([series]))[series.id]
+
+    @staticmethod
+    async def create(data: dict) -> Series:
+        series = Series(**SeriesService.validate(data), created_at=datetime.utcnow())
+        async_db.session.add(series)
+        await async_db.session.commit()
+        return series
+
+
+class AsyncProgressService:
+    # ---------- helpers internos ----------
+
+    @staticmethod
+    async def _require(model, object_id: int, label: str):
+        found = await async_db.session.get(model, object_id)
+        if found is None:
+            raise LookupError(f"{label} {object_id} no existe")
+        return found
+
+    @staticmethod
+    async def _insert_watch_entry(user_id, content_type, content_model, content_id, values):
+        session = async_db.session
+        stmt = ProgressService._watch_entry_insert(
+            session.bind.dialect.name,
+            user_id,
+            content_type,
+            content_model,
+            content_id,
+            values,
+        )
+        entry = (await session.scalars(stmt)).first()
+        await session.commit()
+        return entry
+
+    # ---------- API pública que usan las rutas async ----------
+
+    @staticmethod
+    async def list_user_watchlist_page(user_id: int, limit: int, cursor=None):
+        rows = await async_db.session.execute(
+            keyset_query(
+                select(WatchEntry).filter_by(user_id=user_id),
+                WatchEntry,
+                limit,
+                cursor,
+            )
+        )
+        entries, next_cursor = split_page(rows.all(), limit)
+        if not entries:
+            await AsyncProgressService._require(User, user_id, "Usuario")
+        return entries, next_cursor
+
+    @staticmethod
+    async def watchlist_version(user_id: int) -> tuple:
+        return await _version(WatchEntry, WatchEntry.user_id == user_id)
+
+    @staticmethod
+    async def load_contents(entries: list[WatchEntry]) -> dict[tuple[str, int], Movie | Series]:
+        """Pelicula/serie de cada entrada: un query con IN por content_type."""
+        ids_by_type: dict[str, set[int]] = defaultdict(set)
+        for entry in entries:
+            ids_by_type[entry.content_type].add(entry.content_id)
+
+        contents: dict[tuple[str, int], Movie | Series] = {}
+        for content_type, ids in ids_by_type.items():
+            model = CONTENT_MODELS.get(content_type)
+            if model is None:
+                continue
+            for item in await async_db.session.scalars(select(model).where(model.id.in_(ids))):
+                contents[(content_type, item.id)] = item
+        return contents
+
+    @staticmethod
+    async def add_movie(user_id: int, movie_id: int) -> WatchEntry:
+        entry = await AsyncProgressService._insert_watch_entry(
+            user_id, "movie", Movie, movie_id, NEW_MOVIE_ENTRY
+        )
+        if entry is None:
+            await AsyncProgressService._require(User, user_id, "Usuario")
+            await AsyncProgressService._require(Movie, movie_id, "Pelicula")
+            raise ValueError("La película ya está en tu watchlist")
+        return entry
+
+    @staticmethod
+    async def add_series(user_id: int, series_id: int) -> WatchEntry:
+        entry = await AsyncProgressService._insert_watch_entry(
+            user_id, "series", Series, series_id, NEW_SERIES_ENTRY
+        )
+        if entry is None:
+            await AsyncProgressService._require(User, user_id, "Usuario")
+            await AsyncProgressService._require(Series, series_id, "Serie")
+            raise ValueError("La serie ya está en tu watchlist")
+        return entry
+
+    @staticmethod
+    async def update_series_progress(user_id: int, series_id: int, data: dict) -> WatchEntry:
+        session = async_db.session
+        entry = (
+            await session.scalars(
+                select(WatchEntry)
+                .filter_by(user_id=user_id, content_type="series", content_id=series_id)
+                .order_by(WatchEntry.id.desc())
+                .limit(1)
+            )
+        ).first()
+        if entry is None:
+            raise LookupError("Todavia no agregaste esa serie a tu watchlist")
+
+        for field in PROGRESS_FIELDS:
+            if field in data:
+                setattr(entry, field, data[field])
+
+        entry.updated_at = datetime.utcnow()
+        await session.commit()
+        await session.refresh(entry)
+        return entry
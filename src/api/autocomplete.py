@@ -0,0 +1,38 @@
+from flask import Blueprint, current_app, jsonify, request
+
+from src.api.services import AutocompleteService
+
+bp = Blueprint("autocomplete", __name__, url_prefix="/autocomplete")
+
+
+@bp.route("/", methods=["GET"])
+def autocomplete():
+    """
+    Titulos de peliculas y series que empiezan con ?prefix= (sin importar
+    mayusculas ni acentos), en orden alfabetico. Sale de un indice en memoria:
+    no toca la base por cada tecla.
+    ?limit= por defecto AUTOCOMPLETE_DEFAULT_LIMIT, maximo AUTOCOMPLETE_MAX_LIMIT.
+    """
+    config = current_app.config
+    try:
+        limit = int(request.args.get("limit", config["AUTOCOMPLETE_DEFAULT_LIMIT"]))
+    except ValueError:
+        return jsonify({"detail": "Parametro 'limit' debe ser un entero."}), 400
+    if limit < 1:
+        return jsonify({"detail": "Parametro 'limit' debe ser mayor a 0."}), 400
+
+    try:
+        items = AutocompleteService.search(
+            request.args.get("prefix", ""),
+            min(limit, config["AUTOCOMPLETE_MAX_LIMIT"]),
+        )
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    return jsonify({"items": items}), 200
+
+
+@bp.route("/stats", methods=["GET"])
+def autocomplete_stats():
+    """Tamaño del indice de este worker (entradas y bytes del bloque compacto)."""
+    return jsonify(AutocompleteService.stats()), 200
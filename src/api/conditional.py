@@ -0,0 +1,73 @@
+"""
+GETs condicionales (ETag / Last-Modified).
+
+Cada recurso calcula un validador barato -- max(updated_at) + cantidad de
+filas, sacado con un solo query agregado sobre un indice -- ANTES de cargar
+filas. Si el cliente ya tiene esa version (If-None-Match) respondemos 304
+sin tocar ni serializar nada mas.
+
+Last-Modified se manda pero no decide el 304: tiene resolucion de un
+segundo, y una escritura en el mismo segundo que la lectura anterior del
+cliente pasaria por "no modificado". El ETag (que incluye la cantidad de
+filas y el updated_at con microsegundos) es el unico validador.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+
+from flask import Response, request
+from werkzeug.sansio.http import is_resource_modified
+
+
+class Validators:
+    """ETag + Last-Modified de una representacion concreta."""
+
+    def __init__(self, etag: str, last_modified: datetime | None):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def build(cls, resource: str, *versions, req=None) -> "Validators":
+        """
+        Arma los validadores a partir de una o mas versiones (tuplas
+        (max_updated_at, count) o un updated_at suelto).
+        El query string entra en el ETag: cada pagina/expansion es distinta.
+        `req` es el request a usar (por defecto el de Flask; la app ASGI
+        pasa el suyo).
+        """
+        req = request if req is None else req
+        stamps: list[datetime] = []
+        parts = [resource, req.query_string.decode()]
+        for version in versions:
+            parts.append(repr(version))
+            if isinstance(version, tuple):
+                version = version[0]
+            if version is not None:
+                stamps.append(version)
+
+        digest = hashlib.blake2b("|".join(parts).encode(), digest_size=16)
+        return cls(digest.hexdigest(), max(stamps) if stamps else None)
+
+    def not_modified(self, req=None, response_class=Response) -> Response | None:
+        """Respuesta 304 si el cliente ya tiene esta version, si no None."""
+        req = request if req is None else req
+        if is_resource_modified(
+            http_range=req.headers.get("Range"),
+            http_if_range=req.headers.get("If-Range"),
+            http_if_modified_since=req.headers.get("If-Modified-Since"),
+            http_if_none_match=req.headers.get("If-None-Match"),
+            http_if_match=req.headers.get("If-Match"),
+            etag=self.etag,
+            last_modified=None,  # solo el ETag (ver docstring del modulo)
+        ):
+            return None
+        return self.apply(response_class(status=304))
+
+    def apply(self, response: Response) -> Response:
+        """Agrega ETag / Last-Modified a la respuesta."""
+        response.set_etag(self.etag)
+        if self.last_modified is not None:
+            response.last_modified = self.last_modified
+        return response
@@ -0,0 +1,69 @@
+"""
+Filtros de los listados del catalogo (?genre=, ?release_year_min=, ...).
+
+Cada filtro se arma para que la base lo resuelva con un indice (ver los
+Index de src/models/movie.py y series.py y benchmarks/explain_filters.py):
+- igualdad / rangos sobre columnas indexadas
+- prefijo de titulo sobre lower(title): en SQLite como rango
+  (lower(title) >= 'abc' AND < 'abc' + U+10FFFF), porque la optimizacion
+  de LIKE no aplica a expresiones; en Postgres como LIKE 'abc%', que usa
+  el indice text_pattern_ops
+"""
+
+from __future__ import annotations
+
+# mayor codepoint posible: cota superior de "todo lo que empieza con prefijo"
+MAX_CHAR = "\U0010ffff"
+
+_ASCII_LOWER = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"
+)
+
+
+def read_int(args, name: str) -> int | None:
+    """Query arg entero opcional. Lanza ValueError si no es un entero."""
+    raw = args.get(name)
+    if raw is None or raw == "":
+        return None
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"Parametro '{name}' debe ser un entero.") from exc
+
+
+def read_range(args, name: str) -> tuple[int | None, int | None]:
+    """?<name>_min= / ?<name>_max= (inclusivos). ValueError si min > max."""
+    low = read_int(args, f"{name}_min")
+    high = read_int(args, f"{name}_max")
+    if low is not None and high is not None and low > high:
+        raise ValueError(f"Parametro '{name}_min' no puede ser mayor que '{name}_max'.")
+    return low, high
+
+
+def read_text(args, name: str) -> str | None:
+    """Texto opcional (sin espacios de los costados; vacio = sin filtro)."""
+    value = (args.get(name) or "").strip()
+    return value or None
+
+
+def escape_like(value: str) -> str:
+    """Escapa los comodines de LIKE (con '\\' como caracter de escape)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def lower_for(dialect_name: str, value: str) -> str:
+    """
+    Minusculas como las haria lower() de la base: el de SQLite solo
+    convierte ASCII ("Él" sigue siendo "Él"), el de Postgres todo.
+    """
+    if dialect_name == "sqlite":
+        return value.translate(_ASCII_LOWER)
+    return value.lower()
+
+
+def prefix_clause(title_key, prefix: str, dialect_name: str):
+    """Condicion "title_key empieza con prefix" que usa el indice de title_key."""
+    prefix = lower_for(dialect_name, prefix)
+    if dialect_name == "postgresql":
+        return title_key.like(escape_like(prefix) + "%", escape="\\")
+    return (title_key >= prefix) & (title_key < prefix + MAX_CHAR)
@@ -2,11 +2,36 @@
 
 from flask import Blueprint, jsonify
 
+from src.api.services.cache import cache_stats
+from src.engine import pool_stats
+from src.health import deep_health, uptime_seconds
+
 bp = Blueprint("health", __name__, url_prefix="/health")
 
 
 @bp.get("/")
-def healthcheck() -> tuple[dict[str, str], int]:
-    """Devuelve el estado actual de la aplicacion."""
-    # TODO: agregar comprobaciones reales (db, cache, servicios externos).
-    return jsonify({"status": "ok"}), 200
+def healthcheck() -> tuple[dict, int]:
+    """
+    Readiness para el balanceador: base (SELECT 1 cacheado), pools, lag de
+    la replica y uptime. 503 si el worker no deberia recibir trafico.
+    """
+    report, ready = deep_health()
+    return jsonify(report), 200 if ready else 503
+
+
+@bp.get("/live")
+def liveness() -> tuple[dict, int]:
+    """Liveness: el proceso responde. No toca la base."""
+    return jsonify({"status": "ok", "uptime_seconds": round(uptime_seconds(), 1)}), 200
+
+
+@bp.get("/cache")
+def cache_status() -> tuple[dict, int]:
+    """Contadores (hits, misses, evictions...) de las caches de este worker."""
+    return jsonify(cache_stats()), 200
+
+
+@bp.get("/pool")
+def pool_status() -> tuple[dict, int]:
+    """Estado del pool de conexiones y espera de los checkouts de este worker."""
+    return jsonify(pool_stats()), 200
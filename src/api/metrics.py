@@ -0,0 +1,25 @@
+"""Metricas de la API en formato Prometheus (ver src/metrics.py)."""
+
+import hmac
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from src.metrics import CONTENT_TYPE, collect, render_prometheus
+
+bp = Blueprint("metrics", __name__)
+
+
+@bp.get("/metrics")
+def metrics():
+    """
+    Latencia, requests y SQL por endpoint, pool y caches. Con METRICS_DIR
+    suma todos los workers de gunicorn; sin el, solo el que atiende.
+    Con METRICS_TOKEN hay que mandar "Authorization: Bearer <token>".
+    """
+    settings = current_app.extensions.get("metrics")
+    if settings is None:
+        return jsonify({"detail": "Metricas deshabilitadas (METRICS_ENABLED=0)."}), 404
+    token = current_app.config["METRICS_TOKEN"]
+    if token and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return jsonify({"detail": "Token de metricas invalido o ausente."}), 401
+    return Response(render_prometheus(collect(settings["directory"])), content_type=CONTENT_TYPE)
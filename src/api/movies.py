@@ -1,49 +1,97 @@
-from flask import Blueprint, request, jsonify
-from src.extensions import db
-from src.models.movie import Movie
+from flask import Blueprint, current_app, request, jsonify
+from src.api.conditional import Validators
+from src.api.pagination import page_payload, read_page_args
+from src.api.services import MovieService
+from src.api.streaming import export_response, read_export_format
+from src.query_guard import query_budget
 
 bp = Blueprint("movies", __name__, url_prefix="/movies")
 
 #
-# LISTAR TODAS LAS PELÍCULAS
+# LISTAR PELÍCULAS (paginado por cursor: ?limit=&cursor=)
+# filtros: ?genre=, ?release_year_min=, ?release_year_max=, ?title_prefix=
+# orden: ?sort=created_at|title|release_year (con "-" descendente; default -created_at)
 #
 @bp.route("/", methods=["GET"])
+@query_budget(3)
 def list_movies():
-    movies = Movie.query.order_by(Movie.created_at.desc()).all()
-    return jsonify([m.to_dict() for m in movies]), 200
+    try:
+        filters, sort = MovieService.parse_list_args(request.args)
+        limit, cursor = read_page_args(decode=sort.decode_cursor)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    # GET condicional: si el cliente ya tiene esta version, 304 sin cargar filas
+    version = MovieService.collection_version()
+    validators = Validators.build("movies", version)
+    not_modified = validators.not_modified()
+    if not_modified is not None:
+        return not_modified
+
+    items, next_cursor = MovieService.list_page_cached(limit, cursor, version, filters, sort)
+    return validators.apply(jsonify(page_payload(items, next_cursor))), 200
 
 
 #
 # CREAR UNA PELÍCULA
 #
 @bp.route("/", methods=["POST"])
+@query_budget(3)
 def create_movie():
     data = request.get_json() or {}
 
-    title = data.get("title")
-    if not title:
-        return jsonify({"detail": "Campo 'title' es obligatorio."}), 400
+    try:
+        movie = MovieService.create(data)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
 
-    movie = Movie(
-        title=title,
-        genre=data.get("genre"),
-        release_year=data.get("release_year"),
-    )
+    return jsonify(movie.to_dict()), 201
 
-    db.session.add(movie)
-    db.session.commit()
-    db.session.refresh(movie)
 
-    return jsonify(movie.to_dict()), 201
+#
+# CARGA MASIVA DE PELÍCULAS (NDJSON: un objeto JSON por línea)
+#
+@bp.route("/bulk", methods=["POST"])
+def bulk_create_movies():
+    report = MovieService.bulk_import(request.stream)
+    return jsonify(report), 200
+
+
+#
+# EXPORTAR TODAS LAS PELÍCULAS EN STREAMING (?format=ndjson|csv)
+#
+@bp.route("/export", methods=["GET"])
+@query_budget(2)
+def export_movies():
+    try:
+        export_format = read_export_format()
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    movies = MovieService.iter_all(current_app.config["EXPORT_YIELD_PER"])
+    return export_response(
+        (m.to_dict() for m in movies),
+        export_format,
+        ["id", "title", "genre", "release_year", "created_at"],
+        "movies",
+    )
 
 
 #
 # OBTENER DETALLE DE UNA PELÍCULA POR ID
 #
 @bp.route("/<int:movie_id>", methods=["GET"])
+@query_budget(2)
 def retrieve_movie(movie_id: int):
-    movie = Movie.query.get(movie_id)
-    if not movie:
+    # cache en memoria: una pelicula "caliente" no toca la base
+    cached = MovieService.get_cached(movie_id)
+    if cached is None:
         return jsonify({"detail": f"Movie {movie_id} not found"}), 404
 
-    return jsonify(movie.to_dict()), 200
+    data, updated_at = cached
+    validators = Validators.build(f"movie:{movie_id}", updated_at)
+    not_modified = validators.not_modified()
+    if not_modified is not None:
+        return not_modified
+
+    return validators.apply(jsonify(data)), 200
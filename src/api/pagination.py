@@ -0,0 +1,250 @@
+"""
+Paginacion por cursor (keyset) para los listados.
+
+En vez de OFFSET usamos un cursor opaco con el par (created_at, id) de la
+ultima fila devuelta. La siguiente pagina se pide con
+WHERE (created_at, id) < (:created_at, :id), que se resuelve con el indice
+compuesto (created_at, id): la pagina N cuesta lo mismo que la pagina 1.
+
+Los listados del catalogo aceptan otros ordenes (?sort=title, -release_year,
+...): cada uno es un Sort y el cursor lleva (sort, valor, id), con un indice
+(expresion, id) por cada orden. En un orden por una columna que admite NULL
+las filas con NULL van al final, en una segunda fase ordenada por id (el
+cursor lleva valor null); asi las dos fases usan el mismo indice (columna, id).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from flask import current_app, request
+
+from src.extensions import db
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Convierte (created_at, id) en un string opaco para el cliente."""
+    return encode_values(created_at.isoformat(), row_id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Operacion inversa de encode_cursor. Lanza ValueError si es invalido."""
+    try:
+        created_at, row_id = decode_values(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Parametro 'cursor' invalido.") from exc
+
+
+def encode_values(*values) -> str:
+    """Valores JSON-serializables -> cursor opaco (JSON en base64 url-safe)."""
+    raw = json.dumps(list(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_values(cursor: str) -> list:
+    """Operacion inversa de encode_values. Lanza ValueError si es invalido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise ValueError("Parametro 'cursor' invalido.") from exc
+    if not isinstance(values, list):
+        raise ValueError("Parametro 'cursor' invalido.")
+    return values
+
+
+class Sort:
+    """
+    Orden de un listado paginado: `column` (columna o expresion SQL) y
+    despues id como desempate, ambos en la misma direccion.
+    - token: como llega en ?sort= ("title", "-created_at"); viaja en el
+      cursor para rechazar un cursor de otro orden
+    - load: valor JSON del cursor -> valor para comparar (p.ej. fechas)
+    - nullable: la columna admite NULL; esas filas van al final, por id
+      (una comparacion de tuplas con NULL no tiene orden)
+    El orden por defecto (created_at DESC) usa el cursor de siempre.
+    """
+
+    def __init__(self, name: str, column, descending=False, load=None, nullable=False):
+        self.name = name
+        self.column = column
+        self.descending = descending
+        self.load = load
+        self.nullable = nullable
+
+    @classmethod
+    def created_at(cls, model) -> "Sort":
+        """El orden de siempre: mas recientes primero."""
+        return cls("created_at", model.created_at, descending=True, load=datetime.fromisoformat)
+
+    @property
+    def token(self) -> str:
+        return f"-{self.name}" if self.descending else self.name
+
+    @property
+    def is_default(self) -> bool:
+        return self.token == "-created_at"
+
+    def encode_cursor(self, value, row_id: int) -> str:
+        if self.is_default:
+            return encode_cursor(value, row_id)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return encode_values(self.token, value, row_id)
+
+    def decode_cursor(self, cursor: str) -> tuple:
+        """Cursor -> (valor, id) para este orden. ValueError si es invalido o de otro orden."""
+        if self.is_default:
+            return decode_cursor(cursor)
+        values = decode_values(cursor)
+        if len(values) != 3 or values[0] != self.token:
+            raise ValueError("Parametro 'cursor' invalido para este 'sort'.")
+        if values[1] is None and not self.nullable:
+            raise ValueError("Parametro 'cursor' invalido.")
+        try:
+            value = self.load(values[1]) if self.load and values[1] is not None else values[1]
+            return value, int(values[2])
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Parametro 'cursor' invalido.") from exc
+
+
+def parse_sort(raw: str | None, sorts: dict[str, tuple]) -> Sort:
+    """
+    ?sort= -> Sort. `sorts` es {nombre: (columna, load, nullable)}; un "-"
+    adelante invierte la direccion. Sin ?sort= queda -created_at.
+    Lanza ValueError si el nombre no esta en `sorts`.
+    """
+    token = (raw or "-created_at").strip()
+    name = token.lstrip("-")
+    if name not in sorts:
+        allowed = ", ".join(sorted(sorts))
+        raise ValueError(
+            f"Parametro 'sort' invalido: usar uno de {allowed} (con '-' para descendente)."
+        )
+    column, load, nullable = sorts[name]
+    return Sort(name, column, descending=token.startswith("-"), load=load, nullable=nullable)
+
+
+def read_page_args(decode=decode_cursor) -> tuple[int, tuple | None]:
+    """Lee ?limit= y ?cursor= del request actual (ver parse_page_args)."""
+    return parse_page_args(request.args, current_app.config, decode)
+
+
+def parse_page_args(args, config, decode=decode_cursor) -> tuple[int, tuple | None]:
+    """
+    Valida limit y cursor a partir de los query args y la config.
+    - limit por defecto PAGINATION_DEFAULT_LIMIT, recortado a PAGINATION_MAX_LIMIT
+    - el cursor se decodifica con `decode` (por defecto el de (created_at, id))
+    - lanza ValueError si alguno de los dos es invalido (=> 400)
+    """
+    default_limit = config["PAGINATION_DEFAULT_LIMIT"]
+    max_limit = config["PAGINATION_MAX_LIMIT"]
+
+    raw_limit = args.get("limit")
+    if raw_limit is None:
+        limit = default_limit
+    else:
+        try:
+            limit = int(raw_limit)
+        except ValueError as exc:
+            raise ValueError("Parametro 'limit' debe ser un entero.") from exc
+        if limit < 1:
+            raise ValueError("Parametro 'limit' debe ser mayor a 0.")
+
+    raw_cursor = args.get("cursor")
+    cursor = decode(raw_cursor) if raw_cursor else None
+
+    return min(limit, max_limit), cursor
+
+
+def keyset_page(query, model, limit: int, cursor: tuple | None, sort: Sort | None = None):
+    """
+    Aplica el orden (por defecto created_at DESC, id DESC) y el cursor a
+    `query`. Devuelve (items, next_cursor); next_cursor es None en la
+    ultima pagina.
+    """
+    sort = sort or Sort.created_at(model)
+    rows = keyset_query(query, model, limit, cursor, sort).all()
+    fill = null_fill_query(query, model, limit, cursor, sort, len(rows))
+    if fill is not None:
+        rows += fill.all()
+    return split_page(rows, limit, sort)
+
+
+def keyset_query(query, model, limit: int, cursor: tuple | None, sort: Sort | None = None):
+    """
+    Filtro + orden + limit de una pagina. Sirve tanto para un Query como
+    para un select() (p.ej. con AsyncSession); pide una fila de mas.
+    Cada fila sale como (item, valor de orden): el valor lo calcula la base
+    (lower() de SQLite no es el de Python) y es el que va al cursor.
+    """
+    sort = sort or Sort.created_at(model)
+    if sort.nullable and cursor is not None and cursor[0] is None:
+        return _null_phase_query(query, model, limit, cursor[1], sort)
+
+    key = db.tuple_(sort.column, model.id)
+    if sort.nullable:
+        query = query.filter(sort.column.isnot(None))
+    if cursor is not None:
+        # la cota suelta sobre la primera columna es redundante, pero sin ella
+        # SQLite no busca en un indice de expresion (lower(title), id) con
+        # una comparacion de tuplas: lo recorre entero
+        value, bound = cursor[0], db.tuple_(*cursor)
+        if sort.descending:
+            query = query.filter(sort.column <= value, key < bound)
+        else:
+            query = query.filter(sort.column >= value, key > bound)
+
+    if sort.descending:
+        order = (sort.column.desc(), model.id.desc())
+    else:
+        order = (sort.column.asc(), model.id.asc())
+
+    # pedimos una fila de mas para saber si hay pagina siguiente
+    return (
+        query.add_columns(sort.column.label("sort_value"))
+        .order_by(*order)
+        .limit(limit + 1)
+    )
+
+
+def null_fill_query(query, model, limit: int, cursor: tuple | None, sort: Sort | None, fetched: int):
+    """
+    Si la fase sin NULL de un orden nullable se termino con `fetched` filas
+    (menos de limit + 1), el query que completa la pagina con las primeras
+    filas con NULL. None si no hace falta.
+    """
+    if sort is None or not sort.nullable or fetched > limit:
+        return None
+    if cursor is not None and cursor[0] is None:
+        return None  # ya estamos en la fase de NULL
+    return _null_phase_query(query, model, limit - fetched, None, sort)
+
+
+def _null_phase_query(query, model, limit: int, after_id: int | None, sort: Sort):
+    """Filas con NULL en la columna del orden, por id en la misma direccion."""
+    query = query.filter(sort.column.is_(None))
+    if after_id is not None:
+        query = query.filter(model.id < after_id if sort.descending else model.id > after_id)
+    order = model.id.desc() if sort.descending else model.id.asc()
+    return query.add_columns(sort.column.label("sort_value")).order_by(order).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, sort: Sort | None = None):
+    """(items, next_cursor) a partir de las limit + 1 filas de keyset_query."""
+    items = [row[0] for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last, value = rows[limit - 1]
+        next_cursor = (sort.encode_cursor if sort else encode_cursor)(value, last.id)
+
+    return items, next_cursor
+
+
+def page_payload(items: list[dict], next_cursor: str | None) -> dict:
+    """Forma comun de las respuestas paginadas."""
+    return {"items": items, "next_cursor": next_cursor}
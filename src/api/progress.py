@@ -1,7 +1,11 @@
 from __future__ import annotations
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 
-from src.api.services import ProgressService
+from src.api.conditional import Validators
+from src.api.pagination import page_payload, read_page_args
+from src.api.services import MovieService, ProgressService, SeriesService
+from src.api.streaming import export_response, read_export_format
+from src.query_guard import query_budget
 
 bp = Blueprint("progress", __name__)  # sin url_prefix, las rutas ya están completas
 
@@ -14,7 +18,11 @@ def _require_user_id() -> int:
     Lee el header X-User-Id y lo convierte a int.
     Si falta o es inválido => lanzamos ValueError y respondemos 400.
     """
-    raw_id = request.headers.get("X-User-Id")
+    return parse_user_id(request.headers.get("X-User-Id"))
+
+
+def parse_user_id(raw_id: str | None) -> int:
+    """Valor del header X-User-Id -> int (ValueError si falta o es inválido)."""
     if not raw_id:
         raise ValueError("Header X-User-Id es obligatorio.")
 
@@ -25,21 +33,95 @@ def _require_user_id() -> int:
 
 
 @bp.route("/me/watchlist", methods=["GET"])
+@query_budget(7)
 def get_my_watchlist():
     """
-    Devuelve TODAS las WatchEntry del usuario actual (simulado con el header X-User-Id).
+    Devuelve las WatchEntry del usuario actual (simulado con el header X-User-Id),
+    paginadas por cursor (?limit=&cursor=).
+    Con ?expand=content cada entrada trae tambien su pelicula/serie
+    (un query por tipo de contenido, sin importar el tamaño de la pagina).
+    """
+    try:
+        user_id = _require_user_id()
+        limit, cursor = read_page_args()
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    expand = {part.strip() for part in request.args.get("expand", "").split(",")}
+
+    # GET condicional: si el cliente ya tiene esta version, 304 sin cargar filas.
+    # Con expand=content el contenido embebido tambien forma parte de la version.
+    versions = [service.watchlist_version(user_id)]
+    if "content" in expand:
+        versions += [MovieService.collection_version(), SeriesService.collection_version()]
+    validators = Validators.build(f"watchlist:{user_id}", *versions)
+    not_modified = validators.not_modified()
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        entries, next_cursor = service.list_user_watchlist_page(user_id, limit, cursor)
+    except LookupError as e:
+        return jsonify({"detail": str(e)}), 404
+
+    if "content" in expand:
+        contents = service.load_contents(entries)
+        payload = [
+            entry.to_dict(
+                include_user=False,
+                include_content=True,
+                content=contents.get((entry.content_type, entry.content_id)),
+            )
+            for entry in entries
+        ]
+    else:
+        # devolvemos cada WatchEntry serializada
+        payload = [entry.to_dict(include_user=False) for entry in entries]
+
+    return validators.apply(jsonify(page_payload(payload, next_cursor))), 200
+
+
+@bp.route("/me/watchlist/export", methods=["GET"])
+@query_budget(3)
+def export_my_watchlist():
+    """
+    Exporta TODAS las WatchEntry del usuario actual en streaming
+    (?format=ndjson|csv), sin armar la lista completa en memoria.
     """
     try:
         user_id = _require_user_id()
+        export_format = read_export_format()
     except ValueError as e:
         return jsonify({"detail": str(e)}), 400
 
-    entries = service.list_user_watchlist(user_id)
-    # devolvemos cada WatchEntry serializada
-    return jsonify([entry.to_dict(include_user=False) for entry in entries]), 200
+    try:
+        entries = service.iter_user_entries(user_id, current_app.config["EXPORT_YIELD_PER"])
+    except LookupError as e:
+        return jsonify({"detail": str(e)}), 404
+
+    return export_response(
+        (entry.to_dict(include_user=False) for entry in entries),
+        export_format,
+        [
+            "id",
+            "user_id",
+            "content_type",
+            "content_id",
+            "status",
+            "current_season",
+            "current_episode",
+            "watched_episodes",
+            "total_episodes",
+            "percentage_watched",
+            "created_at",
+            "updated_at",
+        ],
+        "watchlist",
+    )
 
 
 @bp.route("/watchlist/movies/<int:movie_id>", methods=["POST"])
+@query_budget(3)
 def add_movie_to_watchlist(movie_id: int):
     """
     Agrega una película a la watchlist del usuario.
@@ -62,6 +144,7 @@ def add_movie_to_watchlist(movie_id: int):
 
 
 @bp.route("/watchlist/series/<int:series_id>", methods=["POST"])
+@query_budget(3)
 def add_series_to_watchlist(series_id: int):
     """
     Agrega una serie a la watchlist del usuario.
@@ -82,6 +165,7 @@ def add_series_to_watchlist(series_id: int):
 
 
 @bp.route("/progress/series/<int:series_id>", methods=["PATCH"])
+@query_budget(4)
 def update_series_progress(series_id: int):
     """
     Actualiza el progreso de una serie ya agregada a la watchlist.
@@ -111,4 +195,33 @@ def update_series_progress(series_id: int):
     except LookupError as e:
         return jsonify({"detail": str(e)}), 404
     except ValueError as e:
-        return jsonify({"detail": str(e)}), 400
\ No newline at end of file
+        return jsonify({"detail": str(e)}), 400
+
+
+@bp.route("/progress/batch", methods=["PATCH"])
+@query_budget(3)
+def update_series_progress_batch():
+    """
+    Actualiza el progreso de varias series en una sola transaccion.
+    Body: lista de items como el de PATCH /progress/series/<id> mas su series_id
+    [
+      {"series_id": 3, "current_episode": 8, "watched_episodes": 21},
+      {"series_id": 9, "status": "completed"}
+    ]
+    Responde 200 con un resultado por item (status 200, 400 o 404 cada uno).
+    """
+    try:
+        user_id = _require_user_id()
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        return jsonify({"detail": "El body debe ser una lista de items con series_id."}), 400
+    max_items = current_app.config["PROGRESS_BATCH_MAX_ITEMS"]
+    if len(items) > max_items:
+        return jsonify({"detail": f"Como maximo {max_items} items por lote."}), 400
+
+    results = service.update_series_progress_batch(user_id=user_id, items=items)
+    updated = sum(1 for result in results if result["status"] == 200)
+    return jsonify({"updated": updated, "results": results}), 200
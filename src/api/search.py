@@ -0,0 +1,35 @@
+from flask import Blueprint, jsonify, request
+
+from src.api.pagination import page_payload, read_page_args
+from src.api.services import SearchService
+from src.api.services.search_service import SEARCH_TABLES, decode_search_cursor
+from src.query_guard import query_budget
+
+bp = Blueprint("search", __name__, url_prefix="/search")
+
+
+@bp.route("/", methods=["GET"])
+@query_budget(4)
+def search():
+    """
+    Busqueda de texto en peliculas (titulo y genero) y series (titulo).
+    ?q=     palabras a buscar (todas deben aparecer; prefijos valen: "star wa")
+    ?type=  movie | series (opcional, por defecto ambos)
+    Paginado por cursor (?limit=&cursor=), mejores resultados primero.
+    """
+    try:
+        terms = SearchService.parse_terms(request.args.get("q"))
+        limit, cursor = read_page_args(decode=decode_search_cursor)
+        content_type = request.args.get("type")
+        if content_type is not None and content_type not in SEARCH_TABLES:
+            raise ValueError("Parametro 'type' debe ser 'movie' o 'series'.")
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    items, next_cursor = SearchService.search(
+        terms,
+        limit,
+        cursor,
+        content_types=[content_type] if content_type else None,
+    )
+    return jsonify(page_payload(items, next_cursor)), 200
@@ -1,21 +1,51 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from src.api.conditional import Validators
+from src.api.pagination import page_payload, read_page_args
 from src.api.services import SeriesService
+from src.api.streaming import export_response, read_export_format
+from src.query_guard import query_budget
 
 bp = Blueprint("series", __name__, url_prefix="/series")
 
 
 @bp.route("/", methods=["GET"])
+@query_budget(4)
 def list_series():
     """
-    Lista todas las series registradas.
-    No incluye las seasons dentro (para que la lista sea más liviana).
+    Lista las series registradas, paginadas por cursor (?limit=&cursor=).
+    Por defecto no incluye las seasons (para que la lista sea más liviana);
+    con ?include=seasons las trae todas con un solo query extra para la página.
+    Filtro ?title_prefix= y orden ?sort=created_at|title ("-" = descendente,
+    por defecto -created_at).
     """
-    all_series = SeriesService.list_all()
-    payload = [s.to_dict(include_seasons=False) for s in all_series]
-    return jsonify(payload), 200
+    try:
+        filters, sort = SeriesService.parse_list_args(request.args)
+        limit, cursor = read_page_args(decode=sort.decode_cursor)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    # GET condicional: si el cliente ya tiene esta version, 304 sin cargar filas
+    version = SeriesService.collection_version()
+    validators = Validators.build("series", version)
+    not_modified = validators.not_modified()
+    if not_modified is not None:
+        return not_modified
+
+    include = {part.strip() for part in request.args.get("include", "").split(",")}
+    payload, next_cursor = SeriesService.list_page_cached(
+        limit,
+        cursor,
+        version,
+        include_seasons="seasons" in include,
+        filters=filters,
+        sort=sort,
+    )
+
+    return validators.apply(jsonify(page_payload(payload, next_cursor))), 200
 
 
 @bp.route("/", methods=["POST"])
+@query_budget(3)
 def create_series():
     """
     Crea una nueva serie.
@@ -36,7 +66,40 @@ def create_series():
         return jsonify({"detail": str(e)}), 400
 
 
+@bp.route("/bulk", methods=["POST"])
+def bulk_create_series():
+    """
+    Carga masiva de series en NDJSON (un objeto JSON por línea),
+    con las mismas reglas que POST /series/.
+    Devuelve un reporte con las filas insertadas y los errores por línea.
+    """
+    report = SeriesService.bulk_import(request.stream)
+    return jsonify(report), 200
+
+
+@bp.route("/export", methods=["GET"])
+@query_budget(3)
+def export_series():
+    """
+    Exporta todas las series con sus seasons en streaming (?format=ndjson|csv).
+    En CSV la columna "seasons" va como JSON.
+    """
+    try:
+        export_format = read_export_format()
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    rows = SeriesService.iter_with_seasons(current_app.config["EXPORT_YIELD_PER"])
+    return export_response(
+        (s.to_dict(include_seasons=True, seasons=seasons) for s, seasons in rows),
+        export_format,
+        ["id", "title", "total_seasons", "total_episodes", "created_at", "seasons"],
+        "series",
+    )
+
+
 @bp.route("/<int:series_id>/seasons", methods=["POST"])
+@query_budget(8)
 def add_season(series_id: int):
     """
     Agrega una temporada nueva a la serie indicada.
@@ -52,8 +115,8 @@ def add_season(series_id: int):
         data = request.get_json() or {}
         _season = SeriesService.add_season(series_id, data)
 
-        updated_series = SeriesService.get_by_id(series_id)
-        return jsonify(updated_series.to_dict(include_seasons=True)), 201
+        updated_series, seasons = SeriesService.get_with_seasons(series_id)
+        return jsonify(updated_series.to_dict(include_seasons=True, seasons=seasons)), 201
 
     except LookupError as e:
         # La serie no existe
@@ -64,10 +127,17 @@ def add_season(series_id: int):
         return jsonify({"detail": str(e)}), 400
 
 @bp.route("/<int:series_id>", methods=["GET"])
+@query_budget(3)
 def get_series(series_id: int):
-    from src.models.series import Series
-    series = Series.query.get(series_id)
-    if not series:
+    # aquí sí queremos seasons incluidas (cacheadas en memoria junto con la serie)
+    cached = SeriesService.get_cached(series_id)
+    if cached is None:
         return jsonify({"detail": f"Series {series_id} not found"}), 404
-    # aquí sí queremos seasons incluidas
-    return jsonify(series.to_dict(include_seasons=True)), 200
+
+    data, updated_at = cached
+    validators = Validators.build(f"series:{series_id}", updated_at)
+    not_modified = validators.not_modified()
+    if not_modified is not None:
+        return not_modified
+
+    return validators.apply(jsonify(data)), 200
@@ -3,9 +3,15 @@
 from .movie_service import MovieService
 from .series_service import SeriesService
 from .progress_service import ProgressService
+from .bulk_import_service import BulkImportService
+from .search_service import SearchService
+from .autocomplete_service import AutocompleteService
 
 __all__ = [
     "MovieService",
     "SeriesService",
     "ProgressService",
+    "BulkImportService",
+    "SearchService",
+    "AutocompleteService",
 ]
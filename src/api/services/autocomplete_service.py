@@ -0,0 +1,291 @@
+"""
+Indice de prefijos en memoria para el autocompletado de titulos.
+
+Estructura (por worker, en app.extensions["autocomplete"]):
+- un bloque compacto e inmutable: todos los titulos ordenados por su forma
+  normalizada, concatenados en UN solo str, mas dos arrays (offsets y
+  referencias tipo+id). Sin un objeto Python por titulo: poca memoria y,
+  con preload de gunicorn, paginas que se comparten entre workers.
+- un "delta" chico con las altas recientes (lista ordenada, insort).
+  Cuando supera AUTOCOMPLETE_MERGE_THRESHOLD se funde en un bloque nuevo.
+
+La busqueda es binaria sobre ambos (bisect con key=normalize), asi que una
+consulta cuesta O(log n) comparaciones mas el armado de los resultados.
+Las altas de este worker entran al momento (MovieService/SeriesService.create);
+las de otros workers y las cargas masivas entran con una pasada incremental
+por id (WHERE id > ultimo visto) cada AUTOCOMPLETE_SYNC_SECONDS.
+"""
+
+from __future__ import annotations
+
+import heapq
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Iterable, Iterator
+
+from flask import current_app
+
+from src.extensions import db
+from src.models.movie import Movie
+from src.models.series import Series
+
+# content_type -> modelo; el bit bajo de la referencia empaquetada es el tipo
+AUTOCOMPLETE_MODELS = {
+    "movie": Movie,
+    "series": Series,
+}
+_TYPE_BITS = {"movie": 0, "series": 1}
+_BIT_TYPES = {bit: content_type for content_type, bit in _TYPE_BITS.items()}
+
+# mayor que cualquier caracter: fin del rango de un prefijo
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def normalize(text: str) -> str:
+    """Forma de comparacion: sin acentos, casefold y espacios simples."""
+    if text.isascii():
+        # camino rapido (la mayoria de los titulos): casefold == lower en ASCII
+        return " ".join(text.lower().split())
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+def pack_ref(content_type: str, content_id: int) -> int:
+    return content_id << 1 | _TYPE_BITS[content_type]
+
+
+def unpack_ref(ref: int) -> tuple[str, int]:
+    return _BIT_TYPES[ref & 1], ref >> 1
+
+
+class _Block:
+    """Titulos ordenados en un unico str + offsets; se indexa como una secuencia."""
+
+    def __init__(self, entries: Iterable[tuple[str, int]]):
+        parts: list[str] = []
+        self.offsets = array("Q", [0])
+        self.refs = array("q")
+        position = 0
+        for title, ref in entries:
+            parts.append(title)
+            position += len(title)
+            self.offsets.append(position)
+            self.refs.append(ref)
+        self.text = "".join(parts)
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def __getitem__(self, i: int) -> str:
+        return self.text[self.offsets[i]:self.offsets[i + 1]]
+
+    def entries(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[str, str, int]]:
+        """(clave, titulo, ref) en orden, desde start."""
+        stop = len(self) if stop is None else stop
+        for i in range(start, stop):
+            title = self[i]
+            yield normalize(title), title, self.refs[i]
+
+    def nbytes(self) -> int:
+        return (
+            sys.getsizeof(self.text)
+            + self.offsets.itemsize * len(self.offsets)
+            + self.refs.itemsize * len(self.refs)
+        )
+
+
+class PrefixIndex:
+    """
+    Bloque compacto + delta de altas recientes. Las bajas (y los cambios de
+    titulo, que son baja + alta) ocultan la entrada del bloque hasta el
+    proximo merge; el delta siempre tiene la version vigente.
+    """
+
+    def __init__(self, merge_threshold: int = 50_000):
+        self.merge_threshold = merge_threshold
+        self._block = _Block([])
+        self._delta: list[tuple[str, str, int]] = []  # (clave, titulo, ref) ordenado
+        self._hidden: set[int] = set()  # refs del bloque dadas de baja
+        # refs del delta y las de id mayor a last_ids (altas locales que el
+        # proximo sync va a volver a leer): add las saltea
+        self._pending: set[int] = set()
+        self._lock = threading.Lock()
+        self.sync_lock = threading.Lock()  # un solo sync a la vez (AutocompleteService.sync)
+        # hasta donde llegaron build() y sync(); las altas locales no lo
+        # mueven: otro worker puede haber insertado ids mas bajos
+        self.last_ids = {content_type: 0 for content_type in _TYPE_BITS}
+        self.synced_at = 0.0
+
+    def build(self, rows: Iterable[tuple[str, int, str]]) -> None:
+        """Reemplaza el contenido con `rows` = (content_type, id, title)."""
+        entries = []
+        last_ids = {content_type: 0 for content_type in _TYPE_BITS}
+        for content_type, content_id, title in rows:
+            entries.append((normalize(title), title, pack_ref(content_type, content_id)))
+            last_ids[content_type] = max(last_ids[content_type], content_id)
+        entries.sort()
+        block = _Block((title, ref) for _, title, ref in entries)
+        with self._lock:
+            self._block, self._delta, self._hidden, self._pending = block, [], set(), set()
+            self.last_ids = last_ids
+            self.synced_at = time.monotonic()
+
+    def add(self, content_type: str, content_id: int, title: str) -> bool:
+        """Agrega la entrada si no estaba ya (alta local o sync). Devuelve si la agrego."""
+        ref = pack_ref(content_type, content_id)
+        with self._lock:
+            if ref in self._pending:
+                return False
+            insort(self._delta, (normalize(title), title, ref))
+            self._pending.add(ref)
+            if len(self._delta) >= self.merge_threshold:
+                self._merge()
+            return True
+
+    def remove(self, content_type: str, content_id: int) -> None:
+        ref = pack_ref(content_type, content_id)
+        with self._lock:
+            self._delta = [entry for entry in self._delta if entry[2] != ref]
+            self._pending.discard(ref)
+            self._hidden.add(ref)
+
+    def synced(self, last_ids: dict[str, int]) -> None:
+        """Marca hasta que id leyo el sync."""
+        with self._lock:
+            for content_type, last_id in last_ids.items():
+                self.last_ids[content_type] = max(self.last_ids[content_type], last_id)
+            self.synced_at = time.monotonic()
+
+    def _merge(self) -> None:
+        """Funde el delta (y aplica las bajas) en un bloque nuevo. Con el lock tomado."""
+        visible = (entry for entry in self._block.entries() if entry[2] not in self._hidden)
+        self._block = _Block((title, ref) for _, title, ref in heapq.merge(visible, self._delta))
+        self._delta, self._hidden = [], set()
+        # las que el sync todavia no paso siguen contando como vistas
+        self._pending = {ref for ref in self._pending if self._above_last_id(ref)}
+
+    def _above_last_id(self, ref: int) -> bool:
+        content_type, content_id = unpack_ref(ref)
+        return content_id > self.last_ids[content_type]
+
+    def search(self, prefix: str, limit: int) -> list[dict]:
+        """Hasta `limit` titulos que empiezan con `prefix` (ya normalizado), en orden."""
+        upper = prefix + _MAX_CHAR
+        with self._lock:
+            block, delta, hidden = self._block, self._delta, self._hidden
+            start = bisect_left(block, prefix, key=normalize)
+            stop = bisect_left(block, upper, lo=start, key=normalize)
+            d_start = bisect_left(delta, (prefix,))
+            d_stop = bisect_left(delta, (upper,), lo=d_start)
+
+            # del bloque alcanza con limit + len(hidden) candidatos
+            from_block = (
+                entry
+                for entry in block.entries(start, min(stop, start + limit + len(hidden)))
+                if entry[2] not in hidden
+            )
+            from_delta = islice(delta, d_start, min(d_stop, d_start + limit))
+            results = []
+            for _, title, ref in heapq.merge(from_block, from_delta):
+                content_type, content_id = unpack_ref(ref)
+                results.append({"type": content_type, "id": content_id, "title": title})
+                if len(results) == limit:
+                    break
+            return results
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "block_entries": len(self._block),
+                "delta_entries": len(self._delta),
+                "hidden_entries": len(self._hidden),
+                "block_bytes": self._block.nbytes(),
+            }
+
+
+class AutocompleteService:
+    @staticmethod
+    def _scan(since: dict[str, int], batch_size: int) -> Iterator[tuple[str, int, str]]:
+        """(content_type, id, title) con id > since[tipo], leidos con yield_per."""
+        for content_type, model in AUTOCOMPLETE_MODELS.items():
+            stmt = (
+                db.select(model.id, model.title)
+                .where(model.id > since.get(content_type, 0))
+                .order_by(model.id)
+                .execution_options(yield_per=batch_size)
+            )
+            for content_id, title in db.session.execute(stmt):
+                yield content_type, content_id, title
+
+    @staticmethod
+    def build() -> PrefixIndex:
+        """Arma el indice de la app actual recorriendo movies y series en streaming."""
+        config = current_app.config
+        index = PrefixIndex(config["AUTOCOMPLETE_MERGE_THRESHOLD"])
+        index.build(AutocompleteService._scan({}, config["EXPORT_YIELD_PER"]))
+        current_app.extensions["autocomplete"] = index
+        return index
+
+    @staticmethod
+    def get_index() -> PrefixIndex:
+        index = current_app.extensions.get("autocomplete")
+        if index is None:
+            index = AutocompleteService.build()
+        return index
+
+    @staticmethod
+    def sync(index: PrefixIndex) -> int:
+        """
+        Agrega las filas con id mayor al ultimo visto (altas de otros
+        workers). Si otro thread ya esta sincronizando, no hace nada.
+        """
+        if not index.sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            added = 0
+            last_ids = dict(index.last_ids)
+            for content_type, content_id, title in AutocompleteService._scan(
+                dict(last_ids), current_app.config["EXPORT_YIELD_PER"]
+            ):
+                added += index.add(content_type, content_id, title)
+                last_ids[content_type] = max(last_ids[content_type], content_id)
+            index.synced(last_ids)
+            return added
+        finally:
+            index.sync_lock.release()
+
+    @staticmethod
+    def search(prefix: str, limit: int) -> list[dict]:
+        """Titulos que empiezan con `prefix`. ValueError si el prefijo queda vacio."""
+        normalized = normalize(prefix or "")
+        if not normalized:
+            raise ValueError("Parametro 'prefix' es obligatorio.")
+
+        index = AutocompleteService.get_index()
+        if time.monotonic() - index.synced_at > current_app.config["AUTOCOMPLETE_SYNC_SECONDS"]:
+            AutocompleteService.sync(index)
+        return index.search(normalized, limit)
+
+    @staticmethod
+    def added(content_type: str, content_id: int, title: str) -> None:
+        """Alta local: entra al indice sin esperar el sync (si el indice ya existe)."""
+        index = current_app.extensions.get("autocomplete")
+        if index is not None:
+            index.add(content_type, content_id, title)
+
+    @staticmethod
+    def removed(content_type: str, content_id: int) -> None:
+        index = current_app.extensions.get("autocomplete")
+        if index is not None:
+            index.remove(content_type, content_id)
+
+    @staticmethod
+    def stats() -> dict:
+        index = current_app.extensions.get("autocomplete")
+        return index.stats() if index is not None else {}
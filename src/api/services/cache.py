@@ -0,0 +1,114 @@
+"""
+Cache en memoria (LRU + TTL) para lecturas del catalogo.
+
+Cada worker tiene sus propias caches, guardadas en app.extensions.
+Los servicios las invalidan en cada escritura local; las escrituras de
+otros workers se ven a mas tardar cuando vence el TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+# marca de "no estaba en la cache" (None es un valor valido)
+MISSING = object()
+
+# nombre de cache -> clave de config con su tamaño maximo
+CACHE_SIZES = {
+    "movies": "CATALOG_CACHE_MAX_ENTRIES",
+    "series": "CATALOG_CACHE_MAX_ENTRIES",
+    "movie_pages": "CATALOG_CACHE_PAGE_MAX_ENTRIES",
+    "series_pages": "CATALOG_CACHE_PAGE_MAX_ENTRIES",
+}
+
+
+class LRUTTLCache:
+    """
+    Diccionario acotado: descarta la entrada usada hace mas tiempo cuando
+    se llena y trata como ausentes las entradas mas viejas que ttl_seconds.
+    Con max_entries=0 queda deshabilitada (nunca guarda nada).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Valor guardado para key, o MISSING."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return MISSING
+
+            expires_at, value = item
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def get_cache(name: str) -> LRUTTLCache:
+    """Cache `name` de la app actual (se crea la primera vez con su config)."""
+    caches = current_app.extensions.setdefault("catalog_cache", {})
+    cache = caches.get(name)
+    if cache is None:
+        config = current_app.config
+        max_entries = config[CACHE_SIZES[name]] if config["CATALOG_CACHE_ENABLED"] else 0
+        cache = caches.setdefault(
+            name,
+            LRUTTLCache(max_entries, config["CATALOG_CACHE_TTL_SECONDS"]),
+        )
+    return cache
+
+
+def cache_stats() -> dict:
+    """Contadores de todas las caches creadas en la app actual."""
+    caches = current_app.extensions.get("catalog_cache", {})
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -1,6 +1,21 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional
+from src.api.filters import prefix_clause, read_range, read_text
+from src.api.pagination import Sort, keyset_page, parse_sort
+from src.api.services.autocomplete_service import AutocompleteService
+from src.api.services.bulk_import_service import BulkImportService
+from src.api.services.cache import MISSING, get_cache
+from src.api.validation import int_field, text_field
 from src.extensions import db
-from src.models.movie import Movie
+from src.routing import sticky_primary
+from src.models.movie import MOVIE_TITLE_KEY, Movie
+
+# ?sort= de GET /movies/: nombre -> (columna, load del cursor, nullable)
+MOVIE_SORTS = {
+    "created_at": (Movie.created_at, datetime.fromisoformat, False),
+    "title": (MOVIE_TITLE_KEY, None, False),
+    "release_year": (Movie.release_year, None, True),
+}
 
 
 class MovieService:
@@ -8,23 +23,154 @@ class MovieService:
     def list_all() -> List[Movie]:
         return Movie.query.order_by(Movie.id.asc()).all()
 
+    @staticmethod
+    def parse_list_args(args) -> tuple[dict, Sort]:
+        """
+        Filtros y orden de GET /movies/ a partir de los query args:
+        ?genre=, ?release_year_min=, ?release_year_max=, ?title_prefix= y
+        ?sort= (created_at, title, release_year; "-" = descendente).
+        Devuelve ({filtro: valor}, Sort) o lanza ValueError.
+        """
+        year_min, year_max = read_range(args, "release_year")
+        filters = {
+            "genre": read_text(args, "genre"),
+            "release_year_min": year_min,
+            "release_year_max": year_max,
+            "title_prefix": read_text(args, "title_prefix"),
+        }
+        filters = {name: value for name, value in filters.items() if value is not None}
+        return filters, parse_sort(args.get("sort"), MOVIE_SORTS)
+
+    @staticmethod
+    def filter_query(query, filters: dict, dialect_name: str):
+        """Aplica los filtros de parse_list_args a un Query o a un select()."""
+        if "genre" in filters:
+            query = query.filter(Movie.genre == filters["genre"])
+        if "release_year_min" in filters:
+            query = query.filter(Movie.release_year >= filters["release_year_min"])
+        if "release_year_max" in filters:
+            query = query.filter(Movie.release_year <= filters["release_year_max"])
+        if "title_prefix" in filters:
+            query = query.filter(
+                prefix_clause(MOVIE_TITLE_KEY, filters["title_prefix"], dialect_name)
+            )
+        return query
+
+    @staticmethod
+    def list_page(limit: int, cursor=None, filters: Optional[dict] = None, sort=None):
+        """
+        Pagina de peliculas (por defecto mas recientes primero), filtrada con
+        `filters` (ver parse_list_args). Devuelve (items, next_cursor).
+        """
+        query = MovieService.filter_query(Movie.query, filters or {}, db.engine.dialect.name)
+        return keyset_page(query, Movie, limit, cursor, sort)
+
+    @staticmethod
+    def list_page_cached(
+        limit: int,
+        cursor,
+        version,
+        filters: Optional[dict] = None,
+        sort: Optional[Sort] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        Como list_page pero ya serializada y guardada en la cache de paginas.
+        `version` es collection_version(): entra en la clave, asi que una
+        escritura de cualquier worker hace que la pagina vieja no se use mas.
+        Los filtros y el orden tambien entran en la clave.
+        """
+        filters = filters or {}
+        cache = get_cache("movie_pages")
+        key = (version, limit, cursor, tuple(sorted(filters.items())), sort.token if sort else None)
+        page = cache.get(key)
+        if page is MISSING:
+            movies, next_cursor = MovieService.list_page(limit, cursor, filters, sort)
+            page = ([m.to_dict() for m in movies], next_cursor)
+            cache.set(key, page)
+        return page
+
+    @staticmethod
+    def iter_all(batch_size: int) -> Iterator[Movie]:
+        """
+        Recorre todas las peliculas por id con un cursor del lado del servidor
+        (yield_per): en memoria nunca hay mas de batch_size filas.
+        """
+        stmt = (
+            db.select(Movie)
+            .order_by(Movie.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from db.session.scalars(stmt)
+
+    @staticmethod
+    def collection_version() -> tuple:
+        """(max(updated_at), count) de movies: validador de los listados."""
+        return tuple(
+            db.session.execute(
+                db.select(db.func.max(Movie.updated_at), db.func.count(Movie.id))
+            ).one()
+        )
+
     @staticmethod
     def get(movie_id: int) -> Optional[Movie]:
         return Movie.query.get(movie_id)
 
+    @staticmethod
+    def get_cached(movie_id: int) -> Optional[tuple[dict, datetime]]:
+        """
+        (pelicula serializada, updated_at) desde la cache; si no esta se lee
+        de la base y se guarda. None si no existe (eso no se cachea).
+        """
+        cache = get_cache("movies")
+        # recien escribio: saltear la cache (pudo llenarse desde la replica)
+        cached = MISSING if sticky_primary() else cache.get(movie_id)
+        if cached is MISSING:
+            movie = db.session.get(Movie, movie_id)
+            if movie is None:
+                return None
+            cached = (movie.to_dict(), movie.updated_at)
+            cache.set(movie_id, cached)
+        return cached
+
+    @staticmethod
+    def invalidate_cache(movie_id: Optional[int] = None) -> None:
+        """Descarta la pelicula (si se indica) y todas las paginas cacheadas."""
+        if movie_id is not None:
+            get_cache("movies").delete(movie_id)
+        get_cache("movie_pages").clear()
+
+    @staticmethod
+    def validate(data: dict) -> dict:
+        """
+        Reglas de alta de una pelicula. Devuelve las columnas a guardar
+        o lanza ValueError. La usan create y la carga masiva.
+        """
+        columns = Movie.__table__.c
+        return {
+            "title": text_field(data, "title", columns.title.type.length, required=True),
+            "genre": text_field(data, "genre", columns.genre.type.length),
+            "release_year": int_field(data, "release_year"),
+        }
+
     @staticmethod
     def create(data: dict) -> Movie:
-        movie = Movie(
-            title=data.get("title"),
-            genre=data.get("genre"),
-            release_year=data.get("release_year"),
-        )
+        movie = Movie(**MovieService.validate(data))
         db.session.add(movie)
         db.session.commit()
+        MovieService.invalidate_cache()
+        AutocompleteService.added("movie", movie.id, movie.title)
         return movie
 
+    @staticmethod
+    def bulk_import(stream) -> dict:
+        """Carga masiva NDJSON (ver BulkImportService). Devuelve el reporte."""
+        report = BulkImportService.import_ndjson(stream, Movie, MovieService.validate)
+        MovieService.invalidate_cache()
+        return report
+
     @staticmethod
     def update(movie: Movie, data: dict) -> Movie:
+        old_title = movie.title
         if "title" in data:
             movie.title = data["title"]
         if "genre" in data:
@@ -33,9 +179,16 @@ class MovieService:
             movie.release_year = data["release_year"]
 
         db.session.commit()
+        MovieService.invalidate_cache(movie.id)
+        if movie.title != old_title:
+            AutocompleteService.removed("movie", movie.id)
+            AutocompleteService.added("movie", movie.id, movie.title)
         return movie
 
     @staticmethod
     def delete(movie: Movie) -> None:
+        movie_id = movie.id
         db.session.delete(movie)
         db.session.commit()
+        MovieService.invalidate_cache(movie_id)
+        AutocompleteService.removed("movie", movie_id)
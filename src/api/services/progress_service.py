@@ -1,6 +1,13 @@
 # src/api/services/progress_service.py
 
+from collections import defaultdict
 from datetime import datetime
+from typing import Iterator
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql import ClauseElement
+from src.api.pagination import keyset_page
+from src.api.validation import int_field, text_field
 from src.extensions import db
 from src.models.user import User
 from src.models.movie import Movie
@@ -8,6 +15,58 @@ from src.models.series import Series
 from src.models.watch_entry import WatchEntry
 
 
+# content_type de WatchEntry -> modelo al que apunta content_id
+CONTENT_MODELS = {
+    "movie": Movie,
+    "series": Series,
+}
+
+# valores iniciales de una entrada nueva (ver _watch_entry_insert)
+NEW_MOVIE_ENTRY = {
+    "status": "watching",
+    "watched_episodes": 1,     # para película tratamos como '1 de 1'
+    "total_episodes": 1,
+    "current_season": None,
+    "current_episode": None,
+}
+NEW_SERIES_ENTRY = {
+    "status": "watching",
+    "current_season": 1,
+    "current_episode": 1,
+    "watched_episodes": 0,
+    # la suma de episodios de sus seasons, mantenida por SeriesService
+    "total_episodes": Series.total_episodes,
+}
+
+# campos que se pueden modificar con update_series_progress
+PROGRESS_FIELDS = (
+    "current_season",
+    "current_episode",
+    "watched_episodes",
+    "total_episodes",
+    "status",
+)
+
+# valores de WatchEntry.status
+PROGRESS_STATUSES = ("watching", "completed", "dropped", "planned")
+
+
+def _progress_values(item: dict) -> dict:
+    """Campos de PROGRESS_FIELDS presentes en el item, ya chequeados (ValueError si no)."""
+    values = {}
+    for field in PROGRESS_FIELDS:
+        if field not in item:
+            continue
+        if field == "status":
+            value = text_field(item, field, max_length=30)
+            if value is not None and value not in PROGRESS_STATUSES:
+                raise ValueError(f"Campo 'status' debe ser uno de: {', '.join(PROGRESS_STATUSES)}.")
+        else:
+            value = int_field(item, field)
+        values[field] = value
+    return values
+
+
 class ProgressService:
     """
     Lógica de:
@@ -51,6 +110,91 @@ class ProgressService:
             .first()
         )
 
+    @staticmethod
+    def _insert_watch_entry(
+        user_id: int,
+        content_type: str,
+        content_model,
+        content_id: int,
+        values: dict,
+    ) -> WatchEntry | None:
+        """
+        Inserta la WatchEntry con la sentencia de _watch_entry_insert.
+        Devuelve None si no se inserto nada; el que llama averigua el motivo
+        (solo en ese camino, que es el raro, se hacen mas queries).
+        """
+        stmt = ProgressService._watch_entry_insert(
+            db.session.get_bind().dialect.name,
+            user_id,
+            content_type,
+            content_model,
+            content_id,
+            values,
+        )
+        entry = db.session.scalars(stmt).first()
+        if entry is not None:
+            # la sacamos de la sesion para que el commit no la expire:
+            # ya tiene todas sus columnas gracias a RETURNING
+            db.session.expunge(entry)
+        db.session.commit()
+        return entry
+
+    @staticmethod
+    def _watch_entry_insert(
+        dialect_name: str,
+        user_id: int,
+        content_type: str,
+        content_model,
+        content_id: int,
+        values: dict,
+    ):
+        """
+        Arma el INSERT de una WatchEntry en UNA sola sentencia:
+
+            INSERT INTO watch_entries (...)
+            SELECT ... FROM users JOIN <movies|series> ON <contenido>.id = :content_id
+            WHERE users.id = :user_id
+            ON CONFLICT (user_id, content_type, content_id) DO NOTHING
+            RETURNING ...
+
+        - el SELECT valida que existan el usuario y el contenido
+        - el indice unico resuelve los duplicados (tambien con clicks concurrentes)
+        Lo comparten la version sync y la async del servicio.
+        """
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        now = datetime.utcnow()
+        columns = WatchEntry.__table__.c
+        row = {
+            "user_id": User.id,
+            "content_type": db.literal(content_type, columns.content_type.type),
+            "content_id": content_model.id,
+            "created_at": db.literal(now, columns.created_at.type),
+            "updated_at": db.literal(now, columns.updated_at.type),
+        }
+        for field, value in values.items():
+            # los valores pueden ser constantes o columnas/expresiones SQL
+            if not isinstance(value, (ClauseElement, QueryableAttribute)):
+                value = db.literal(value, columns[field].type)
+            row[field] = value
+
+        source = (
+            db.select(*row.values())
+            .join(content_model, content_model.id == content_id)
+            .where(User.id == user_id)
+        )
+        return (
+            insert(WatchEntry)
+            .from_select(list(row), source)
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "content_type", "content_id"],
+            )
+            .returning(WatchEntry)
+        )
+
     # ---------- API pública que usa el blueprint ----------
 
     @staticmethod
@@ -66,83 +210,118 @@ class ProgressService:
             .all()
         )
 
+    @staticmethod
+    def list_user_watchlist_page(user_id: int, limit: int, cursor=None):
+        """
+        Igual que list_user_watchlist pero paginado por cursor.
+        Devuelve (entries, next_cursor).
+        """
+        entries, next_cursor = keyset_page(
+            WatchEntry.query.filter_by(user_id=user_id),
+            WatchEntry,
+            limit,
+            cursor,
+        )
+        if not entries:
+            # solo si la pagina vino vacia hace falta distinguir
+            # "usuario sin entradas" de "usuario inexistente"
+            ProgressService._get_user(user_id)
+
+        return entries, next_cursor
+
+    @staticmethod
+    def watchlist_version(user_id: int) -> tuple:
+        """(max(updated_at), count) de la watchlist del usuario."""
+        return tuple(
+            db.session.execute(
+                db.select(db.func.max(WatchEntry.updated_at), db.func.count(WatchEntry.id))
+                .where(WatchEntry.user_id == user_id)
+            ).one()
+        )
+
+    @staticmethod
+    def iter_user_entries(user_id: int, batch_size: int) -> Iterator[WatchEntry]:
+        """
+        Recorre todas las WatchEntry del usuario con un cursor del lado del
+        servidor (yield_per), en el mismo orden que la watchlist paginada.
+        El usuario se valida al llamar (LookupError); el query recien corre
+        al consumir el iterador (p. ej. dentro de la respuesta en streaming).
+        """
+        ProgressService._get_user(user_id)  # valida que exista
+
+        stmt = (
+            db.select(WatchEntry)
+            .filter_by(user_id=user_id)
+            .order_by(WatchEntry.created_at.desc(), WatchEntry.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+
+        def stream() -> Iterator[WatchEntry]:
+            yield from db.session.scalars(stmt)
+
+        return stream()
+
+    @staticmethod
+    def load_contents(entries: list[WatchEntry]) -> dict[tuple[str, int], Movie | Series]:
+        """
+        Carga la pelicula/serie de cada WatchEntry sin N+1:
+        agrupa por content_type y hace UN query con IN por cada tipo.
+        Devuelve {(content_type, content_id): Movie | Series}.
+        """
+        ids_by_type: dict[str, set[int]] = defaultdict(set)
+        for entry in entries:
+            ids_by_type[entry.content_type].add(entry.content_id)
+
+        contents: dict[tuple[str, int], Movie | Series] = {}
+        for content_type, ids in ids_by_type.items():
+            model = CONTENT_MODELS.get(content_type)
+            if model is None:
+                continue
+            for item in model.query.filter(model.id.in_(ids)):
+                contents[(content_type, item.id)] = item
+
+        return contents
+
     @staticmethod
     def add_movie(user_id: int, movie_id: int) -> WatchEntry:
         """
         Agrega una pelicula a la watchlist del usuario.
+        - si el usuario o la pelicula no existen -> LookupError
         - si ya existe esa entrada -> ValueError
         """
-        user = ProgressService._get_user(user_id)
-        movie = ProgressService._get_movie(movie_id)
-
-        already = ProgressService._find_watch_entry(
-            user_id=user.id,
+        entry = ProgressService._insert_watch_entry(
+            user_id=user_id,
             content_type="movie",
-            content_id=movie.id,
+            content_model=Movie,
+            content_id=movie_id,
+            values=NEW_MOVIE_ENTRY,
         )
-        if already:
+        if entry is None:
+            ProgressService._get_user(user_id)
+            ProgressService._get_movie(movie_id)
             raise ValueError("La película ya está en tu watchlist")
-
-        entry = WatchEntry(
-            user_id=user.id,
-            content_type="movie",
-            content_id=movie.id,
-            status="watching",
-            watched_episodes=1,     # para película tratamos como '1 de 1'
-            total_episodes=1,
-            current_season=None,
-            current_episode=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-
-        db.session.add(entry)
-        db.session.commit()
-        db.session.refresh(entry)
         return entry
 
     @staticmethod
     def add_series(user_id: int, series_id: int) -> WatchEntry:
         """
         Agrega una serie a la watchlist con progreso inicial.
+        - si el usuario o la serie no existen -> LookupError
         - si ya existe esa entrada -> ValueError
-        - total_episodes se calcula sumando todos los episodios declarados
-          en las temporadas (seasons) de esa serie.
+        - total_episodes sale de Series.total_episodes (la suma de episodios
+          de sus seasons, mantenida por SeriesService).
         """
-        user = ProgressService._get_user(user_id)
-        series = ProgressService._get_series(series_id)
-
-        already = ProgressService._find_watch_entry(
-            user_id=user.id,
+        entry = ProgressService._insert_watch_entry(
+            user_id=user_id,
             content_type="series",
-            content_id=series.id,
+            content_model=Series,
+            content_id=series_id,
+            values=NEW_SERIES_ENTRY,
         )
-        if already:
+        if entry is None:
+            ProgressService._get_user(user_id)
+            ProgressService._get_series(series_id)
             raise ValueError("La serie ya está en tu watchlist")
-
-        # NUEVO: calcular total de episodios declarados en las seasons
-        total_eps = 0
-        # series.seasons es una relación lazy="dynamic", así que necesitamos .all()
-        for season in series.seasons.all():
-            if season.episodes_count:
-                total_eps += season.episodes_count
-
-        entry = WatchEntry(
-            user_id=user.id,
-            content_type="series",
-            content_id=series.id,
-            status="watching",
-            current_season=1,
-            current_episode=1,
-            watched_episodes=0,
-            total_episodes=total_eps,   # <-- antes era 0 fijo
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-
-        db.session.add(entry)
-        db.session.commit()
-        db.session.refresh(entry)
         return entry
 
     @staticmethod
@@ -158,19 +337,80 @@ class ProgressService:
         if not entry:
             raise LookupError("Todavia no agregaste esa serie a tu watchlist")
 
-        allowed_fields = [
-            "current_season",
-            "current_episode",
-            "watched_episodes",
-            "total_episodes",
-            "status",
-        ]
-
-        for field in allowed_fields:
-            if field in data:
-                setattr(entry, field, data[field])
+        for field, value in _progress_values(data).items():
+            setattr(entry, field, value)
 
         entry.updated_at = datetime.utcnow()
         db.session.commit()
         db.session.refresh(entry)
         return entry
+
+    @staticmethod
+    def update_series_progress_batch(user_id: int, items: list) -> list[dict]:
+        """
+        update_series_progress para muchas series en un solo viaje:
+        UN select de todas las entradas, UN UPDATE (executemany por id) y
+        UN commit. Cada item es {"series_id": ..., <PROGRESS_FIELDS>...}.
+
+        Devuelve un resultado por item, en el mismo orden:
+          {"series_id": 3, "status": 200, "entry": {...}}
+          {"series_id": 9, "status": 404, "detail": "..."}
+        Un item invalido (series_id o algun campo mal tipado) o sin entrada
+        no frena a los demas; si falla el UPDATE se hace rollback del lote.
+        """
+        results: list[dict] = []
+        wanted: dict[int, dict] = {}  # series_id -> campos a escribir
+        for item in items:
+            series_id = item.get("series_id") if isinstance(item, dict) else None
+            if not isinstance(series_id, int) or isinstance(series_id, bool):
+                results.append({"series_id": series_id, "status": 400, "detail": "series_id debe ser un entero."})
+            elif series_id in wanted:
+                results.append({"series_id": series_id, "status": 400, "detail": "series_id repetido en el lote."})
+            else:
+                try:
+                    wanted[series_id] = _progress_values(item)
+                except ValueError as exc:
+                    results.append({"series_id": series_id, "status": 400, "detail": str(exc)})
+                    continue
+                results.append({"series_id": series_id})
+
+        entries: dict[int, WatchEntry] = {}
+        if wanted:
+            # FOR UPDATE (Postgres): nadie cambia estas filas entre el select y
+            # el update, asi que completar con los valores leidos es seguro
+            query = WatchEntry.query.filter(
+                WatchEntry.user_id == user_id,
+                WatchEntry.content_type == "series",
+                WatchEntry.content_id.in_(wanted),
+            ).with_for_update()
+            entries = {entry.content_id: entry for entry in query}
+            # sueltas de la sesion: el commit no las expira (sin refresh por fila)
+            for entry in entries.values():
+                db.session.expunge(entry)
+
+        now = datetime.utcnow()
+        rows = []
+        for series_id, entry in entries.items():
+            for field, value in wanted[series_id].items():
+                setattr(entry, field, value)
+            entry.updated_at = now
+            # todas las filas con las mismas columnas -> un solo executemany
+            rows.append({"id": entry.id, "updated_at": now, **{field: getattr(entry, field) for field in PROGRESS_FIELDS}})
+
+        try:
+            if rows:
+                db.session.execute(db.update(WatchEntry), rows)
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            raise
+
+        for result in results:
+            if "status" in result:
+                continue
+            entry = entries.get(result["series_id"])
+            if entry is None:
+                result.update(status=404, detail="Todavia no agregaste esa serie a tu watchlist")
+            else:
+                result.update(status=200, entry=entry.to_dict(include_user=False))
+        return results
@@ -0,0 +1,151 @@
+"""
+Busqueda de texto sobre titulos (y genero) de peliculas y series.
+
+El ranking sale del indice de cada base (ver src/models/search.py):
+bm25() de FTS5 en SQLite, ts_rank() sobre el tsvector en Postgres. Se
+ordena por `rank` ascendente (bm25 ya es "menor = mejor"; en Postgres se
+usa -ts_rank) y se pagina por cursor con la tupla (rank, type, id).
+
+Para que una busqueda muy amplia ("dr", "drama") no ordene y pagine cientos
+de miles de filas, cada tipo aporta como mucho SEARCH_MAX_CANDIDATES
+coincidencias: las mejor rankeadas (top-N por rank, id dentro de cada select;
+la base puntua todas las coincidencias pero no las ordena). El cap corta la
+profundidad de la paginacion, no la calidad de los primeros resultados.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from flask import current_app
+
+from src.api.pagination import decode_values, encode_values
+from src.api.services.progress_service import CONTENT_MODELS
+from src.extensions import db
+from src.models.search import SQLITE_WEIGHTS, fts_table, postgres_search_vector
+
+# content_type -> tabla con indice de busqueda
+SEARCH_TABLES = {
+    "movie": "movies",
+    "series": "series",
+}
+
+MAX_QUERY_TERMS = 8
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, str, int]:
+    """Cursor de /search -> (rank, type, id). ValueError si es invalido."""
+    try:
+        rank, content_type, row_id = decode_values(cursor)
+        if content_type not in SEARCH_TABLES:
+            raise ValueError(content_type)
+        return float(rank), content_type, int(row_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Parametro 'cursor' invalido.") from exc
+
+
+class SearchService:
+    @staticmethod
+    def parse_terms(q: Optional[str]) -> list[str]:
+        """Palabras de la busqueda (solo letras/digitos). ValueError si no hay ninguna."""
+        terms = _TERM_RE.findall(q or "")[:MAX_QUERY_TERMS]
+        if not terms:
+            raise ValueError("Parametro 'q' es obligatorio.")
+        return [term.lower() for term in terms]
+
+    @staticmethod
+    def _sqlite_select(content_type: str) -> str:
+        fts = fts_table(SEARCH_TABLES[content_type])
+        weights = ", ".join(str(w) for w in SQLITE_WEIGHTS)
+        # bm25() repetido en el ORDER BY: la tabla FTS5 tiene su propia
+        # columna oculta "rank", que no usa estos pesos
+        bm25 = f"bm25({fts}, {weights})"
+        return (
+            f"SELECT * FROM (SELECT '{content_type}' AS type, rowid AS id, "
+            f"{bm25} AS rank FROM {fts} WHERE {fts} MATCH :match "
+            f"ORDER BY {bm25}, rowid LIMIT :candidates)"
+        )
+
+    @staticmethod
+    def _postgres_select(content_type: str) -> str:
+        table = SEARCH_TABLES[content_type]
+        vector = postgres_search_vector(table)
+        return (
+            f"(SELECT '{content_type}' AS type, id, "
+            f"-ts_rank({vector}, to_tsquery('simple', :match)) AS rank FROM {table} "
+            f"WHERE ({vector}) @@ to_tsquery('simple', :match) "
+            f"ORDER BY rank, id LIMIT :candidates)"
+        )
+
+    @staticmethod
+    def match_expression(terms: list[str], dialect: str) -> str:
+        """
+        Query de texto para el motor: todas las palabras deben aparecer y la
+        ultima vale como prefijo (para buscar mientras se escribe).
+        """
+        if dialect == "postgresql":
+            return " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+        return " ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+
+    @staticmethod
+    def search(terms: list[str], limit: int, cursor=None, content_types=None):
+        """
+        Resultados rankeados para `terms` (ver match_expression). Devuelve (items, next_cursor); cada item es
+        {"type", "score", "content"} con la pelicula/serie serializada.
+        """
+        content_types = content_types or list(SEARCH_TABLES)
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            selects = [SearchService._postgres_select(t) for t in content_types]
+        else:
+            selects = [SearchService._sqlite_select(t) for t in content_types]
+
+        params = {
+            "match": SearchService.match_expression(terms, dialect),
+            "candidates": current_app.config["SEARCH_MAX_CANDIDATES"],
+            "limit": limit + 1,
+        }
+        where = ""
+        if cursor is not None:
+            where = "WHERE (rank, type, id) > (:c_rank, :c_type, :c_id)"
+            params.update(c_rank=cursor[0], c_type=cursor[1], c_id=cursor[2])
+
+        sql = (
+            f"SELECT type, id, rank FROM ({' UNION ALL '.join(selects)}) AS hits "
+            f"{where} ORDER BY rank, type, id LIMIT :limit"
+        )
+        rows = db.session.execute(db.text(sql), params).all()
+
+        hits = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = hits[-1]
+            next_cursor = encode_values(last.rank, last.type, last.id)
+
+        contents = SearchService._load(hits)
+        items = [
+            {
+                "type": hit.type,
+                "score": -hit.rank,
+                "content": contents[(hit.type, hit.id)].to_dict(),
+            }
+            for hit in hits
+            if (hit.type, hit.id) in contents
+        ]
+        return items, next_cursor
+
+    @staticmethod
+    def _load(hits) -> dict:
+        """Carga las filas de los resultados: un query con IN por tipo."""
+        ids_by_type: dict[str, list[int]] = {}
+        for hit in hits:
+            ids_by_type.setdefault(hit.type, []).append(hit.id)
+
+        contents = {}
+        for content_type, ids in ids_by_type.items():
+            model = CONTENT_MODELS[content_type]
+            for item in db.session.scalars(db.select(model).where(model.id.in_(ids))):
+                contents[(content_type, item.id)] = item
+        return contents
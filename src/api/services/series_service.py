@@ -1,9 +1,24 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Iterator, List, Optional
 from datetime import datetime
 
+from src.api.filters import prefix_clause, read_text
+from src.api.pagination import Sort, keyset_page, parse_sort
+from src.api.services.autocomplete_service import AutocompleteService
+from src.api.services.bulk_import_service import BulkImportService
+from src.api.services.cache import MISSING, get_cache
+from src.api.validation import int_field, text_field
 from src.extensions import db
-from src.models.series import Series
+from src.routing import sticky_primary
+from src.models.series import SERIES_TITLE_KEY, Series
 from src.models.seasons import Season
+from src.models.watch_entry import WatchEntry
+
+# ?sort= de GET /series/: nombre -> (columna, load del cursor, nullable)
+SERIES_SORTS = {
+    "created_at": (Series.created_at, datetime.fromisoformat, False),
+    "title": (SERIES_TITLE_KEY, None, False),
+}
 
 
 class SeriesService:
@@ -12,6 +27,90 @@ class SeriesService:
         """Return todas las series."""
         return Series.query.all()
 
+    @staticmethod
+    def parse_list_args(args) -> tuple[dict, Sort]:
+        """
+        Filtros y orden de GET /series/: ?title_prefix= y ?sort=
+        (created_at, title; "-" = descendente). Lanza ValueError si son invalidos.
+        """
+        filters = {"title_prefix": read_text(args, "title_prefix")}
+        filters = {name: value for name, value in filters.items() if value is not None}
+        return filters, parse_sort(args.get("sort"), SERIES_SORTS)
+
+    @staticmethod
+    def filter_query(query, filters: dict, dialect_name: str):
+        """Aplica los filtros de parse_list_args a un Query o a un select()."""
+        if "title_prefix" in filters:
+            query = query.filter(
+                prefix_clause(SERIES_TITLE_KEY, filters["title_prefix"], dialect_name)
+            )
+        return query
+
+    @staticmethod
+    def list_page(limit: int, cursor=None, filters: Optional[dict] = None, sort=None):
+        """Pagina de series (por defecto mas recientes primero). Devuelve (items, next_cursor)."""
+        query = SeriesService.filter_query(Series.query, filters or {}, db.engine.dialect.name)
+        return keyset_page(query, Series, limit, cursor, sort)
+
+    @staticmethod
+    def list_page_cached(
+        limit: int,
+        cursor,
+        version,
+        include_seasons: bool = False,
+        filters: Optional[dict] = None,
+        sort: Optional[Sort] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        Pagina ya serializada (con o sin seasons) desde la cache de paginas.
+        `version` es collection_version() y forma parte de la clave, igual
+        que los filtros y el orden.
+        """
+        filters = filters or {}
+        cache = get_cache("series_pages")
+        key = (
+            version,
+            limit,
+            cursor,
+            include_seasons,
+            tuple(sorted(filters.items())),
+            sort.token if sort else None,
+        )
+        page = cache.get(key)
+        if page is MISSING:
+            series_list, next_cursor = SeriesService.list_page(limit, cursor, filters, sort)
+            if include_seasons:
+                seasons = SeriesService.load_seasons(series_list)
+                items = [
+                    s.to_dict(include_seasons=True, seasons=seasons[s.id])
+                    for s in series_list
+                ]
+            else:
+                items = [s.to_dict(include_seasons=False) for s in series_list]
+            page = (items, next_cursor)
+            cache.set(key, page)
+        return page
+
+    @staticmethod
+    def validate(data: dict) -> dict:
+        """
+        Reglas de alta de una serie. Devuelve las columnas a guardar
+        o lanza ValueError. La usan create y la carga masiva.
+        """
+        return {
+            "title": text_field(data, "title", Series.__table__.c.title.type.length, required=True),
+            "total_seasons": int_field(data, "total_seasons", default=0),
+        }
+
+    @staticmethod
+    def collection_version() -> tuple:
+        """(max(updated_at), count) de series: validador de los listados."""
+        return tuple(
+            db.session.execute(
+                db.select(db.func.max(Series.updated_at), db.func.count(Series.id))
+            ).one()
+        )
+
     @staticmethod
     def create(data: dict) -> Series:
         """
@@ -22,27 +121,98 @@ class SeriesService:
             "total_seasons": 3   # opcional, default 0
         }
         """
-        title = data.get("title")
-        if not title:
-            raise ValueError("Campo 'title' es obligatorio.")
-
-        total_seasons = data.get("total_seasons", 0)
-
         series = Series(
-            title=title,
-            total_seasons=total_seasons,
+            **SeriesService.validate(data),
             created_at=datetime.utcnow(),
         )
 
         db.session.add(series)
         db.session.commit()
+        SeriesService.invalidate_cache()
+        AutocompleteService.added("series", series.id, series.title)
 
         return series
 
+    @staticmethod
+    def bulk_import(stream) -> dict:
+        """Carga masiva NDJSON (ver BulkImportService). Devuelve el reporte."""
+        report = BulkImportService.import_ndjson(stream, Series, SeriesService.validate)
+        SeriesService.invalidate_cache()
+        return report
+
+    @staticmethod
+    def invalidate_cache(series_id: Optional[int] = None) -> None:
+        """Descarta la serie (si se indica) y todas las paginas cacheadas."""
+        if series_id is not None:
+            get_cache("series").delete(series_id)
+        get_cache("series_pages").clear()
+
     @staticmethod
     def get_by_id(series_id: int) -> Optional[Series]:
         return Series.query.get(series_id)
 
+    @staticmethod
+    def iter_with_seasons(batch_size: int) -> Iterator[tuple[Series, List[Season]]]:
+        """
+        Recorre todas las series (con sus seasons) con un cursor del lado del
+        servidor. Por cada lote de batch_size series se hace un query de seasons.
+        """
+        stmt = (
+            db.select(Series)
+            .order_by(Series.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for batch in db.session.scalars(stmt).partitions():
+            seasons = SeriesService.load_seasons(batch)
+            for series in batch:
+                yield series, seasons[series.id]
+
+    @staticmethod
+    def load_seasons(series_list: List[Series]) -> dict[int, List[Season]]:
+        """
+        Carga las seasons de varias series con UN solo query (IN) y las
+        agrupa en memoria: {series_id: [Season, ...]} ordenadas por numero.
+        """
+        seasons_by_series: dict[int, List[Season]] = defaultdict(list)
+        ids = [series.id for series in series_list]
+        if not ids:
+            return seasons_by_series
+
+        seasons = (
+            Season.query.filter(Season.series_id.in_(ids))
+            .order_by(Season.series_id, Season.number)
+        )
+        for season in seasons:
+            seasons_by_series[season.series_id].append(season)
+
+        return seasons_by_series
+
+    @staticmethod
+    def get_cached(series_id: int) -> Optional[tuple[dict, datetime]]:
+        """
+        (serie serializada con seasons, updated_at) desde la cache; si no esta
+        se lee de la base (2 queries) y se guarda. None si no existe.
+        """
+        cache = get_cache("series")
+        # recien escribio: saltear la cache (pudo llenarse desde la replica)
+        cached = MISSING if sticky_primary() else cache.get(series_id)
+        if cached is MISSING:
+            found = SeriesService.get_with_seasons(series_id)
+            if found is None:
+                return None
+            series, seasons = found
+            cached = (series.to_dict(include_seasons=True, seasons=seasons), series.updated_at)
+            cache.set(series_id, cached)
+        return cached
+
+    @staticmethod
+    def get_with_seasons(series_id: int) -> Optional[tuple[Series, List[Season]]]:
+        """Serie + sus seasons en 2 queries. None si la serie no existe."""
+        series = SeriesService.get_by_id(series_id)
+        if series is None:
+            return None
+        return series, SeriesService.load_seasons([series])[series.id]
+
     @staticmethod
     def add_season(series_id: int, data: dict) -> Season:
         """
@@ -53,15 +223,19 @@ class SeriesService:
             "episodes_count": 12
         }
         """
-        series = SeriesService.get_by_id(series_id)
-        if series is None:
-            raise LookupError("Series no encontrada.")
-
-        number = data.get("number")
+        # antes de tocar la sesion: episodes_count termina en total_episodes
+        # de la serie y de cada watch_entry que la sigue
+        number = int_field(data, "number")
         if number is None:
             raise ValueError("Campo 'number' es obligatorio.")
+        episodes_count = int_field(data, "episodes_count", default=0) or 0
+        for name, value in (("number", number), ("episodes_count", episodes_count)):
+            if value < 0:
+                raise ValueError(f"Campo '{name}' no puede ser negativo.")
 
-        episodes_count = data.get("episodes_count", 0)
+        series = SeriesService.get_by_id(series_id)
+        if series is None:
+            raise LookupError("Series no encontrada.")
 
         season = Season(
             series_id=series.id,
@@ -76,6 +250,45 @@ class SeriesService:
         if number > (series.total_seasons or 0):
             series.total_seasons = number
 
+        # la serie "cambia" con cada temporada nueva (ETag de /series/<id>)
+        series.updated_at = datetime.utcnow()
+
+        SeriesService._apply_episodes_delta(series, episodes_count)
+
         db.session.commit()
+        SeriesService.invalidate_cache(series_id)
 
         return season
+
+    @staticmethod
+    def _apply_episodes_delta(series: Series, delta: int) -> None:
+        """
+        Suma `delta` a Series.total_episodes y propaga el nuevo total a las
+        watch_entries que siguen la serie, con un UPDATE set-based cada uno.
+        No hace commit: se llama dentro de la transaccion que agrega, edita
+        o borra la temporada (delta negativo al borrar, diferencia al editar).
+        """
+        if not delta:
+            return
+
+        # el incremento lo hace la base para no pisar altas concurrentes
+        db.session.execute(
+            db.update(Series)
+            .where(Series.id == series.id)
+            .values(total_episodes=Series.total_episodes + delta)
+        )
+
+        new_total = (
+            db.select(Series.total_episodes)
+            .where(Series.id == series.id)
+            .scalar_subquery()
+        )
+        db.session.execute(
+            db.update(WatchEntry)
+            .where(
+                WatchEntry.content_type == "series",
+                WatchEntry.content_id == series.id,
+            )
+            .values(total_episodes=new_total, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,171 @@
+"""
+Helpers para leer y escribir cuerpos NDJSON/CSV en streaming.
+
+La idea es no tener nunca el cuerpo completo en memoria: se procesa
+linea por linea directamente sobre el stream WSGI, y las exportaciones
+se generan fila por fila desde un cursor del lado del servidor.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator
+
+from flask import Response, request, stream_with_context
+
+from src.json_provider import dumps_bytes
+
+# tamaño del buffer de lectura sobre el stream WSGI
+READ_BUFFER_BYTES = 64 * 1024
+
+# las exportaciones juntan filas hasta este tamaño antes de mandarlas
+WRITE_CHUNK_BYTES = 64 * 1024
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def iter_ndjson(stream, max_line_bytes: int) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Recorre un stream NDJSON (un objeto JSON por linea) de forma incremental.
+
+    Devuelve tuplas (numero_de_linea, objeto, error):
+    - objeto es el dict parseado, o None si la linea tiene un error
+    - las lineas vacias se ignoran
+    - una linea mas larga que max_line_bytes se descarta entera y se reporta
+    """
+    if isinstance(stream, io.RawIOBase):
+        # LimitedStream de Werkzeug: el buffer hace que readline sea en C
+        stream = io.BufferedReader(stream, READ_BUFFER_BYTES)
+
+    line_no = 0
+    while True:
+        raw = stream.readline(max_line_bytes + 1)
+        if not raw:
+            return
+        line_no += 1
+
+        if len(raw) > max_line_bytes and not raw.endswith(b"\n"):
+            # descartamos el resto de la linea sin guardarla
+            while raw and not raw.endswith(b"\n"):
+                raw = stream.readline(READ_BUFFER_BYTES)
+            yield line_no, None, f"Linea mayor a {max_line_bytes} bytes."
+            continue
+
+        raw = raw.strip()
+        if not raw:
+            continue
+
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            yield line_no, None, "JSON invalido."
+            continue
+
+        if not isinstance(data, dict):
+            yield line_no, None, "Cada linea debe ser un objeto JSON."
+            continue
+
+        yield line_no, data, None
+
+
+def ndjson_lines(rows: Iterable[dict]) -> Iterator[bytes]:
+    """Un objeto JSON por linea."""
+    for row in rows:
+        yield dumps_bytes(row) + b"\n"
+
+
+def csv_lines(rows: Iterable[dict], fieldnames: list[str]) -> Iterator[bytes]:
+    """CSV con encabezado; los valores que no son escalares van como JSON."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {
+                key: json.dumps(value, separators=(",", ":"))
+                if isinstance(value, (dict, list))
+                else value
+                for key, value in row.items()
+            }
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # encabezado de una exportacion vacia
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def batch_chunks(chunks: Iterable[bytes], size: int = WRITE_CHUNK_BYTES) -> Iterator[bytes]:
+    """Junta escrituras chicas en bloques de ~size bytes."""
+    pending: list[bytes] = []
+    pending_bytes = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_bytes += len(chunk)
+        if pending_bytes >= size:
+            yield b"".join(pending)
+            pending.clear()
+            pending_bytes = 0
+    if pending:
+        yield b"".join(pending)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Comprime al vuelo en formato gzip, bloque por bloque."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def read_export_format() -> str:
+    """Lee ?format= (ndjson por defecto). Lanza ValueError si no es valido."""
+    export_format = request.args.get("format", "ndjson")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Parametro 'format' debe ser uno de: {', '.join(EXPORT_FORMATS)}."
+        )
+    return export_format
+
+
+def export_response(
+    rows: Iterable[dict],
+    export_format: str,
+    fieldnames: list[str],
+    filename: str,
+) -> Response:
+    """
+    Arma la respuesta en streaming para una exportacion.
+    - rows debe ser un generador (se consume mientras se envia)
+    - si el cliente manda Accept-Encoding: gzip, se comprime al vuelo
+    """
+    if export_format == "csv":
+        body = csv_lines(rows, fieldnames)
+    else:
+        body = ndjson_lines(rows)
+    body = batch_chunks(body)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{export_format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in request.accept_encodings:
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(
+        stream_with_context(body),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers=headers,
+    )
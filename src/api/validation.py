@@ -0,0 +1,39 @@
+"""
+Chequeo de tipos de los campos del body (altas y carga masiva).
+
+Lo que pasa estos chequeos lo acepta cualquier base: un texto que entra
+en su columna y un entero de 32 bits. Asi un valor mal tipado se reporta
+como error de su linea y no rompe el lote entero del executemany.
+"""
+
+from __future__ import annotations
+
+# rango de INTEGER en Postgres (SQLite acepta mas, pero no lo usamos)
+INT_MIN = -(2**31)
+INT_MAX = 2**31 - 1
+
+
+def text_field(data: dict, name: str, max_length: int | None, required: bool = False) -> str | None:
+    """Texto opcional (u obligatorio) de hasta max_length caracteres."""
+    value = data.get(name)
+    if value is None or (required and value == ""):
+        if required:
+            raise ValueError(f"Campo '{name}' es obligatorio.")
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"Campo '{name}' debe ser un texto.")
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"Campo '{name}' admite como maximo {max_length} caracteres.")
+    return value
+
+
+def int_field(data: dict, name: str, default: int | None = None) -> int | None:
+    """Entero opcional (sin bool ni decimales) dentro del rango de INTEGER."""
+    value = data.get(name, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"Campo '{name}' debe ser un entero.")
+    if not INT_MIN <= value <= INT_MAX:
+        raise ValueError(f"Campo '{name}' esta fuera de rango.")
+    return value
@@ -0,0 +1,99 @@
+"""
+Arranque de la app y ciclo de vida de los workers.
+
+- bootstrap_database: create_all + usuario demo (modo desarrollo)
+- ensure_demo_user: solo la semilla (la usa `flask seed-demo-user`)
+- after_fork / prewarm_pool / warm_autocomplete: hooks para gunicorn
+  (ver gunicorn.conf.py)
+"""
+
+from __future__ import annotations
+
+from flask import Flask
+
+from src.extensions import db
+
+
+def ensure_demo_user() -> bool:
+    """Crea el usuario con id=1 (para usar X-User-Id: 1) si no existe."""
+    from src.models.user import User
+
+    if db.session.get(User, 1) is not None:
+        return False
+
+    demo_user = User(
+        id=1,
+        name="Demo",
+        email="demo@example.com",
+    )
+    db.session.add(demo_user)
+    db.session.commit()
+    return True
+
+
+def bootstrap_database(app: Flask) -> None:
+    """
+    Crea las tablas que falten y siembra el usuario demo.
+    Pensado para desarrollo/tests; en produccion el esquema lo maneja
+    `flask db upgrade` y la semilla `flask seed-demo-user`.
+    """
+    # importamos los modelos para que SQLAlchemy conozca todas las tablas
+    import src.models  # noqa: F401
+
+    with app.app_context():
+        db.create_all()
+        ensure_demo_user()
+
+
+def after_fork(app: Flask) -> None:
+    """
+    Con preload_app el engine (y su pool) se heredan del proceso master.
+    En el worker descartamos esas conexiones sin cerrarlas, para no
+    romper las del padre: cada worker abre las suyas.
+    """
+    from src.health import mark_worker_started
+
+    mark_worker_started()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def prewarm_pool(app: Flask) -> int:
+    """
+    Abre DB_POOL_PREWARM conexiones por engine y las devuelve al pool,
+    asi el primer request no paga el connect. Devuelve cuantas abrio.
+    """
+    wanted = app.config.get("DB_POOL_PREWARM", 0)
+    if wanted <= 0:
+        return 0
+
+    opened = 0
+    with app.app_context():
+        for engine in db.engines.values():
+            size = getattr(engine.pool, "size", None)
+            if callable(size):
+                size = size()
+            count = min(wanted, size) if isinstance(size, int) else 1
+            connections = [engine.connect() for _ in range(count)]
+            for connection in connections:
+                connection.close()
+            opened += count
+    return opened
+
+
+def warm_autocomplete(app: Flask) -> int:
+    """
+    Arma el indice de autocompletado si AUTOCOMPLETE_PRELOAD y todavia no
+    existe (con preload lo arma el master y los workers lo heredan).
+    Devuelve cuantos titulos cargo.
+    """
+    if not app.config.get("AUTOCOMPLETE_PRELOAD") or "autocomplete" in app.extensions:
+        return 0
+
+    from src.api.services.autocomplete_service import AutocompleteService
+
+    with app.app_context():
+        index = AutocompleteService.build()
+        db.session.remove()
+    return index.stats()["block_entries"]
@@ -0,0 +1,93 @@
+"""Comandos `flask ...` propios de WatchLog."""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import click
+from flask import Flask
+
+
+def register_cli(app: Flask) -> None:
+    """Agrega los comandos de la app al CLI de Flask."""
+
+    @app.cli.command("seed-demo-user")
+    def seed_demo_user() -> None:
+        """Crea el usuario demo (id=1) si no existe."""
+        from src.bootstrap import ensure_demo_user
+
+        created = ensure_demo_user()
+        click.echo("Usuario demo creado." if created else "El usuario demo ya existe.")
+
+    @app.cli.command("seed")
+    @click.option("--users", default=1_000, show_default=True)
+    @click.option("--movies", default=10_000, show_default=True)
+    @click.option("--series", default=1_000, show_default=True)
+    @click.option("--max-seasons", default=8, show_default=True, help="Temporadas por serie: 1..N.")
+    @click.option("--entries", default=100_000, show_default=True, help="Entradas de watchlist (aprox.).")
+    @click.option("--series-share", default=0.3, show_default=True, help="Fraccion de entradas que son series.")
+    @click.option("--skew", default=1.1, show_default=True, help="Exponente Zipf de la popularidad.")
+    @click.option("--days", default=365, show_default=True, help="Las fechas se reparten en los ultimos N dias.")
+    @click.option("--seed", "seed_value", default=42, show_default=True, help="Semilla (mismos datos con la misma).")
+    @click.option("--chunk-size", default=10_000, show_default=True, help="Filas por lote (un commit por lote).")
+    @click.option("--copy/--no-copy", "use_copy", default=True, show_default=True, help="COPY en Postgres.")
+    def seed(users, movies, series, max_seasons, entries, series_share, skew, days, seed_value, chunk_size, use_copy):
+        """Agrega datos sinteticos (usuarios, catalogo, temporadas, watchlists) para pruebas de carga."""
+        from src.seed import seed_dataset
+
+        if not 0 <= series_share <= 1:
+            raise click.BadParameter("tiene que estar entre 0 y 1", param_hint="--series-share")
+
+        # seasons: en promedio (1 + max_seasons) / 2 por serie
+        estimated = users + movies + series + series * (1 + max_seasons) // 2 + entries
+        started = time.perf_counter()
+        with click.progressbar(length=estimated, label="Sembrando", show_pos=True) as bar:
+            counts = seed_dataset(
+                users=users,
+                movies=movies,
+                series=series,
+                max_seasons=max_seasons,
+                entries=entries,
+                series_share=series_share,
+                skew=skew,
+                days=days,
+                seed=seed_value,
+                chunk_size=chunk_size,
+                use_copy=use_copy,
+                progress=bar.update,
+            )
+        elapsed = time.perf_counter() - started
+
+        total = sum(counts.values())
+        click.echo(", ".join(f"{table}: {n}" for table, n in counts.items()))
+        click.echo(f"{total} filas en {elapsed:.1f} s ({total / elapsed:,.0f} filas/s)")
+
+    @app.cli.group("profiles")
+    def profiles() -> None:
+        """Perfiles de requests (PROFILING_ENABLED, ver src/profiling.py)."""
+
+    @profiles.command("token")
+    def profiles_token() -> None:
+        """Imprime un valor firmado para el header de profiling."""
+        from src.profiling import make_token
+
+        header = app.config["PROFILING_HEADER"]
+        click.echo(f"{header}: {make_token(app)}")
+        click.echo(f"(valido por {app.config['PROFILING_TOKEN_MAX_AGE']} s)", err=True)
+
+    @profiles.command("summary")
+    @click.option("--dir", "directory", default=None, help="Por defecto PROFILING_DIR.")
+    @click.option("--endpoint", default=None, help="Solo este endpoint (p.ej. movies.list_movies).")
+    @click.option("--sort", type=click.Choice(["cumulative", "tottime", "ncalls"]), default="cumulative", show_default=True)
+    @click.option("--limit", default=25, show_default=True, help="Funciones a mostrar.")
+    @click.option("--full-paths", is_flag=True, help="No recortar las rutas de los archivos.")
+    def profiles_summary(directory, endpoint, sort, limit, full_paths) -> None:
+        """Suma los perfiles guardados y muestra las funciones que mas tiempo llevan."""
+        from src.profiling import profile_files, summarize
+
+        directory = directory or app.config["PROFILING_DIR"]
+        files = profile_files(directory, endpoint)
+        if not files:
+            raise click.ClickException(f"No hay perfiles en {directory}.")
+        summarize(files, sort, limit, sys.stdout, full_paths)
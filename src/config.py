@@ -23,14 +23,114 @@ class BaseConfig:
         f"sqlite:///{INSTANCE_PATH / 'app.db'}",
     )
 
+    # Replica de solo lectura (opcional): los GET leen de ahi. Tras una
+    # escritura el cliente queda REPLICA_STICKY_SECONDS en el primario.
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+    REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JSON_SORT_KEYS = False
 
+    # Arranque: crear tablas + usuario demo en cada boot (solo dev/tests)
+    BOOTSTRAP_DB = os.getenv("BOOTSTRAP_DB", "1") == "1"
+    # Conexiones a abrir por worker antes del primer request (0 = ninguna)
+    DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", "0"))
+
+    # Pool y engine (SQLALCHEMY_ENGINE_OPTIONS lo arma src/engine.py).
+    # En SQLite no aplican; con DB_PGBOUNCER=1 se usa NullPool y el
+    # statement_timeout va con SET LOCAL en cada transaccion.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))  # 0 = sin limite
+    DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "0") == "1"
+
+    # SQLite (edge): con SQLITE_PROFILE="concurrent" cada conexion sale
+    # con WAL + busy_timeout + synchronous NORMAL + mmap/cache (src/engine.py).
+    # "default" deja los valores de fabrica de SQLite. No aplica a :memory:.
+    SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "concurrent")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+
+    # "auto": orjson si esta instalado; "orjson" lo exige; "default" usa el de Flask
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")
+
+    # Paginacion por cursor de los listados (?limit=&cursor=)
+    PAGINATION_DEFAULT_LIMIT = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "50"))
+    PAGINATION_MAX_LIMIT = int(os.getenv("PAGINATION_MAX_LIMIT", "200"))
+
+    # Carga masiva NDJSON (POST /movies/bulk, POST /series/bulk)
+    BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "1000"))
+    BULK_IMPORT_MAX_ERRORS = int(os.getenv("BULK_IMPORT_MAX_ERRORS", "1000"))
+    BULK_IMPORT_MAX_LINE_BYTES = int(os.getenv("BULK_IMPORT_MAX_LINE_BYTES", str(64 * 1024)))
+
+    # PATCH /progress/batch: items por lote como maximo
+    PROGRESS_BATCH_MAX_ITEMS = int(os.getenv("PROGRESS_BATCH_MAX_ITEMS", "500"))
+
+    # Exportaciones en streaming: filas por lote del cursor del servidor
+    EXPORT_YIELD_PER = int(os.getenv("EXPORT_YIELD_PER", "1000"))
+
+    # GET /search: coincidencias por tipo (las mejor rankeadas) que se paginan como maximo
+    SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", "1000"))
+
+    # GET /autocomplete: indice de prefijos en memoria, por worker
+    AUTOCOMPLETE_PRELOAD = os.getenv("AUTOCOMPLETE_PRELOAD", "0") == "1"  # armarlo al arrancar
+    AUTOCOMPLETE_SYNC_SECONDS = float(os.getenv("AUTOCOMPLETE_SYNC_SECONDS", "5"))
+    AUTOCOMPLETE_MERGE_THRESHOLD = int(os.getenv("AUTOCOMPLETE_MERGE_THRESHOLD", "50000"))
+    AUTOCOMPLETE_DEFAULT_LIMIT = int(os.getenv("AUTOCOMPLETE_DEFAULT_LIMIT", "10"))
+    AUTOCOMPLETE_MAX_LIMIT = int(os.getenv("AUTOCOMPLETE_MAX_LIMIT", "50"))
+
+    # Cache en memoria (LRU + TTL) de lecturas del catalogo, por worker
+    CATALOG_CACHE_ENABLED = os.getenv("CATALOG_CACHE_ENABLED", "1") == "1"
+    CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "10000"))
+    CATALOG_CACHE_PAGE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_PAGE_MAX_ENTRIES", "500"))
+    CATALOG_CACHE_TTL_SECONDS = float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "30"))
+
+    # GET /metrics (Prometheus): latencia y SQL por endpoint. Con gunicorn,
+    # METRICS_DIR (un directorio local compartido por los workers) hace que
+    # /metrics sume todos; cada worker vuelca lo suyo cada METRICS_FLUSH_SECONDS.
+    # Con METRICS_TOKEN, /metrics pide "Authorization: Bearer <token>"
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+    METRICS_DIR = os.getenv("METRICS_DIR", "")
+    METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "1"))
+
+    # Guardia de N+1 y presupuestos de queries por ruta (src/query_guard.py).
+    # "auto": activa con DEBUG o TESTING; "1" / "0" la fuerzan
+    QUERY_GUARD = os.getenv("QUERY_GUARD", "auto")
+    QUERY_GUARD_REPEAT_THRESHOLD = int(os.getenv("QUERY_GUARD_REPEAT_THRESHOLD", "5"))
+
+    # Profiling de requests con cProfile (src/profiling.py), apagado por
+    # defecto. Con PROFILING_ENABLED=1 se perfilan los requests con el header
+    # firmado (`flask profiles token`) y una fraccion PROFILING_SAMPLE_RATE
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "0") == "1"
+    PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_HEADER = os.getenv("PROFILING_HEADER", "X-Profile")
+    PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", "3600"))
+    PROFILING_DIR = os.getenv("PROFILING_DIR", str(INSTANCE_PATH / "profiles"))
+    PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", "1000"))  # 0 = sin limite
+
+    # GET /health/ (readiness, src/health.py): el SELECT 1 se cachea
+    # HEALTH_CACHE_SECONDS por worker; responde 503 con un pool ocupado en
+    # HEALTH_POOL_SATURATION (fraccion de size + max_overflow) o con la
+    # replica atrasada mas de HEALTH_MAX_REPLICA_LAG_SECONDS (0 = no mira)
+    HEALTH_CACHE_SECONDS = float(os.getenv("HEALTH_CACHE_SECONDS", "2"))
+    HEALTH_POOL_SATURATION = float(os.getenv("HEALTH_POOL_SATURATION", "0.9"))
+    HEALTH_MAX_REPLICA_LAG_SECONDS = float(os.getenv("HEALTH_MAX_REPLICA_LAG_SECONDS", "0"))
+
 
 class DevelopmentConfig(BaseConfig):
     """Config pensada para desarrollo local."""
     DEBUG = True
 
+    # instance/app.db esta versionada: WAL le cambiaria el encabezado y
+    # dejaria -wal/-shm al lado. Para probar concurrencia, SQLITE_PROFILE=concurrent
+    SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "default")
+
 
 class TestingConfig(BaseConfig):
     """Config utilizada al ejecutar tests automaticos."""
@@ -43,6 +143,14 @@ class ProductionConfig(BaseConfig):
     DEBUG = False
     TESTING = False
 
+    # esquema con `flask db upgrade` y semilla con `flask seed-demo-user`
+    BOOTSTRAP_DB = os.getenv("BOOTSTRAP_DB", "0") == "1"
+    DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", "2"))
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+    AUTOCOMPLETE_PRELOAD = os.getenv("AUTOCOMPLETE_PRELOAD", "1") == "1"
+    # /metrics es publico salvo con METRICS_TOKEN: se prende a proposito
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+
 
 config_by_name = {
     "development": DevelopmentConfig,
@@ -0,0 +1,225 @@
+"""
+Opciones del engine de SQLAlchemy por entorno.
+
+build_engine_options arma SQLALCHEMY_ENGINE_OPTIONS a partir de las
+variables DB_* de la config (pool, timeouts, modo PgBouncer) e
+install_engine_events registra los eventos que necesitan el engine ya creado
+(statement_timeout con PgBouncer, pragmas de SQLite).
+TimedQueuePool mide cuanto espera cada checkout del pool (ver pool_stats,
+expuesto en /health/pool).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from src.extensions import db
+
+SQLITE_PROFILES = ("concurrent", "default")
+SQLITE_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# limites (segundos) de los buckets del histograma de espera del pool
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolWaitStats:
+    """Histograma acumulado de la espera por una conexion del pool (por proceso)."""
+
+    def __init__(self, buckets=POOL_WAIT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # ultimo = +Inf
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+            for i, limit in enumerate(self.buckets):
+                if seconds <= limit:
+                    self.bucket_counts[i] += 1
+                    break
+            else:
+                self.bucket_counts[-1] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.count,
+                "wait_seconds_total": round(self.total_seconds, 6),
+                "wait_seconds_max": round(self.max_seconds, 6),
+                "wait_buckets": {
+                    **{str(limit): n for limit, n in zip(self.buckets, self.bucket_counts)},
+                    "+Inf": self.bucket_counts[-1],
+                },
+            }
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class _TimedCheckout:
+    """Mixin de pool: registra en pool_wait_stats cuanto tardo cada checkout."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_stats.observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool con la espera de checkout medida."""
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """Lo mismo para el engine asyncio (app ASGI, ver src/aio)."""
+
+
+def build_engine_options(config) -> dict:
+    """
+    SQLALCHEMY_ENGINE_OPTIONS segun la URI y las variables DB_*.
+    - SQLite: sin opciones de pool (no aplican)
+    - PgBouncer (DB_PGBOUNCER): NullPool, el pooling lo hace PgBouncer
+    - resto: TimedQueuePool con size/overflow/timeout/recycle/pre-ping
+    """
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    if url.get_backend_name() == "sqlite":
+        return {}
+
+    if config["DB_PGBOUNCER"]:
+        return {"poolclass": NullPool}
+
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    }
+
+    timeout_ms = config["DB_STATEMENT_TIMEOUT_MS"]
+    if timeout_ms and url.get_backend_name() == "postgresql":
+        # parametro de arranque de la sesion: no cuesta un round trip extra
+        options["connect_args"] = {"options": f"-c statement_timeout={timeout_ms}"}
+
+    return options
+
+
+def sqlite_pragmas(config) -> list[str]:
+    """
+    PRAGMAs que se ejecutan en cada conexion SQLite nueva segun SQLITE_PROFILE.
+    - journal_mode=WAL: los lectores no bloquean al escritor ni al reves
+    - busy_timeout: esperar el lock de escritura en vez de fallar con
+      "database is locked"
+    - synchronous=NORMAL: con WAL no se pierde consistencia, solo el fsync
+      de cada commit (se sincroniza en los checkpoints)
+    - mmap_size / cache_size: lecturas desde memoria en vez de read()
+    """
+    profile = config["SQLITE_PROFILE"]
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"SQLITE_PROFILE invalido: {profile!r}")
+    if profile == "default":
+        return []
+
+    synchronous = config["SQLITE_SYNCHRONOUS"].upper()
+    if synchronous not in SQLITE_SYNCHRONOUS_MODES:
+        raise ValueError(f"SQLITE_SYNCHRONOUS invalido: {synchronous!r}")
+
+    return [
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA busy_timeout={int(config['SQLITE_BUSY_TIMEOUT_MS'])}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={int(config['SQLITE_MMAP_SIZE'])}",
+        # negativo = tamaño en KiB (positivo serian paginas)
+        f"PRAGMA cache_size={-int(config['SQLITE_CACHE_SIZE_KB'])}",
+    ]
+
+
+def _is_memory_sqlite(engine) -> bool:
+    database = engine.url.database
+    return not database or database == ":memory:" or engine.url.query.get("mode") == "memory"
+
+
+def install_sqlite_pragmas(engine, pragmas: list[str]) -> None:
+    """Ejecuta `pragmas` en cada conexion nueva de `engine`."""
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def install_statement_timeout(engine, timeout_ms: int) -> None:
+    """SET LOCAL statement_timeout al comenzar cada transaccion de `engine`."""
+
+    @event.listens_for(engine, "begin")
+    def _set_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def configure_engine(engine, config) -> None:
+    """
+    Eventos que dependen del engine ya creado:
+    - SQLite en archivo: pragmas de SQLITE_PROFILE al abrir cada conexion
+    - PgBouncer en modo transaccion: no se pueden usar parametros de
+      arranque ni SET de sesion, asi que el statement_timeout va con
+      SET LOCAL al comenzar cada transaccion
+    Para un AsyncEngine se pasa engine.sync_engine.
+    """
+    if engine.dialect.name == "sqlite":
+        pragmas = sqlite_pragmas(config)
+        if pragmas and not _is_memory_sqlite(engine):
+            install_sqlite_pragmas(engine, pragmas)
+    elif engine.dialect.name == "postgresql":
+        timeout_ms = config["DB_STATEMENT_TIMEOUT_MS"]
+        if config["DB_PGBOUNCER"] and timeout_ms:
+            install_statement_timeout(engine, timeout_ms)
+
+
+def install_engine_events(app: Flask) -> None:
+    """configure_engine para cada engine (bind) de la app."""
+    sqlite_pragmas(app.config)  # valida SQLITE_PROFILE aunque no haya SQLite
+    with app.app_context():
+        for engine in db.engines.values():
+            configure_engine(engine, app.config)
+
+
+def pool_stats() -> dict:
+    """
+    Estado de los pools de la app actual (una entrada por bind) mas la
+    espera acumulada de los checkouts (solo TimedQueuePool la registra).
+    """
+    pools = {}
+    for bind, engine in db.engines.items():
+        pool = engine.pool
+        status = {"class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                timeout=pool.timeout(),
+            )
+        pools[bind or "default"] = status
+    return {"pools": pools, "checkout": pool_wait_stats.snapshot()}
@@ -3,5 +3,8 @@
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
+from src.routing import RoutingSession
+
+# RoutingSession: lecturas de GET a la replica si esta configurada (src/routing.py)
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
@@ -0,0 +1,192 @@
+"""
+Health checks para el balanceador (GET /health/ y GET /health/live).
+
+- liveness: el proceso responde; no toca la base ni nada compartido
+- readiness ("deep"): SELECT 1 contra cada bind, lag de la replica (si hay
+  DATABASE_REPLICA_URL y es Postgres), estado de los pools y uptime del
+  worker. Devuelve ready=False (-> 503) si la base no responde, si un pool
+  esta ocupado en HEALTH_POOL_SATURATION o mas, o si la replica atrasa mas
+  de HEALTH_MAX_REPLICA_LAG_SECONDS; asi el balanceador deja de mandarle
+  trafico al worker saturado en vez de encolarle mas requests.
+
+Las consultas a la base se cachean por worker HEALTH_CACHE_SECONDS: con
+probes cada pocos segundos (y varios balanceadores) el costo es a lo sumo
+un SELECT 1 por bind y por periodo. Mientras un thread refresca, los demas
+responden con el resultado anterior en vez de esperar. Lo del pool y el
+uptime es memoria del proceso y se calcula en cada llamada.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from flask import Flask, current_app
+from sqlalchemy.pool import QueuePool
+
+from src.extensions import db
+from src.routing import REPLICA_BIND
+
+# lag de una replica de Postgres: 0 si ya aplico todo lo que recibio (si no
+# hay escrituras en el primario, el timestamp del ultimo replay envejece sin
+# que haya atraso real); NULL si el servidor no es una replica
+PG_REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN NULL
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+_process = {"pid": os.getpid(), "started": time.monotonic()}
+
+
+def mark_worker_started() -> None:
+    """Reinicia el uptime (after_fork: con preload el modulo viene del master)."""
+    _process.update(pid=os.getpid(), started=time.monotonic())
+
+
+def uptime_seconds() -> float:
+    if _process["pid"] != os.getpid():  # fork sin after_fork
+        mark_worker_started()
+    return time.monotonic() - _process["started"]
+
+
+class _CachedChecks:
+    """Ultimo resultado de las consultas a la base y cuando vence."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.result: dict | None = None
+        self.checked_at = 0.0
+
+
+def _cached_checks(app: Flask) -> _CachedChecks:
+    cached = app.extensions.get("health")
+    if cached is None:
+        cached = app.extensions.setdefault("health", _CachedChecks())
+    return cached
+
+
+# ---------- pools ----------
+
+def _pool_status(pool) -> dict:
+    status = {"class": type(pool).__name__}
+    if not isinstance(pool, QueuePool):
+        return status  # NullPool/StaticPool: no hay nada que se llene
+    size = pool.size()
+    # max_overflow no tiene getter publico; -1 = sin limite
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    checked_out = pool.checkedout()
+    capacity = size + max_overflow if max_overflow >= 0 else None
+    status.update(
+        size=size,
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        overflow=max(pool.overflow(), 0),
+        saturation=round(checked_out / capacity, 3) if capacity else None,
+    )
+    return status
+
+
+def pool_health() -> dict:
+    """Conexiones en uso y overflow de cada pool, con la fraccion ocupada."""
+    return {bind or "default": _pool_status(engine.pool) for bind, engine in db.engines.items()}
+
+
+# ---------- base ----------
+
+def _ping(engine, lag: bool) -> dict:
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1").scalar()
+            result = {"ok": True}
+            if lag:
+                result["lag_seconds"] = _replica_lag(connection)
+    except Exception as exc:  # cualquier falla del driver es "no responde"
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"[:200]}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def _replica_lag(connection) -> float | None:
+    if connection.dialect.name != "postgresql":
+        return None  # SQLite u otros: no hay forma generica de medirlo
+    lag = connection.exec_driver_sql(PG_REPLICA_LAG_SQL).scalar()
+    return round(float(lag), 3) if lag is not None else None
+
+
+def _database_checks(pools: dict) -> dict:
+    checks = {}
+    for bind, engine in db.engines.items():
+        name = bind or "default"
+        saturation = pools[name].get("saturation")
+        if saturation is not None and saturation >= 1:
+            # sin conexiones libres el connect esperaria DB_POOL_TIMEOUT
+            checks[name] = {"ok": None, "skipped": "pool lleno"}
+            continue
+        checks[name] = _ping(engine, lag=bind == REPLICA_BIND)
+    return checks
+
+
+def database_health(pools: dict) -> tuple[dict, float]:
+    """
+    SELECT 1 (y lag) por bind, cacheado HEALTH_CACHE_SECONDS.
+    Devuelve (resultado, antiguedad en segundos).
+    """
+    app = current_app._get_current_object()
+    cached = _cached_checks(app)
+    ttl = app.config["HEALTH_CACHE_SECONDS"]
+    now = time.monotonic()
+    if cached.result is not None and now - cached.checked_at < ttl:
+        return cached.result, now - cached.checked_at
+
+    # un solo thread refresca; el resto usa el resultado anterior si lo hay
+    if not cached.lock.acquire(blocking=cached.result is None):
+        return cached.result, now - cached.checked_at
+    try:
+        if cached.result is None or time.monotonic() - cached.checked_at >= ttl:
+            cached.result = _database_checks(pools)
+            cached.checked_at = time.monotonic()
+    finally:
+        cached.lock.release()
+    return cached.result, time.monotonic() - cached.checked_at
+
+
+# ---------- veredicto ----------
+
+def _problems(database: dict, pools: dict, config) -> list[str]:
+    problems = []
+    for bind, check in database.items():
+        if check["ok"] is False:
+            problems.append(f"base {bind}: {check['error']}")
+    limit = config["HEALTH_POOL_SATURATION"]
+    for bind, status in pools.items():
+        saturation = status.get("saturation")
+        if limit > 0 and saturation is not None and saturation >= limit:
+            problems.append(f"pool {bind}: {status['checked_out']} conexiones en uso ({saturation:.0%})")
+    max_lag = config["HEALTH_MAX_REPLICA_LAG_SECONDS"]
+    lag = database.get(REPLICA_BIND, {}).get("lag_seconds")
+    if max_lag > 0 and lag is not None and lag > max_lag:
+        problems.append(f"replica atrasada {lag:.1f} s (maximo {max_lag:g} s)")
+    return problems
+
+
+def deep_health() -> tuple[dict, bool]:
+    """Reporte completo y si el worker puede recibir trafico."""
+    pools = pool_health()
+    database, age = database_health(pools)
+    problems = _problems(database, pools, current_app.config)
+    report = {
+        "status": "fail" if problems else "ok",
+        "problems": problems,
+        "uptime_seconds": round(uptime_seconds(), 1),
+        "pid": os.getpid(),
+        "database": database,
+        "database_checked_seconds_ago": round(age, 3),
+        "replica_lag_seconds": database.get(REPLICA_BIND, {}).get("lag_seconds"),
+        "pools": pools,
+    }
+    return report, not problems
@@ -0,0 +1,71 @@
+"""
+Proveedor JSON rapido para Flask.
+
+Si orjson esta instalado se usa para serializar respuestas (escribe bytes
+directamente, en C); si no, queda el proveedor por defecto de Flask.
+Se elige con JSON_PROVIDER = "auto" | "orjson" | "default".
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+def dumps_bytes(obj: t.Any) -> bytes:
+    """Serializa obj a JSON compacto en bytes (orjson si esta disponible)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Igual que el proveedor por defecto, pero dumps/loads/response con orjson.
+    Los tipos que orjson no conoce pasan por el `default` de Flask.
+    """
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        return orjson.loads(s)
+
+    def response(self, *args: t.Any, **kwargs: t.Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options() | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app: Flask) -> None:
+    """Registra el proveedor JSON segun JSON_PROVIDER."""
+    choice = app.config.get("JSON_PROVIDER", "auto")
+    if choice not in ("auto", "orjson", "default"):
+        raise ValueError(f"JSON_PROVIDER invalido: {choice!r}")
+    if choice == "orjson" and orjson is None:
+        raise RuntimeError("JSON_PROVIDER=orjson pero orjson no esta instalado.")
+
+    if choice != "default" and orjson is not None:
+        app.json = OrjsonProvider(app)
+
+    app.json.sort_keys = app.config.get("JSON_SORT_KEYS", False)
@@ -0,0 +1,345 @@
+"""
+Metricas por endpoint en formato Prometheus (GET /metrics).
+
+init_metrics registra hooks de request y eventos del engine:
+- latencia de cada request (histograma) y requests por codigo de respuesta,
+  por endpoint de blueprint ("movies.list_movies",
+  "progress.update_series_progress", ...)
+- sentencias SQL y tiempo en la base por endpoint (before/after_cursor_execute)
+/metrics suma ademas la espera de checkout y el estado de los pools
+(src/engine.py) y los contadores de las caches del catalogo.
+
+Todo se acumula en memoria del proceso, sin I/O en el camino del request:
+un ContextVar por request y un lock al final (pocos microsegundos). Con
+gunicorn cada worker tiene lo suyo; con METRICS_DIR cada worker vuelca su
+snapshot a METRICS_DIR/<pid>.json cada METRICS_FLUSH_SECONDS y /metrics
+suma los archivos de todos. El archivo de un worker muerto lo borra
+child_exit en gunicorn.conf.py: los totales bajan y Prometheus lo toma como
+un reinicio del contador (rate() e increase() lo compensan), igual que si
+se reiniciara un proceso con metricas propias.
+
+La latencia se mide hasta el teardown del request: en las exportaciones en
+streaming incluye el cuerpo completo y las queries del cursor.
+"""
+
+from __future__ import annotations
+
+import copy
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from flask import Flask, request
+from sqlalchemy import event
+
+from src.api.services.cache import cache_stats
+from src.engine import POOL_WAIT_BUCKETS, pool_stats
+from src.extensions import db
+
+# limites (segundos) de los buckets del histograma de latencia
+REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# endpoint de los requests que no matchean ninguna ruta (404 de Flask)
+UNMATCHED = "unmatched"
+
+CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations")
+POOL_GAUGES = ("size", "checked_in", "checked_out")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _RequestTimer:
+    """Lo que se va juntando durante un request."""
+
+    __slots__ = ("started", "status", "statements", "sql_seconds", "sql_started")
+
+    def __init__(self, started: float):
+        self.started = started
+        self.status = 500  # si no llega a after_request es porque exploto
+        self.statements = 0
+        self.sql_seconds = 0.0
+        self.sql_started = 0.0
+
+
+_current: ContextVar[_RequestTimer | None] = ContextVar("watchlog_request_timer", default=None)
+
+
+class RequestMetrics:
+    """Acumulado por endpoint de latencia, codigos y SQL (por proceso)."""
+
+    def __init__(self, buckets=REQUEST_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.next_flush = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        self.endpoints: dict[str, dict] = {}
+
+    def observe(self, endpoint: str, status: int, seconds: float, statements: int, sql_seconds: float) -> None:
+        index = bisect_left(self.buckets, seconds)  # primer limite >= seconds; len = +Inf
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "buckets": [0] * (len(self.buckets) + 1),
+                    "statements": 0,
+                    "sql_seconds": 0.0,
+                    "status": {},
+                }
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["buckets"][index] += 1
+            stats["statements"] += statements
+            stats["sql_seconds"] += sql_seconds
+            key = str(status)
+            stats["status"][key] = stats["status"].get(key, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return copy.deepcopy(self.endpoints)
+
+
+request_metrics = RequestMetrics()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timer = _current.get()
+    if timer is not None:
+        timer.sql_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timer = _current.get()
+    if timer is not None:
+        timer.statements += 1
+        timer.sql_seconds += time.perf_counter() - timer.sql_started
+
+
+def install_sql_events(engine) -> None:
+    """Cuenta las sentencias (y su tiempo) del request en curso. Para un AsyncEngine, su sync_engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def init_metrics(app: Flask) -> None:
+    """
+    Hooks de request + eventos SQL (despues de db.init_app). Conviene
+    llamarla antes que otros before_request, asi mide todo el request.
+    Con METRICS_ENABLED=0 no registra nada y /metrics responde 404.
+    """
+    if not app.config["METRICS_ENABLED"]:
+        return
+
+    directory = app.config["METRICS_DIR"] or None
+    flush_seconds = app.config["METRICS_FLUSH_SECONDS"]
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    app.extensions["metrics"] = {"directory": directory}
+
+    with app.app_context():
+        for engine in db.engines.values():
+            install_sql_events(engine)
+
+    @app.before_request
+    def _start_timer():
+        _current.set(_RequestTimer(time.perf_counter()))
+
+    @app.after_request
+    def _record_status(response):
+        timer = _current.get()
+        if timer is not None:
+            timer.status = response.status_code
+        return response
+
+    @app.teardown_request
+    def _observe(exc):
+        timer = _current.get()
+        if timer is None:
+            return
+        _current.set(None)
+        now = time.perf_counter()
+        request_metrics.observe(
+            request.endpoint or UNMATCHED,
+            timer.status,
+            now - timer.started,
+            timer.statements,
+            timer.sql_seconds,
+        )
+        if directory and now >= request_metrics.next_flush:
+            request_metrics.next_flush = now + flush_seconds
+            write_snapshot(directory)
+
+
+# ---------- snapshots y archivos compartidos ----------
+
+def process_snapshot() -> dict:
+    """Metricas de este proceso (necesita app context: pools y caches son de la app)."""
+    pools = pool_stats()
+    caches = cache_stats()
+    checkout = pools["checkout"]
+    return {
+        "requests": request_metrics.snapshot(),
+        "pool_checkout": {
+            "count": checkout["checkouts"],
+            "seconds": checkout["wait_seconds_total"],
+            "buckets": list(checkout["wait_buckets"].values()),
+        },
+        "cache": {name: {key: stats[key] for key in CACHE_COUNTERS} for name, stats in caches.items()},
+        # gauges: solo valen mientras el proceso vive
+        "gauges": {
+            "pool": {
+                bind: {key: status[key] for key in POOL_GAUGES if key in status}
+                for bind, status in pools["pools"].items()
+            },
+            "cache_entries": {name: stats["size"] for name, stats in caches.items()},
+        },
+    }
+
+
+def _path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{pid}.json")
+
+
+def _write_json(path: str, data: dict) -> None:
+    # archivo temporal + rename: quien lee nunca ve un JSON a medio escribir
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def write_snapshot(directory: str) -> dict:
+    """Vuelca el snapshot de este proceso a directory/<pid>.json y lo devuelve."""
+    snapshot = process_snapshot()
+    _write_json(_path(directory, os.getpid()), snapshot)
+    return snapshot
+
+
+def _merge(total: dict, part: dict) -> None:
+    """Suma `part` en `total` (dicts anidados de numeros o listas de numeros)."""
+    for key, value in part.items():
+        if isinstance(value, dict):
+            _merge(total.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            current = total.setdefault(key, [0] * len(value))
+            for i, n in enumerate(value[: len(current)]):
+                current[i] += n
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def collect(directory: str | None) -> dict:
+    """
+    Metricas de todos los procesos: el snapshot fresco de este mas los
+    archivos de los demas (sin directorio, solo este proceso).
+    """
+    own = write_snapshot(directory) if directory else process_snapshot()
+    if not directory:
+        return own
+
+    total: dict = {}
+    _merge(total, own)
+    own_path = _path(directory, os.getpid())
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        if path == own_path:
+            continue
+        try:
+            with open(path) as f:
+                _merge(total, json.load(f))
+        except (OSError, ValueError):
+            continue  # worker que justo se reinicio o archivo ajeno
+    return total
+
+
+# ---------- formato Prometheus ----------
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Exposition:
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value, **labels) -> None:
+        self.lines.append(f"{name}{_labels(**labels) if labels else ''} {_number(value)}")
+
+    def histogram(self, name: str, limits, stats: dict, **labels) -> None:
+        cumulative = 0
+        for limit, count in zip(limits, stats["buckets"]):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, **labels, le=_number(float(limit)))
+        self.sample(f"{name}_bucket", stats["count"], **labels, le="+Inf")
+        self.sample(f"{name}_sum", stats["seconds"], **labels)
+        self.sample(f"{name}_count", stats["count"], **labels)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_prometheus(metrics: dict) -> str:
+    """Texto de /metrics (formato de exposicion 0.0.4) a partir de collect()."""
+    out = _Exposition()
+    requests = sorted(metrics.get("requests", {}).items())
+
+    out.family("watchlog_request_duration_seconds", "histogram", "Latencia de los requests por endpoint.")
+    for endpoint, stats in requests:
+        out.histogram("watchlog_request_duration_seconds", REQUEST_BUCKETS, stats, endpoint=endpoint)
+
+    out.family("watchlog_requests_total", "counter", "Requests por endpoint y codigo de respuesta.")
+    for endpoint, stats in requests:
+        for status, count in sorted(stats["status"].items()):
+            out.sample("watchlog_requests_total", count, endpoint=endpoint, status=status)
+
+    out.family("watchlog_sql_statements_total", "counter", "Sentencias SQL ejecutadas por endpoint.")
+    for endpoint, stats in requests:
+        out.sample("watchlog_sql_statements_total", stats["statements"], endpoint=endpoint)
+
+    out.family("watchlog_sql_duration_seconds_total", "counter", "Tiempo en la base (SQL) por endpoint.")
+    for endpoint, stats in requests:
+        out.sample("watchlog_sql_duration_seconds_total", stats["sql_seconds"], endpoint=endpoint)
+
+    checkout = metrics.get("pool_checkout")
+    if checkout:
+        out.family("watchlog_db_pool_checkout_seconds", "histogram", "Espera por una conexion del pool.")
+        out.histogram("watchlog_db_pool_checkout_seconds", POOL_WAIT_BUCKETS, checkout)
+
+    pools = sorted(metrics.get("gauges", {}).get("pool", {}).items())
+    if pools:
+        out.family("watchlog_db_pool_connections", "gauge", "Conexiones del pool por estado (workers vivos).")
+        for bind, status in pools:
+            for state, value in sorted(status.items()):
+                out.sample("watchlog_db_pool_connections", value, bind=bind, state=state)
+
+    caches = sorted(metrics.get("cache", {}).items())
+    for counter in CACHE_COUNTERS:
+        name = f"watchlog_cache_{counter}_total"
+        out.family(name, "counter", f"Cache del catalogo: {counter}.")
+        for cache, stats in caches:
+            out.sample(name, stats.get(counter, 0), cache=cache)
+
+    entries = sorted(metrics.get("gauges", {}).get("cache_entries", {}).items())
+    out.family("watchlog_cache_entries", "gauge", "Entradas en las caches del catalogo (workers vivos).")
+    for cache, size in entries:
+        out.sample("watchlog_cache_entries", size, cache=cache)
+
+    return out.text()
@@ -1,5 +1,6 @@
 from datetime import datetime
 from src.extensions import db
+from src.models.search import install_search_ddl
 
 
 class Movie(db.Model):
@@ -8,6 +9,15 @@ class Movie(db.Model):
     """
 
     __tablename__ = "movies"
+    __table_args__ = (
+        # orden de los listados paginados por cursor
+        db.Index("ix_movies_created_at_id", "created_at", "id"),
+        # validador barato para GETs condicionales: max(updated_at)
+        db.Index("ix_movies_updated_at", "updated_at"),
+        # filtros de GET /movies/: ?genre= con el orden por defecto, rangos de año
+        db.Index("ix_movies_genre_created_at_id", "genre", "created_at", "id"),
+        db.Index("ix_movies_release_year_id", "release_year", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -19,6 +29,12 @@ class Movie(db.Model):
         default=datetime.utcnow,
         nullable=False,
     )
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
 
     # (OJO) quitamos watch_entries porque todavía no tenemos ForeignKey directa
     # watch_entries = db.relationship("WatchEntry", back_populates="movie", lazy="dynamic")
@@ -35,3 +51,19 @@ class Movie(db.Model):
             "release_year": self.release_year,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+# titulo sin distinguir mayusculas: ?sort=title y ?title_prefix= comparan
+# contra esta misma expresion, asi la base usa el indice
+MOVIE_TITLE_KEY = db.func.lower(Movie.title)
+db.Index("ix_movies_title_key_id", MOVIE_TITLE_KEY, Movie.id)
+# en Postgres LIKE 'abc%' solo usa un indice con text_pattern_ops
+# (salvo collation "C"); SQLite resuelve el prefijo como rango sobre el de arriba
+db.Index(
+    "ix_movies_title_key_prefix",
+    MOVIE_TITLE_KEY.label("title_key"),
+    postgresql_ops={"title_key": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
+
+# FTS5 (SQLite) / GIN tsvector (Postgres) para GET /search
+install_search_ddl(Movie.__table__)
@@ -0,0 +1,79 @@
+"""
+Indices de busqueda de texto sobre los titulos del catalogo.
+
+- SQLite: tablas virtuales FTS5 "external content" (movies_fts, series_fts)
+  que guardan solo el indice; triggers las mantienen al dia con cada
+  INSERT/UPDATE/DELETE de la tabla base.
+- Postgres: indice GIN sobre el tsvector de las mismas columnas (con peso A
+  para el titulo y B para el genero); no hace falta mantener nada a mano.
+
+El esquema lo crea la migracion 9b3e5d71c2a4; estos hooks hacen lo mismo
+cuando la base se arma con create_all (desarrollo/tests).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import DDL, event
+
+# tabla -> columnas indexadas (la primera es el titulo, peso mayor)
+SEARCH_COLUMNS = {
+    "movies": ("title", "genre"),
+    "series": ("title",),
+}
+
+# peso de cada columna en el ranking (bm25 en SQLite, setweight en Postgres)
+SQLITE_WEIGHTS = (10.0, 1.0)
+POSTGRES_WEIGHTS = ("A", "B")
+
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def sqlite_search_ddl(table: str) -> list[str]:
+    """CREATE de la tabla FTS5 de `table`, sus triggers y el llenado inicial."""
+    fts = fts_table(table)
+    columns = SEARCH_COLUMNS[table]
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    return [
+        # prefix: indices extra para que "sta"* no recorra todo el vocabulario
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def postgres_search_vector(table: str) -> str:
+    """Expresion tsvector de `table`; el query debe usar exactamente la misma que el indice."""
+    return " || ".join(
+        f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')"
+        for column, weight in zip(SEARCH_COLUMNS[table], POSTGRES_WEIGHTS)
+    )
+
+
+def postgres_search_ddl(table: str) -> list[str]:
+    return [
+        f"CREATE INDEX ix_{table}_search ON {table} USING gin (({postgres_search_vector(table)}))"
+    ]
+
+
+def install_search_ddl(table) -> None:
+    """Engancha la creacion de los indices de busqueda al create_all de `table`."""
+    for statement in sqlite_search_ddl(table.name):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in postgres_search_ddl(table.name):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts_table(table.name)}").execute_if(dialect="sqlite"),
+    )
@@ -3,6 +3,10 @@ from src.extensions import db
 
 class Season(db.Model):
     __tablename__ = "seasons"
+    __table_args__ = (
+        # seasons de una o varias series (IN) ya ordenadas por numero
+        db.Index("ix_seasons_series_id_number", "series_id", "number"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -1,19 +1,37 @@
 from datetime import datetime
 from src.extensions import db
+from src.models.search import install_search_ddl
+from src.models.seasons import Season
 
 
 class Series(db.Model):
     __tablename__ = "series"
+    __table_args__ = (
+        # orden de los listados paginados por cursor
+        db.Index("ix_series_created_at_id", "created_at", "id"),
+        # validador barato para GETs condicionales: max(updated_at)
+        db.Index("ix_series_updated_at", "updated_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     total_seasons = db.Column(db.Integer, default=0)
 
+    # Suma de episodes_count de sus seasons. Se mantiene desde SeriesService
+    # en la misma transaccion que el alta/edicion/baja de cada temporada.
+    total_episodes = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
     created_at = db.Column(
         db.DateTime,
         default=datetime.utcnow,
         nullable=False,
     )
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
 
     # Relación 1:N con Season
     seasons = db.relationship(
@@ -23,17 +41,36 @@ class Series(db.Model):
         lazy="dynamic",
     )
 
-    def to_dict(self, include_seasons: bool = False) -> dict:
+    def to_dict(self, include_seasons: bool = False, seasons=None) -> dict:
+        """
+        Serializa la serie.
+        - include_seasons: agrega "seasons". Si se pasan `seasons` ya cargadas
+          (ver SeriesService.load_seasons) se usan esas y no se hace otro query.
+        """
         data = {
             "id": self.id,
             "title": self.title,
             "total_seasons": self.total_seasons,
+            "total_episodes": self.total_episodes,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
 
         if include_seasons:
-            data["seasons"] = [
-                season.to_dict() for season in self.seasons.all()
-            ]
+            if seasons is None:
+                seasons = self.seasons.order_by(Season.number).all()
+            data["seasons"] = [season.to_dict() for season in seasons]
 
         return data
+
+
+# titulo sin distinguir mayusculas (ver MOVIE_TITLE_KEY en movie.py)
+SERIES_TITLE_KEY = db.func.lower(Series.title)
+db.Index("ix_series_title_key_id", SERIES_TITLE_KEY, Series.id)
+db.Index(
+    "ix_series_title_key_prefix",
+    SERIES_TITLE_KEY.label("title_key"),
+    postgresql_ops={"title_key": "text_pattern_ops"},
+).ddl_if(dialect="postgresql")
+
+# FTS5 (SQLite) / GIN tsvector (Postgres) para GET /search
+install_search_ddl(Series.__table__)
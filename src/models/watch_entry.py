@@ -12,6 +12,20 @@ class WatchEntry(db.Model):
     """
 
     __tablename__ = "watch_entries"
+    __table_args__ = (
+        # watchlist de un usuario paginada por cursor
+        db.Index("ix_watch_entries_user_created_id", "user_id", "created_at", "id"),
+        # validador barato para GETs condicionales: max(updated_at) por usuario
+        db.Index("ix_watch_entries_user_updated_at", "user_id", "updated_at"),
+        # un mismo contenido solo puede estar una vez en la watchlist de un usuario
+        db.Index(
+            "uq_watch_entries_user_content",
+            "user_id",
+            "content_type",
+            "content_id",
+            unique=True,
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -80,7 +94,17 @@ class WatchEntry(db.Model):
 
         return round((watched / total) * 100.0, 2)
 
-    def to_dict(self, include_user: bool = True) -> dict:
+    def to_dict(
+        self,
+        include_user: bool = True,
+        include_content: bool = False,
+        content=None,
+    ) -> dict:
+        """
+        Serializa la entrada.
+        - include_content: agrega "content" con la Movie/Series ya cargada
+          que se pasa en `content` (ver ProgressService.load_contents).
+        """
         data = {
             "id": self.id,
             "user_id": self.user_id,
@@ -106,4 +130,7 @@ class WatchEntry(db.Model):
                 else None
             )
 
+        if include_content:
+            data["content"] = content.to_dict() if content is not None else None
+
         return data
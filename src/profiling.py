@@ -0,0 +1,148 @@
+"""
+Profiling a pedido de requests puntuales (PROFILING_ENABLED).
+
+Con PROFILING_ENABLED=1 se perfila con cProfile un request si:
+- trae el header PROFILING_HEADER (X-Profile) con un token firmado con
+  SECRET_KEY (`flask profiles token`), valido por PROFILING_TOKEN_MAX_AGE, o
+- sale sorteado con PROFILING_SAMPLE_RATE (0.01 = uno de cada 100)
+El profiler corre desde el before_request hasta el teardown (incluye el
+cuerpo de las exportaciones en streaming) y deja un .prof (pstats) en
+PROFILING_DIR con fecha, endpoint y duracion en el nombre:
+
+    20261018T203000-4242-7-movies.list_movies-35ms.prof
+
+La respuesta perfilada trae X-Profile-Id (el prefijo del archivo).
+`flask profiles summary` suma todos los archivos y muestra las funciones
+que mas tiempo llevan. Sin PROFILING_ENABLED no se registra nada.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import glob
+import itertools
+import os
+import pstats
+import random
+import re
+import time
+from contextvars import ContextVar
+from datetime import datetime
+
+from flask import Flask, current_app, request
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+TOKEN_SALT = "watchlog-profile"
+TOKEN_PAYLOAD = "profile"
+
+_FILE_NAME = re.compile(r"^(?P<stem>\d{8}T\d{6}-\d+-\d+)-(?P<endpoint>.+)-(?P<ms>\d+)ms\.prof$")
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+_current: ContextVar[tuple | None] = ContextVar("watchlog_profile", default=None)
+_sequence = itertools.count(1)
+
+
+def _serializer(app: Flask) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(app.config["SECRET_KEY"], salt=TOKEN_SALT)
+
+
+def make_token(app: Flask) -> str:
+    """Valor del header PROFILING_HEADER para pedir el profiling de un request."""
+    return _serializer(app).dumps(TOKEN_PAYLOAD)
+
+
+def valid_token(app: Flask, token: str) -> bool:
+    try:
+        payload = _serializer(app).loads(token, max_age=app.config["PROFILING_TOKEN_MAX_AGE"])
+    except BadSignature:  # incluye SignatureExpired
+        return False
+    return payload == TOKEN_PAYLOAD
+
+
+def _wanted(app: Flask) -> bool:
+    token = request.headers.get(app.config["PROFILING_HEADER"])
+    if token:
+        return valid_token(app, token)
+    rate = app.config["PROFILING_SAMPLE_RATE"]
+    return rate > 0 and random.random() < rate
+
+
+def _room_for_more(directory: str, max_files: int) -> bool:
+    return max_files <= 0 or len(glob.glob(os.path.join(directory, "*.prof"))) < max_files
+
+
+def init_profiling(app: Flask) -> None:
+    """Hooks de request del profiler (conviene llamarla despues de init_metrics)."""
+    if not app.config["PROFILING_ENABLED"]:
+        return
+
+    directory = app.config["PROFILING_DIR"]
+    max_files = app.config["PROFILING_MAX_FILES"]
+    os.makedirs(directory, exist_ok=True)
+
+    @app.before_request
+    def _start_profile():
+        if not _wanted(app) or not _room_for_more(directory, max_files):
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return  # otro profiler activo (3.12+: uno por proceso)
+        stem = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{os.getpid()}-{next(_sequence)}"
+        _current.set((profile, stem, time.perf_counter()))
+
+    @app.after_request
+    def _tag_response(response):
+        current = _current.get()
+        if current is not None:
+            response.headers["X-Profile-Id"] = current[1]
+        return response
+
+    @app.teardown_request
+    def _stop_profile(exc):
+        current = _current.get()
+        if current is None:
+            return
+        _current.set(None)
+        profile, stem, started = current
+        profile.disable()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        endpoint = _UNSAFE.sub("_", request.endpoint or "unmatched")
+        path = os.path.join(directory, f"{stem}-{endpoint}-{elapsed_ms:.0f}ms.prof")
+        profile.dump_stats(path)
+        current_app.logger.info("Perfil de %s (%.0f ms) en %s", request.path, elapsed_ms, path)
+
+
+def profile_files(directory: str, endpoint: str | None = None) -> list[tuple[str, str, int]]:
+    """(path, endpoint, ms) de los perfiles de `directory`, del mas viejo al mas nuevo."""
+    files = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.prof"))):
+        match = _FILE_NAME.match(os.path.basename(path))
+        if match is None:
+            continue
+        if endpoint and match["endpoint"] != endpoint:
+            continue
+        files.append((path, match["endpoint"], int(match["ms"])))
+    return files
+
+
+def summarize(files: list[tuple[str, str, int]], sort: str, limit: int, stream, full_paths: bool = False) -> None:
+    """Escribe en `stream` las duraciones por endpoint y el top de funciones de todos los perfiles."""
+    by_endpoint: dict[str, list[int]] = {}
+    for _, endpoint, ms in files:
+        by_endpoint.setdefault(endpoint, []).append(ms)
+
+    stream.write(f"Perfiles: {len(files)}\n\n")
+    for endpoint, times in sorted(by_endpoint.items(), key=lambda item: -sum(item[1])):
+        times.sort()
+        stream.write(
+            f"  {endpoint:<40} {len(times):>5} requests"
+            f"  mediana {times[len(times) // 2]:>6} ms  max {times[-1]:>6} ms\n"
+        )
+    stream.write("\n")
+
+    stats = pstats.Stats(*(path for path, _, _ in files), stream=stream)
+    if not full_paths:
+        stats.strip_dirs()
+    stats.sort_stats(sort).print_stats(limit)
@@ -0,0 +1,171 @@
+"""
+Guardia de queries para desarrollo y tests (QUERY_GUARD).
+
+Durante cada request anota la "forma" de cada sentencia SQL (el SQL con
+literales, parametros y listas de IN normalizados) y al terminar:
+- si la misma forma se repitio QUERY_GUARD_REPEAT_THRESHOLD veces o mas,
+  loguea un warning con la sentencia y de que linea de src/ salio: el
+  patron tipico de N+1 (un lazy load o un to_dict(include_...) por fila)
+- si la ruta declaro @query_budget(n) y se hicieron mas de n sentencias,
+  loguea un error y, con TESTING, lanza QueryBudgetExceeded (falla el test)
+
+QUERY_GUARD="auto" lo prende con DEBUG o TESTING; en produccion no se
+registra nada y no cuesta nada.
+
+    @bp.route("/", methods=["GET"])
+    @query_budget(3)
+    def list_movies(): ...
+"""
+
+from __future__ import annotations
+
+import re
+import traceback
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+
+from flask import Flask, current_app, request
+from sqlalchemy import event
+
+from src.extensions import db
+
+QUERY_GUARD_MODES = ("auto", "1", "0")
+
+_SRC_DIR = str(Path(__file__).resolve().parent)
+_THIS_FILE = str(Path(__file__).resolve())
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Una ruta hizo mas sentencias SQL que su @query_budget (solo con TESTING)."""
+
+
+def query_budget(limit: int):
+    """
+    Declara cuantas sentencias SQL puede hacer la ruta como maximo.
+    Va debajo de @bp.route (tiene que marcar la funcion que se registra).
+    """
+
+    def decorator(view):
+        view.query_budget = limit
+        return view
+
+    return decorator
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """SQL sin valores: literales y parametros -> ?, listas de IN -> (?...)."""
+    shape = _STRING.sub("?", statement)
+    shape = _NUMBER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?...)", shape)
+    return _SPACES.sub(" ", shape).strip()
+
+
+def _origin() -> str:
+    """Las ultimas lineas de src/ en la pila (de donde salio la sentencia)."""
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(_SRC_DIR) and frame.filename != _THIS_FILE
+    ]
+    return " <- ".join(
+        f"{Path(frame.filename).relative_to(Path(_SRC_DIR).parent)}:{frame.lineno} in {frame.name}"
+        for frame in reversed(frames[-3:])
+    ) or "(fuera de src/)"
+
+
+class _RequestLog:
+    """Sentencias del request en curso, por forma."""
+
+    __slots__ = ("counts", "origins", "total")
+
+    def __init__(self):
+        self.counts: dict[str, int] = {}
+        self.origins: dict[str, str] = {}
+        self.total = 0
+
+
+_current: ContextVar[_RequestLog | None] = ContextVar("watchlog_query_guard", default=None)
+
+
+def query_guard_enabled(app: Flask) -> bool:
+    mode = str(app.config["QUERY_GUARD"])
+    if mode not in QUERY_GUARD_MODES:
+        raise ValueError(f"QUERY_GUARD invalido: {mode!r}")
+    if mode == "auto":
+        return bool(app.debug or app.testing)
+    return mode == "1"
+
+
+def init_query_guard(app: Flask) -> None:
+    """
+    Hooks de request + evento SQL (despues de db.init_app). Conviene
+    llamarla antes que init_metrics: su teardown corre ultimo, asi si
+    lanza QueryBudgetExceeded no se saltea los demas.
+    """
+    if not query_guard_enabled(app):
+        return
+
+    threshold = app.config["QUERY_GUARD_REPEAT_THRESHOLD"]
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        log = _current.get()
+        if log is None:
+            return
+        shape = fingerprint(statement)
+        count = log.counts.get(shape, 0) + 1
+        log.counts[shape] = count
+        log.total += 1
+        # un executemany ya es un lote (p.ej. la carga masiva): no es N+1
+        if count == threshold and not executemany:
+            # la pila de la repeticion apunta al loop que la dispara
+            log.origins[shape] = _origin()
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, "before_cursor_execute", _record)
+
+    @app.before_request
+    def _start_log():
+        _current.set(_RequestLog())
+
+    @app.teardown_request
+    def _check_log(exc):
+        log = _current.get()
+        if log is None:
+            return
+        _current.set(None)
+        _report(log)
+
+
+def _report(log: _RequestLog) -> None:
+    """Warnings de N+1 y chequeo del presupuesto de la ruta."""
+    endpoint = request.endpoint or request.path
+    for shape, origin in log.origins.items():
+        current_app.logger.warning(
+            "Posible N+1 en %s: %d veces la misma sentencia\n  %s\n  desde %s",
+            endpoint,
+            log.counts[shape],
+            shape,
+            origin,
+        )
+
+    view = current_app.view_functions.get(request.endpoint)
+    budget = getattr(view, "query_budget", None)
+    if budget is None or log.total <= budget:
+        return
+
+    top = sorted(log.counts.items(), key=lambda item: -item[1])[:5]
+    message = f"{endpoint} hizo {log.total} sentencias SQL (presupuesto: {budget})\n" + "\n".join(
+        f"  {count}x {shape}" for shape, count in top
+    )
+    current_app.logger.error(message)
+    if current_app.testing:
+        raise QueryBudgetExceeded(message)
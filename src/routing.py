@@ -0,0 +1,94 @@
+"""
+Ruteo de lecturas a una replica (opcional, DATABASE_REPLICA_URL).
+
+Si hay replica configurada, los requests GET/HEAD/OPTIONS leen de ella y
+todo lo demas (escrituras, CLI, tareas fuera de un request) va al primario.
+Despues de una escritura exitosa el cliente recibe una cookie que lo
+mantiene en el primario REPLICA_STICKY_SECONDS, asi lee lo que acaba de
+escribir aunque la replica venga atrasada.
+"""
+
+from __future__ import annotations
+
+import time
+
+from flask import Flask, current_app, g, has_app_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+REPLICA_BIND = "replica"
+STICKY_COOKIE = "wl_primary_until"
+# OPTIONS: el preflight de CORS no escribe, no tiene que pegar al primario
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class RoutingSession(Session):
+    """
+    Session que manda los SELECT a la replica cuando el request lo permite
+    (g.read_from_replica). Los flush y los INSERT/UPDATE/DELETE van siempre
+    al primario.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and not isinstance(clause, UpdateBase)
+            and has_app_context()
+            and g.get("read_from_replica", False)
+        ):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def sticky_primary() -> bool:
+    """True si este request va al primario por la cookie de una escritura reciente."""
+    return has_app_context() and g.get("sticky_primary", False)
+
+
+def replica_enabled(app: Flask | None = None) -> bool:
+    app = app or current_app
+    return REPLICA_BIND in app.config.get("SQLALCHEMY_BINDS", {})
+
+
+def configure_replica(app: Flask) -> None:
+    """Agrega el bind de la replica si DATABASE_REPLICA_URL esta definida (antes de db.init_app)."""
+    url = app.config.get("DATABASE_REPLICA_URL")
+    if url:
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        binds[REPLICA_BIND] = url
+        app.config["SQLALCHEMY_BINDS"] = binds
+
+
+def _sticky_to_primary() -> bool:
+    try:
+        until = float(request.cookies.get(STICKY_COOKIE, "0"))
+    except ValueError:
+        return False
+    return until > time.time()
+
+
+def init_replica_routing(app: Flask) -> None:
+    """Hooks de request que eligen primario/replica y renuevan la cookie."""
+    if not replica_enabled(app):
+        return
+
+    @app.before_request
+    def _choose_bind():
+        g.sticky_primary = _sticky_to_primary()
+        g.read_from_replica = request.method in READ_METHODS and not g.sticky_primary
+
+    @app.after_request
+    def _stick_after_write(response):
+        window = current_app.config["REPLICA_STICKY_SECONDS"]
+        if request.method not in READ_METHODS and response.status_code < 400 and window > 0:
+            response.set_cookie(
+                STICKY_COOKIE,
+                str(int(time.time() + window) + 1),
+                max_age=window,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,356 @@
+"""
+Generador de datos sinteticos para pruebas de carga (`flask seed`).
+
+- deterministico: cada tabla sale de su propio Random sembrado con `seed`,
+  asi la misma semilla y los mismos parametros dan los mismos datos (y
+  cambiar --movies no cambia los usuarios). Las fechas si cambian: son
+  relativas al momento en que se corre
+- popularidad sesgada (Zipf, exponente `skew`): pocas peliculas/series
+  concentran la mayoria de las entradas y pocos usuarios tienen las
+  watchlists mas largas
+- por lotes: las filas (tuplas) se generan de a `chunk_size` y nunca estan
+  todas en memoria; se escriben con el insert() de Core compilado una vez
+  (executemany) o con COPY en Postgres, con un commit por lote
+- los ids se asignan a mano a partir del maximo actual de cada tabla, asi
+  las watch_entries no necesitan volver a leer nada
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.api.services.progress_service import NEW_MOVIE_ENTRY
+from src.extensions import db
+from src.models.movie import Movie
+from src.models.seasons import Season
+from src.models.series import Series
+from src.models.user import User
+from src.models.watch_entry import WatchEntry
+
+GENRES = ["drama", "comedia", "terror", "sci-fi", "accion", "documental", "animacion", "romance"]
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "da", "fi", "go", "pa", "re", "su"]
+STATUSES = ["watching", "completed", "dropped", "planned"]
+
+# columnas, en orden, de las tuplas que arma cada generador
+USER_COLUMNS = ("id", "name", "email", "created_at", "updated_at")
+MOVIE_COLUMNS = ("id", "title", "genre", "release_year", "created_at", "updated_at")
+SERIES_COLUMNS = ("id", "title", "total_seasons", "total_episodes", "created_at", "updated_at")
+SEASON_COLUMNS = ("series_id", "number", "episodes_count")
+WATCH_ENTRY_COLUMNS = (
+    "user_id", "content_type", "content_id", "status", "current_season", "current_episode",
+    "watched_episodes", "total_episodes", "created_at", "updated_at",
+)
+
+
+class Zipf:
+    """Elige ids con probabilidad ~ 1 / rank**s; el rank de cada id es al azar."""
+
+    def __init__(self, ids: Iterable[int], s: float, rng: random.Random):
+        self.ids = list(ids)
+        rng.shuffle(self.ids)  # que la popularidad no dependa del id
+        self.cum_weights = list(itertools.accumulate(rank ** -s for rank in range(1, len(self.ids) + 1)))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def pick(self, rng: random.Random) -> int:
+        return self.sample(rng, 1)[0]
+
+    def sample(self, rng: random.Random, k: int) -> list[int]:
+        """k ids (con repeticion)."""
+        return rng.choices(self.ids, cum_weights=self.cum_weights, k=k)
+
+    def distinct(self, rng: random.Random, k: int) -> list[int]:
+        """
+        k ids distintos. Con mucho sesgo los ids de la cola casi no salen:
+        despues de 4*k tiradas se completa con ids al azar sin sesgo.
+        """
+        k = min(k, len(self.ids))
+        picked: dict[int, None] = {}  # dict y no set: orden de insercion deterministico
+        draws = 0
+        while len(picked) < k and draws < 4 * k:
+            batch = self.sample(rng, k - len(picked))
+            draws += len(batch)
+            picked.update(dict.fromkeys(batch))
+        if len(picked) < k:
+            rest = [i for i in self.ids if i not in picked]
+            picked.update(dict.fromkeys(rng.sample(rest, k - len(picked))))
+        return list(picked)
+
+
+def title(rng: random.Random) -> str:
+    """Titulo de 1 a 3 palabras inventadas ("Kalomi surepa")."""
+    words = ("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(rng.randint(1, 3)))
+    return " ".join(words).capitalize()
+
+
+def _rng(seed: int, table: str) -> random.Random:
+    return random.Random(f"{seed}:{table}")
+
+
+def _chunked(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _first_id(connection, model) -> int:
+    return (connection.scalar(db.select(db.func.max(model.id))) or 0) + 1
+
+
+def _rounded(rng: random.Random, expected: float) -> int:
+    """Redondeo al azar: en promedio da `expected`."""
+    return int(expected) + (rng.random() < expected - int(expected))
+
+
+def _timeline(days: int, count: int) -> Callable[[int], datetime]:
+    """i -> fecha, repartiendo `count` filas parejo en los ultimos `days` dias."""
+    start = datetime.utcnow().replace(microsecond=0) - timedelta(days=days)
+    step = days * 86_400 / max(count, 1)
+    return lambda i: start + timedelta(seconds=int(i * step))
+
+
+class RowWriter:
+    """
+    Escribe lotes de tuplas en una tabla: COPY ... FROM STDIN en Postgres
+    (psycopg2 o psycopg 3) si use_copy, si no el insert() de la tabla.
+
+    El insert se compila una vez por tabla y va directo al executemany del
+    driver, aplicando solo los bind processors que hacen falta (en SQLite
+    DateTime -> texto con el formato de SQLAlchemy). Pasar cada lote por
+    connection.execute(insert(), [dicts]) arma los parametros fila por fila
+    y se lleva casi la mitad del tiempo total.
+    """
+
+    def __init__(self, connection, use_copy: bool = True):
+        self.connection = connection
+        self.use_copy = use_copy and connection.dialect.name == "postgresql"
+        self._inserts: dict[str, tuple] = {}
+
+    def write(self, table, columns: tuple[str, ...], rows: list[tuple]) -> None:
+        if not rows:
+            return
+        if self.use_copy:
+            self._copy(table, columns, rows)
+        else:
+            self._insert(table, columns, rows)
+        self.connection.commit()
+
+    def _compiled(self, table, columns: tuple[str, ...]) -> tuple:
+        if table.name not in self._inserts:
+            dialect = self.connection.dialect
+            compiled = table.insert().compile(dialect=dialect, column_keys=list(columns))
+            processors, memos = [], {}
+            for i, name in enumerate(columns):
+                column_type = table.c[name].type
+                processor = column_type._cached_bind_processor(dialect)
+                if processor is not None:
+                    # un memo por tipo: created_at y updated_at suelen ser el mismo valor
+                    processors.append((i, processor, memos.setdefault(repr(column_type), {})))
+            self._inserts[table.name] = (str(compiled), compiled.positional, processors, memos)
+        return self._inserts[table.name]
+
+    def _insert(self, table, columns: tuple[str, ...], rows: list[tuple]) -> None:
+        sql, positional, processors, memos = self._compiled(table, columns)
+        if processors:
+            processed = []
+            for row in rows:
+                row = list(row)
+                for i, processor, memo in processors:
+                    value = row[i]
+                    converted = memo.get(value)
+                    if converted is None:
+                        converted = memo[value] = processor(value)
+                    row[i] = converted
+                processed.append(tuple(row))
+            rows = processed
+            for memo in memos.values():
+                memo.clear()
+        params = rows if positional else [dict(zip(columns, row)) for row in rows]
+        self.connection.exec_driver_sql(sql, params)
+
+    def _copy(self, table, columns: tuple[str, ...], rows: list[tuple]) -> None:
+        buffer = io.StringIO()
+        # None -> campo vacio sin comillas, que COPY ... CSV lee como NULL
+        csv.writer(buffer).writerows(rows)
+        sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+
+        cursor = self.connection.connection.dbapi_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+
+def _user_rows(ids: range, days: int) -> Iterator[tuple]:
+    when = _timeline(days, len(ids))
+    for n, user_id in enumerate(ids):
+        stamp = when(n)
+        yield (user_id, f"Usuario {user_id}", f"user{user_id}@seed.watchlog.local", stamp, stamp)
+
+
+def _movie_rows(ids: range, days: int, rng: random.Random) -> Iterator[tuple]:
+    when = _timeline(days, len(ids))
+    for n, movie_id in enumerate(ids):
+        stamp = when(n)
+        release_year = None if rng.random() < 0.05 else rng.randint(1920, 2025)
+        yield (movie_id, title(rng), rng.choice(GENRES), release_year, stamp, stamp)
+
+
+def _series_rows(ids: range, days: int, max_seasons: int, rng: random.Random, episodes: dict) -> Iterator[tuple]:
+    """Filas de series; deja en `episodes` los episodios de cada temporada (para seasons y entries)."""
+    when = _timeline(days, len(ids))
+    for n, series_id in enumerate(ids):
+        counts = [rng.randint(6, 24) for _ in range(rng.randint(1, max_seasons))]
+        episodes[series_id] = counts
+        stamp = when(n)
+        yield (series_id, title(rng), len(counts), sum(counts), stamp, stamp)
+
+
+def _season_rows(series_ids: Iterable[int], episodes: dict) -> Iterator[tuple]:
+    for series_id in series_ids:
+        for number, count in enumerate(episodes[series_id], 1):
+            yield (series_id, number, count)
+
+
+def _watchlist_sizes(user_ids: range, entries: int, capacity: int, skew: float, rng: random.Random):
+    """
+    (user_id, tamaño de su watchlist): pesos Zipf entre los usuarios, como
+    mucho `capacity` (todo el catalogo) por usuario. La escala se busca para
+    que, con ese tope, el total de `entries` (lo que no entra en los usuarios
+    topeados se reparte entre el resto); redondeo al azar.
+    """
+    weights = [rank ** -skew for rank in range(1, len(user_ids) + 1)]
+    rng.shuffle(weights)
+    entries = min(entries, capacity * len(weights))
+
+    low, high = 0.0, float(capacity) / min(weights, default=1.0)
+    for _ in range(60):  # biseccion sobre la escala
+        scale = (low + high) / 2
+        if sum(min(w * scale, capacity) for w in weights) < entries:
+            low = scale
+        else:
+            high = scale
+
+    for user_id, weight in zip(user_ids, weights):
+        yield user_id, min(_rounded(rng, min(weight * high, capacity)), capacity)
+
+
+def _watch_entry_rows(
+    sizes: Iterable[tuple[int, int]],
+    movies: Optional[Zipf],
+    series: Optional[Zipf],
+    series_share: float,
+    episodes: dict,
+    days: int,
+    entries: int,
+    rng: random.Random,
+) -> Iterator[tuple]:
+    when = _timeline(days, entries)
+    n_movies_total = len(movies) if movies else 0
+    n_series_total = len(series) if series else 0
+    n = 0
+    for user_id, size in sizes:
+        if not size:
+            continue
+        # ~series_share de series, sin pedir mas de las que hay de cada tipo
+        n_series = _rounded(rng, size * series_share)
+        n_series = max(size - n_movies_total, min(n_series, n_series_total))
+        picks = [("series", i) for i in (series.distinct(rng, n_series) if n_series else [])]
+        picks += [("movie", i) for i in (movies.distinct(rng, size - n_series) if size > n_series else [])]
+
+        statuses = rng.choices(STATUSES, k=len(picks))
+        for (content_type, content_id), status in zip(picks, statuses):
+            stamp = when(n)
+            n += 1
+            if content_type == "series":
+                counts = episodes[content_id]
+                season = rng.randint(1, len(counts))
+                episode = rng.randint(1, counts[season - 1])
+                watched = sum(counts[: season - 1]) + episode - 1
+                yield (user_id, "series", content_id, status, season, episode,
+                       watched, sum(counts), stamp, stamp)
+            else:
+                # como las crea la app (ProgressService.add_movie): '1 de 1'
+                yield (user_id, "movie", content_id, status, NEW_MOVIE_ENTRY["current_season"],
+                       NEW_MOVIE_ENTRY["current_episode"], NEW_MOVIE_ENTRY["watched_episodes"],
+                       NEW_MOVIE_ENTRY["total_episodes"], stamp, stamp)
+
+
+def seed_dataset(
+    users: int = 1_000,
+    movies: int = 10_000,
+    series: int = 1_000,
+    max_seasons: int = 8,
+    entries: int = 100_000,
+    series_share: float = 0.3,
+    skew: float = 1.1,
+    days: int = 365,
+    seed: int = 42,
+    chunk_size: int = 10_000,
+    use_copy: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """
+    Agrega el dataset sintetico a la base de la app actual (tablas ya
+    creadas). `progress(n)` se llama despues de escribir cada lote de n filas.
+    Devuelve {tabla: filas escritas}.
+    """
+    counts = dict.fromkeys(("users", "movies", "series", "seasons", "watch_entries"), 0)
+    episodes: dict[int, list[int]] = {}
+
+    with db.engine.connect() as connection:
+        writer = RowWriter(connection, use_copy)
+
+        def write_chunk(table, columns, chunk: list[tuple]) -> None:
+            writer.write(table, columns, chunk)
+            counts[table.name] += len(chunk)
+            if progress:
+                progress(len(chunk))
+
+        def write(table, columns, rows: Iterable[tuple]) -> None:
+            for chunk in _chunked(rows, chunk_size):
+                write_chunk(table, columns, chunk)
+
+        user_ids = range(_first_id(connection, User), _first_id(connection, User) + users)
+        movie_ids = range(_first_id(connection, Movie), _first_id(connection, Movie) + movies)
+        series_ids = range(_first_id(connection, Series), _first_id(connection, Series) + series)
+
+        write(User.__table__, USER_COLUMNS, _user_rows(user_ids, days))
+        write(Movie.__table__, MOVIE_COLUMNS, _movie_rows(movie_ids, days, _rng(seed, "movies")))
+
+        series_rows = _series_rows(series_ids, days, max_seasons, _rng(seed, "series"), episodes)
+        for chunk in _chunked(series_rows, chunk_size):
+            # cada lote de series antes que sus seasons (FK)
+            write_chunk(Series.__table__, SERIES_COLUMNS, chunk)
+            write(Season.__table__, SEASON_COLUMNS, _season_rows((row[0] for row in chunk), episodes))
+
+        entry_rng = _rng(seed, "watch_entries")
+        movie_picker = Zipf(movie_ids, skew, entry_rng) if movies else None
+        series_picker = Zipf(series_ids, skew, entry_rng) if series else None
+        sizes = _watchlist_sizes(user_ids, entries, movies + series, skew, entry_rng)
+        write(WatchEntry.__table__, WATCH_ENTRY_COLUMNS, _watch_entry_rows(
+            sizes, movie_picker, series_picker, series_share, episodes, days, entries, entry_rng,
+        ))
+
+        if connection.dialect.name == "postgresql":
+            # los ids se pusieron a mano: las secuencias tienen que seguir desde el maximo
+            for table in ("users", "movies", "series"):
+                connection.execute(db.text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT coalesce(max(id), 1) FROM {table}))"
+                ))
+        connection.execute(db.text("ANALYZE"))
+        connection.commit()
+
+    return counts
@@ -0,0 +1,28 @@
+"""Fixtures comunes: app con TestingConfig (SQLite en memoria) y su test client."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("FLASK_ENV", "testing")
+
+# header del usuario demo (lo crea bootstrap_database)
+DEMO_USER = {"X-User-Id": "1"}
+
+
+@pytest.fixture
+def app():
+    from src import create_app
+
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,50 @@
+"""GET /health/ de la app ASGI: SELECT 1 contra la base (requirements-async.txt)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("quart")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from src.aio import create_async_app  # noqa: E402
+from src.aio.database import async_db  # noqa: E402
+
+
+def _get_health(app, broken: bool = False) -> tuple[int, dict]:
+    async def run():
+        async with app.test_app():
+            if broken:
+                await async_db.engine.dispose()
+                async_db.engine = create_async_engine("sqlite+aiosqlite:////nonexistent/watchlog.db")
+            response = await app.test_client().get("/health/")
+            body = await response.get_json()
+            await async_db.engine.dispose()
+            return response.status_code, body
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def aio_app():
+    return create_async_app()
+
+
+def test_health_pings_database(aio_app):
+    status, body = _get_health(aio_app)
+
+    assert status == 200
+    assert body["status"] == "ok"
+    assert body["database"]["default"]["ok"] is True
+
+
+def test_health_fails_when_database_is_down(aio_app):
+    status, body = _get_health(aio_app, broken=True)
+
+    assert status == 503
+    assert body["status"] == "fail"
+    assert body["problems"]
@@ -0,0 +1,73 @@
+"""GETs condicionales de /me/watchlist: ETag y Last-Modified."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from conftest import DEMO_USER
+from src.api.services import progress_service
+
+# dos escrituras dentro del mismo segundo
+FIRST_WRITE = datetime(2026, 1, 1, 12, 0, 0, 100_000)
+SECOND_WRITE = datetime(2026, 1, 1, 12, 0, 0, 600_000)
+
+
+class _Clock(datetime):
+    """datetime.utcnow() fijo para ProgressService."""
+
+    now = FIRST_WRITE
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(progress_service, "datetime", _Clock)
+    _Clock.now = FIRST_WRITE
+    return _Clock
+
+
+@pytest.fixture
+def series_id(client, clock):
+    series = client.post("/series/", json={"title": "Dark", "total_seasons": 1}).get_json()
+    response = client.post(f"/watchlist/series/{series['id']}", headers=DEMO_USER)
+    assert response.status_code == 201
+    return series["id"]
+
+
+def _patch_episode(client, series_id: int, episode: int) -> None:
+    response = client.patch(f"/progress/series/{series_id}", json={"current_episode": episode}, headers=DEMO_USER)
+    assert response.status_code == 200
+
+
+def test_write_in_same_second_is_not_hidden_by_if_modified_since(client, clock, series_id):
+    first = client.get("/me/watchlist", headers=DEMO_USER)
+    assert first.status_code == 200
+    last_modified = first.headers["Last-Modified"]
+
+    clock.now = SECOND_WRITE
+    _patch_episode(client, series_id, 5)
+
+    again = client.get("/me/watchlist", headers={**DEMO_USER, "If-Modified-Since": last_modified})
+    assert again.status_code == 200
+    assert again.get_json()["items"][0]["current_episode"] == 5
+
+
+def test_etag_detects_write_in_same_second(client, clock, series_id):
+    first = client.get("/me/watchlist", headers=DEMO_USER)
+    etag = first.headers["ETag"]
+
+    unchanged = client.get("/me/watchlist", headers={**DEMO_USER, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    clock.now = SECOND_WRITE
+    _patch_episode(client, series_id, 5)
+
+    changed = client.get("/me/watchlist", headers={**DEMO_USER, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.get_json()["items"][0]["current_episode"] == 5
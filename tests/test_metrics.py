@@ -0,0 +1,50 @@
+"""GET /metrics: token opcional y limpieza de los archivos de workers muertos."""
+
+from __future__ import annotations
+
+import os
+import runpy
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import ProductionConfig, TestingConfig
+
+GUNICORN_CONF = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(TestingConfig, "METRICS_TOKEN", "s3cret")
+    return "s3cret"
+
+
+def test_metrics_token_is_required(metrics_token, app, client):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer nope"}).status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+    assert response.status_code == 200
+    assert "watchlog_" in response.get_data(as_text=True)
+
+
+def test_metrics_open_without_token(client):
+    assert client.get("/metrics").status_code == 200
+
+
+def test_child_exit_removes_dead_worker_file(monkeypatch, tmp_path):
+    monkeypatch.setenv("METRICS_DIR", str(tmp_path))
+    hooks = runpy.run_path(str(GUNICORN_CONF))
+    (tmp_path / "111.json").write_text("{}")
+    (tmp_path / "111.json.tmp").write_text("{")
+    (tmp_path / "222.json").write_text("{}")
+
+    hooks["child_exit"](server=None, worker=SimpleNamespace(pid=111))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["222.json"]
+
+
+@pytest.mark.skipif("METRICS_ENABLED" in os.environ, reason="METRICS_ENABLED definida en el entorno")
+def test_metrics_off_by_default_in_production():
+    assert ProductionConfig.METRICS_ENABLED is False
@@ -0,0 +1,51 @@
+"""PATCH /progress/batch: un item mal tipado no tira abajo el lote."""
+
+from __future__ import annotations
+
+from conftest import DEMO_USER
+
+
+def _followed_series(client, title: str) -> int:
+    series = client.post("/series/", json={"title": title, "total_seasons": 1}).get_json()
+    assert client.post(f"/watchlist/series/{series['id']}", headers=DEMO_USER).status_code == 201
+    return series["id"]
+
+
+def test_malformed_item_is_rejected_and_valid_item_is_saved(client):
+    good = _followed_series(client, "Dark")
+    bad = _followed_series(client, "Severance")
+
+    response = client.patch(
+        "/progress/batch",
+        json=[
+            {"series_id": good, "current_episode": 4, "status": "completed"},
+            {"series_id": bad, "current_episode": {"x": 1}},
+        ],
+        headers=DEMO_USER,
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["updated"] == 1
+    assert [result["status"] for result in body["results"]] == [200, 400]
+    assert "current_episode" in body["results"][1]["detail"]
+
+    entries = {
+        item["content_id"]: item
+        for item in client.get("/me/watchlist", headers=DEMO_USER).get_json()["items"]
+    }
+    assert entries[good]["current_episode"] == 4
+    assert entries[good]["status"] == "completed"
+    assert entries[bad]["current_episode"] != {"x": 1}
+
+
+def test_unknown_status_is_rejected(client):
+    series_id = _followed_series(client, "Dark")
+
+    response = client.patch(
+        "/progress/batch",
+        json=[{"series_id": series_id, "status": "binged"}],
+        headers=DEMO_USER,
+    )
+
+    assert response.get_json()["results"][0]["status"] == 400
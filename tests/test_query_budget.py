@@ -0,0 +1,59 @@
+"""@query_budget: con TESTING una ruta que se pasa de sentencias falla el test."""
+
+from __future__ import annotations
+
+import pytest
+
+from conftest import DEMO_USER
+from src.extensions import db
+from src.query_guard import QueryBudgetExceeded, query_budget, query_guard_enabled
+
+
+@pytest.fixture
+def catalog(client):
+    for n in range(10):
+        client.post("/movies/", json={"title": f"Movie {n}", "release_year": 2000 + n})
+        series = client.post("/series/", json={"title": f"Series {n}", "total_seasons": 1}).get_json()
+        client.post(f"/series/{series['id']}/seasons", json={"number": 1, "episodes_count": 8})
+        client.post(f"/watchlist/series/{series['id']}", headers=DEMO_USER)
+    client.post("/watchlist/movies/1", headers=DEMO_USER)
+    return series["id"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/movies/?limit=5",
+        "/series/?limit=5",
+        "/series/{series_id}",
+        "/me/watchlist?limit=5",
+        "/search/?q=movie",
+    ],
+)
+def test_budgeted_routes_stay_within_budget(app, client, catalog, path):
+    assert query_guard_enabled(app)
+
+    response = client.get(path.format(series_id=catalog), headers=DEMO_USER)
+
+    assert response.status_code == 200
+
+
+def test_batch_progress_stays_within_budget(client, catalog):
+    items = [{"series_id": series_id, "current_episode": 2} for series_id in range(1, 11)]
+
+    response = client.patch("/progress/batch", json=items, headers=DEMO_USER)
+
+    assert response.status_code == 200
+    assert response.get_json()["updated"] == 10
+
+
+def test_route_over_budget_fails(app, client):
+    @app.get("/_over_budget")
+    @query_budget(1)
+    def over_budget():
+        db.session.execute(db.text("SELECT 1"))
+        db.session.execute(db.text("SELECT 2"))
+        return {"ok": True}
+
+    with pytest.raises(QueryBudgetExceeded, match="2 sentencias SQL"):
+        client.get("/_over_budget")
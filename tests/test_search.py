@@ -0,0 +1,18 @@
+"""GET /search/: el cap de candidatos se queda con los mejor rankeados."""
+
+from __future__ import annotations
+
+
+def test_candidate_cap_keeps_best_ranked_matches(app, client):
+    app.config["SEARCH_MAX_CANDIDATES"] = 2
+    # la mejor coincidencia es la mas vieja; las nuevas tienen titulos largos
+    client.post("/series/", json={"title": "Dark"})
+    for n in range(5):
+        client.post("/series/", json={"title": f"Dark side of the long story number {n}"})
+
+    response = client.get("/search/?q=dark&type=series")
+
+    assert response.status_code == 200
+    titles = [item["content"]["title"] for item in response.get_json()["items"]]
+    assert titles[0] == "Dark"
+    assert len(titles) == 2
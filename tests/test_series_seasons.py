@@ -0,0 +1,45 @@
+"""POST /series/<id>/seasons: number y episodes_count se chequean antes de escribir."""
+
+from __future__ import annotations
+
+import pytest
+
+from conftest import DEMO_USER
+
+
+@pytest.fixture
+def series_id(client):
+    series = client.post("/series/", json={"title": "Dark", "total_seasons": 0}).get_json()
+    assert client.post(f"/watchlist/series/{series['id']}", headers=DEMO_USER).status_code == 201
+    return series["id"]
+
+
+def _totals(client, series_id: int) -> tuple[int, int]:
+    series = client.get(f"/series/{series_id}").get_json()
+    entry = client.get("/me/watchlist", headers=DEMO_USER).get_json()["items"][0]
+    return series["total_episodes"], entry["total_episodes"]
+
+
+def test_add_season_updates_series_and_followers(client, series_id):
+    response = client.post(f"/series/{series_id}/seasons", json={"number": 1, "episodes_count": 10})
+
+    assert response.status_code == 201
+    assert _totals(client, series_id) == (10, 10)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"number": "1", "episodes_count": 10},
+        {"number": 1, "episodes_count": "10"},
+        {"number": 1, "episodes_count": -3},
+        {"number": -1},
+        {"episodes_count": 10},
+    ],
+)
+def test_invalid_season_is_rejected_without_writing(client, series_id, body):
+    response = client.post(f"/series/{series_id}/seasons", json=body)
+
+    assert response.status_code == 400
+    assert "detail" in response.get_json()
+    assert _totals(client, series_id) == (0, 0)